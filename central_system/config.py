@@ -33,7 +33,8 @@ class Config:
             "use_tls": False,
             "username": "",
             "password": "",
-            "client_id": "central_system"
+            "client_id": "central_system",
+            "publish_legacy_messages": False  # Also send plain text to professor/messages
         },
         "ui": {
             "fullscreen": True,
@@ -191,6 +192,8 @@ class Config:
             config['mqtt']['username'] = os.environ['MQTT_USERNAME']
         if 'MQTT_PASSWORD' in os.environ:
             config['mqtt']['password'] = os.environ['MQTT_PASSWORD']
+        if 'MQTT_PUBLISH_LEGACY' in os.environ:
+            config['mqtt']['publish_legacy_messages'] = os.environ['MQTT_PUBLISH_LEGACY'].lower() in ('true', 'yes', '1')
 
         # UI configuration
         if 'CONSULTEASE_FULLSCREEN' in os.environ:
@@ -1,26 +1,56 @@
 import logging
 import datetime
-from ..models import Consultation, ConsultationStatus, get_db, Faculty
-from ..utils.mqtt_utils import publish_consultation_request, publish_mqtt_message
+import functools
+import threading
+from ..config import get_config
+from ..models import Consultation, ConsultationStatus, get_db, with_session, warm_connection_pool, Faculty, Student
+from ..utils.mqtt_utils import build_consultation_request_messages, encode_payload, publish_mqtt_batch
 from ..utils.mqtt_topics import MQTTTopics
-from ..utils.cache_manager import invalidate_consultation_cache, invalidate_faculty_cache
+from ..utils.cache_manager import invalidate_consultation_cache_bulk
 from ..services.consultation_queue_service import get_consultation_queue_service, MessagePriority
+from sqlalchemy import lambda_stmt, select, update
 from sqlalchemy.orm import joinedload
 from ..services.async_mqtt_service import get_async_mqtt_service
+from ..services.publish_buffer import PublishBuffer
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Eager-load only the student/faculty columns that consultation views and payloads use
+_RELATED_LOAD_OPTIONS = (
+    joinedload(Consultation.student).load_only(Student.id, Student.name, Student.department),
+    joinedload(Consultation.faculty).load_only(Faculty.id, Faculty.name, Faculty.department),
+)
+
+# Timestamp column stamped when a consultation moves into each status.
+# CANCELLED has no column; cancel_consultation handles that transition.
+_STATUS_TIMESTAMP_ATTR = {
+    ConsultationStatus.ACCEPTED: 'accepted_at',
+    ConsultationStatus.BUSY: 'busy_at',
+    ConsultationStatus.COMPLETED: 'completed_at',
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _publish_legacy_messages():
+    """Whether plain text copies also go to the legacy professor/messages topic (read once)."""
+    return bool(get_config().get('mqtt.publish_legacy_messages', False))
+
 class ConsultationController:
     """
     Controller for managing consultation requests.
     """
 
+    # Background publisher shared by all instances, created on first use
+    _publish_buffer = None
+    _publish_buffer_lock = threading.Lock()
+
     def __init__(self):
         """
         Initialize the consultation controller.
         """
-        self.callbacks = []
+        # Immutable snapshot, replaced on registration so notification never copies or locks
+        self._callbacks_tuple = ()
         self.queue_service = get_consultation_queue_service()
 
     def start(self):
@@ -31,12 +61,29 @@ class ConsultationController:
         # Start the consultation queue service
         self.queue_service.start()
         # Async MQTT service is managed globally, no need to connect here
+        # Move connection setup and first-query compilation off the first consultation request
+        warm_connection_pool()
+        self._warm_query_cache()
+
+    @staticmethod
+    @with_session
+    def _warm_query_cache():
+        """
+        Compile the consultation list query once so SQLAlchemy caches it before first use.
+        """
+        try:
+            get_db().query(Consultation).options(*_RELATED_LOAD_OPTIONS).limit(0).all()
+        except Exception as e:
+            logger.warning(f"Consultation query warm-up failed: {str(e)}")
 
     def stop(self):
         """
         Stop the consultation controller.
         """
         logger.info("Stopping Consultation controller")
+        # Publish anything still waiting in the buffer before shutdown
+        if ConsultationController._publish_buffer is not None:
+            ConsultationController._publish_buffer.stop()
 
     def register_callback(self, callback):
         """
@@ -45,7 +92,7 @@ class ConsultationController:
         Args:
             callback (callable): Function that takes a Consultation object as argument
         """
-        self.callbacks.append(callback)
+        self._callbacks_tuple = self._callbacks_tuple + (callback,)
         logger.info(f"Registered Consultation controller callback: {callback.__name__}")
 
     def _notify_callbacks(self, consultation):
@@ -55,12 +102,13 @@ class ConsultationController:
         Args:
             consultation (Consultation): Updated consultation object
         """
-        for callback in self.callbacks:
+        for callback in self._callbacks_tuple:
             try:
                 callback(consultation)
             except Exception as e:
                 logger.error(f"Error in Consultation controller callback: {str(e)}")
 
+    @with_session
     def create_consultation(self, student_id, faculty_id, request_message, course_code=None):
         """
         Create a new consultation request.
@@ -93,23 +141,13 @@ class ConsultationController:
 
             logger.info(f"Created consultation request: {consultation.id} (Student: {student_id}, Faculty: {faculty_id})")
 
-            # Publish consultation using the optimized method with offline queuing
-            publish_success = self._publish_consultation(consultation)
-
-            if publish_success:
-                logger.info(f"Successfully published consultation request {consultation.id} to faculty desk unit")
-            else:
-                # Try to queue the consultation for offline faculty
-                queue_success = self.queue_service.queue_consultation_request(consultation, MessagePriority.NORMAL)
-                if queue_success:
-                    logger.info(f"Queued consultation request {consultation.id} for offline faculty {faculty_id}")
-                else:
-                    logger.error(f"Failed to publish or queue consultation request {consultation.id}")
+            # Hand publishing to the background buffer so the caller only waits for the commit
+            if not self._get_publish_buffer().enqueue(consultation.id):
+                self._publish_buffered([consultation.id])
 
             # Invalidate consultation cache for both student and faculty
             try:
-                invalidate_consultation_cache(student_id)
-                invalidate_consultation_cache(faculty_id)
+                invalidate_consultation_cache_bulk((student_id, faculty_id))
             except Exception as e:
                 logger.warning(f"Failed to invalidate consultation cache: {str(e)}")
 
@@ -122,89 +160,167 @@ class ConsultationController:
             logger.error(f"Error creating consultation: {str(e)}")
             db.rollback()
             return None
-        finally:
-            # ✅ FIXED: Ensure database session is always closed
-            db.close()
 
-    def _publish_consultation(self, consultation):
+    @classmethod
+    def _get_publish_buffer(cls):
+        """
+        Get the publish buffer shared by all controller instances.
+
+        Returns:
+            PublishBuffer: Buffer whose worker publishes consultations by ID
+        """
+        with cls._publish_buffer_lock:
+            if cls._publish_buffer is None:
+                cls._publish_buffer = PublishBuffer(
+                    cls._publish_buffered,
+                    max_count=16,
+                    flush_idle_ms=25,
+                    name="consultation-publisher"
+                )
+            return cls._publish_buffer
+
+    @staticmethod
+    @with_session
+    def _publish_buffered(consultation_ids):
         """
-        Publish consultation to MQTT using async service.
+        Publish buffered consultations, queuing any that could not be delivered.
+        All consultations are loaded with one query and published in one batch.
 
         Args:
-            consultation (Consultation): Consultation object to publish
+            consultation_ids (list): IDs of committed consultations to publish
         """
-        try:
-            # Get a new database session and fetch the consultation with all related objects
-            db = get_db(force_new=True)
+        db = get_db()
+        queue_service = get_consultation_queue_service()
 
-            # Instead of refreshing, query for the consultation by ID to ensure it's attached to this session
-            consultation_id = consultation.id
-            consultation = db.query(Consultation).filter(Consultation.id == consultation_id).first()
+        consultations = db.query(Consultation).options(*_RELATED_LOAD_OPTIONS).filter(
+            Consultation.id.in_(consultation_ids)
+        ).all()
 
-            if not consultation:
-                logger.error(f"Consultation with ID {consultation_id} not found in database")
-                return False
+        missing_ids = set(consultation_ids) - {consultation.id for consultation in consultations}
+        for consultation_id in missing_ids:
+            logger.error(f"Consultation with ID {consultation_id} not found in database")
 
-            # Explicitly load the related objects to avoid lazy loading issues
-            student = consultation.student
-            faculty = consultation.faculty
+        # Build every consultation's messages, remembering where each one's slice starts
+        # and how many messages it has (the legacy message is only present when enabled)
+        batch = []
+        slices = []
+        for consultation in consultations:
+            try:
+                messages, request_count = ConsultationController._build_consultation_messages(consultation)
+            except Exception as e:
+                logger.error(f"Error preparing consultation {consultation.id} for publishing: {str(e)}")
+                messages, request_count = None, 0
+            if messages is None:
+                slices.append((consultation, None, 0, 0))
+                continue
+            slices.append((consultation, len(batch), len(messages), request_count))
+            batch.extend(messages)
+
+        results = publish_mqtt_batch(batch) if batch else []
+
+        for consultation, offset, message_count, request_count in slices:
+            publish_success = offset is not None and ConsultationController._publish_succeeded(
+                consultation.id, results[offset:offset + message_count], request_count
+            )
 
-            if not student:
-                logger.error(f"Student not found for consultation {consultation_id}")
-                return False
+            if publish_success:
+                logger.info(f"Successfully published consultation request {consultation.id} to faculty desk unit")
+            else:
+                # Try to queue the consultation for offline faculty
+                queue_success = queue_service.queue_consultation_request(consultation, MessagePriority.NORMAL)
+                if queue_success:
+                    logger.info(f"Queued consultation request {consultation.id} for offline faculty {consultation.faculty_id}")
+                else:
+                    logger.error(f"Failed to publish or queue consultation request {consultation.id}")
 
-            if not faculty:
-                logger.error(f"Faculty not found for consultation {consultation_id}")
-                return False
+    @staticmethod
+    def _build_consultation_messages(consultation, student=None, faculty=None):
+        """
+        Build the MQTT messages for a consultation request.
 
-            # Prepare consultation data for async publishing
-            consultation_data = {
-                'id': consultation.id,
-                'student_id': student.id,
-                'student_name': student.name,
-                'student_department': student.department,
-                'faculty_id': faculty.id,
-                'faculty_name': faculty.name,
-                'request_message': consultation.request_message,
-                'course_code': consultation.course_code,
-                'status': consultation.status.value,
-                'requested_at': consultation.requested_at.isoformat() if consultation.requested_at else None
-            }
+        Args:
+            consultation (Consultation): Consultation object to publish
+            student (Student, optional): Already-loaded student; defaults to consultation.student
+            faculty (Faculty, optional): Already-loaded faculty; defaults to consultation.faculty
 
-            logger.info(f"Publishing consultation request {consultation.id} for faculty {faculty.id} using async MQTT")
+        Returns:
+            tuple: (messages, request_count) where the legacy topic message, if enabled, follows
+                   the request_count request-topic messages, or (None, 0) if data is missing
+        """
+        consultation_id = consultation.id
 
-            # Use the async MQTT utility function
-            success = publish_consultation_request(consultation_data)
+        # Use the objects the caller already loaded instead of re-querying in a new session
+        if student is None:
+            student = consultation.student
+        if faculty is None:
+            faculty = consultation.faculty
 
-            # Also publish to legacy topic for backward compatibility
+        if not student:
+            logger.error(f"Student not found for consultation {consultation_id}")
+            return None, 0
+
+        if not faculty:
+            logger.error(f"Faculty not found for consultation {consultation_id}")
+            return None, 0
+
+        # Prepare consultation data for async publishing
+        consultation_data = {
+            'id': consultation.id,
+            'student_id': student.id,
+            'student_name': student.name,
+            'student_department': student.department,
+            'faculty_id': faculty.id,
+            'faculty_name': faculty.name,
+            'request_message': consultation.request_message,
+            'course_code': consultation.course_code,
+            'status': consultation.status.value,
+            'requested_at': consultation.requested_at.isoformat() if consultation.requested_at else None
+        }
+
+        logger.info(f"Publishing consultation request {consultation.id} for faculty {faculty.id} using async MQTT")
+
+        messages = build_consultation_request_messages(consultation_data)
+        request_count = len(messages)
+
+        # Also publish to legacy topic for backward compatibility, if still enabled
+        if _publish_legacy_messages():
             message = f"Student: {student.name}\n"
             if consultation.course_code:
                 message += f"Course: {consultation.course_code}\n"
             message += f"Request: {consultation.request_message}"
+            # QoS 1 is enough for the legacy broadcast; broker acks are confirmed in the background
+            messages.append((MQTTTopics.LEGACY_FACULTY_MESSAGES, message, 1))
+        return messages, request_count
 
-            legacy_topic = MQTTTopics.LEGACY_FACULTY_MESSAGES
-            legacy_success = publish_mqtt_message(legacy_topic, message, qos=2)
+    @staticmethod
+    def _publish_succeeded(consultation_id, results, request_count):
+        """
+        Decide whether a consultation was delivered from its slice of batch results.
 
-            # Close the database session
-            db.close()
+        Args:
+            consultation_id (int): Consultation ID, for logging
+            results (list): Success flags for the request topics, followed by the legacy topic if enabled
+            request_count (int): Number of request-topic messages in ``results``
 
-            overall_success = success or legacy_success
-            if overall_success:
-                logger.info(f"Successfully published consultation request {consultation.id} using async MQTT")
-            else:
-                logger.error(f"Failed to publish consultation request {consultation.id} using async MQTT")
+        Returns:
+            bool: True if all request topics or the legacy topic were published
+        """
+        success = request_count > 0 and all(results[:request_count])
+        legacy_success = len(results) > request_count and results[request_count]
 
-            return overall_success
-        except Exception as e:
-            logger.error(f"Error publishing consultation: {str(e)}")
-            return False
+        overall_success = success or legacy_success
+        if overall_success:
+            logger.info(f"Successfully published consultation request {consultation_id} using async MQTT")
+        else:
+            logger.error(f"Failed to publish consultation request {consultation_id} using async MQTT")
+        return overall_success
 
     def _publish_consultation_update(self, faculty_id, consultation_id, action, student_name=None, message_details=None):
         """
         Publish a consultation update (e.g., cancellation) to the faculty desk unit.
         """
         try:
-            topic = MQTTTopics.FACULTY_REQUESTS_TOPIC_TEMPLATE.format(faculty_id=faculty_id)
+            topic = MQTTTopics.get_faculty_requests_topic(faculty_id)
             payload = {
                 "action": action,
                 "consultation_id": str(consultation_id) # Ensure ID is string for ESP32 JSON parsing
@@ -218,18 +334,43 @@ class ConsultationController:
             logger.info(f"Publishing consultation update to {topic}: {payload}")
             
             # Directly use the utility that handles async publishing and potential queuing
-            # publish_mqtt_message is more generic, let's use a more specific one if available
-            # or ensure publish_mqtt_message can handle a dict payload correctly (it should json.dumps it)
             mqtt_service = get_async_mqtt_service()
-            
-            import json
-            mqtt_service.publish(topic, json.dumps(payload), qos=1) # Use QoS 1 for cancellations
+            # Use QoS 1 for cancellations; queue directly so a lone update is not held in the batch queue
+            mqtt_service.publish_async(topic, encode_payload(payload), qos=1, batch=False)
             logger.info(f"Successfully published {action} for consultation {consultation_id} to faculty {faculty_id}")
             return True
         except Exception as e:
             logger.error(f"Error publishing consultation update for {consultation_id}: {e}")
             return False
 
+    @staticmethod
+    def _update_returning(db, values, *criteria):
+        """
+        Update a consultation with UPDATE ... RETURNING and commit.
+
+        The returned object is detached before the commit so it keeps the
+        RETURNING values instead of being expired and re-selected on access.
+
+        Args:
+            db: Database session
+            values (dict): Column values to set
+            *criteria: WHERE clauses selecting the row
+
+        Returns:
+            Consultation: Updated consultation, or None if no row matched
+        """
+        stmt = update(Consultation).where(*criteria).values(**values).returning(Consultation)
+        consultation = db.execute(stmt).scalars().first()
+
+        if consultation is None:
+            db.rollback()
+            return None
+
+        db.expunge(consultation)
+        db.commit()
+        return consultation
+
+    @with_session
     def update_consultation_status(self, consultation_id, status):
         """
         Update consultation status.
@@ -243,39 +384,28 @@ class ConsultationController:
         """
         db = get_db()
         try:
-            consultation = db.query(Consultation).filter(Consultation.id == consultation_id).first()
+            # Update status and timestamp in a single UPDATE ... RETURNING round-trip
+            values = {'status': status}
+            timestamp_attr = _STATUS_TIMESTAMP_ATTR.get(status)
+            if timestamp_attr:
+                values[timestamp_attr] = datetime.datetime.now()
+
+            consultation = self._update_returning(
+                db, values, Consultation.id == consultation_id
+            )
 
             if not consultation:
                 logger.error(f"Consultation not found: {consultation_id}")
                 return None
 
-            # Store old status for logging
-            old_status = consultation.status
-
-            # Update status and timestamp
-            consultation.status = status
-
-            if status == ConsultationStatus.ACCEPTED:
-                consultation.accepted_at = datetime.datetime.now()
-            elif status == ConsultationStatus.BUSY:
-                consultation.busy_at = datetime.datetime.now()
-            elif status == ConsultationStatus.COMPLETED:
-                consultation.completed_at = datetime.datetime.now()
-            elif status == ConsultationStatus.CANCELLED:
-                # No specific timestamp for cancellation, but we could add one if needed
-                pass # Timestamping will be handled in cancel_consultation
-
-            db.commit()
-
-            logger.info(f"✅ Updated consultation status: {consultation.id} ({old_status.value} -> {status.value})")
+            logger.info(f"✅ Updated consultation status: {consultation.id} (-> {status.value})")
 
             # ✅ FIXED: Don't republish consultation as this confuses the faculty desk unit
             # The faculty already responded, no need to send it back to them
             
             # ✅ ENHANCED: Invalidate cache for both student and faculty
             try:
-                invalidate_consultation_cache(consultation.student_id)
-                invalidate_consultation_cache(consultation.faculty_id)
+                invalidate_consultation_cache_bulk((consultation.student_id, consultation.faculty_id))
                 logger.debug(f"Invalidated consultation cache for student {consultation.student_id} and faculty {consultation.faculty_id}")
             except Exception as e:
                 logger.warning(f"Failed to invalidate consultation cache: {str(e)}")
@@ -289,58 +419,61 @@ class ConsultationController:
             logger.error(f"Error updating consultation status: {str(e)}")
             db.rollback()
             return None
-        finally:
-            # ✅ CRITICAL FIX: Always close the database session
-            db.close()
 
+    @with_session
     def cancel_consultation(self, consultation_id: int):
         """
         Cancel a consultation request.
-        Updates status to CANCELLED, sets timestamp, and notifies faculty unit via MQTT.
+        Updates status to CANCELLED and notifies faculty unit via MQTT.
         """
         db = get_db()
         try:
             logger.info(f"Attempting to cancel consultation ID: {consultation_id}")
-            consultation = db.query(Consultation).options(joinedload(Consultation.faculty)).filter(Consultation.id == consultation_id).first()
+
+            # The WHERE clause only matches cancellable rows, so a double-cancel updates nothing
+            consultation = self._update_returning(
+                db,
+                {'status': ConsultationStatus.CANCELLED},
+                Consultation.id == consultation_id,
+                Consultation.status.in_([ConsultationStatus.PENDING, ConsultationStatus.ACCEPTED])
+            )
 
             if not consultation:
-                logger.error(f"Consultation not found for cancellation: {consultation_id}")
-                return None
+                # Nothing was updated; look up the current state only to report why
+                current = db.query(Consultation).filter(Consultation.id == consultation_id).first()
 
-            if consultation.status == ConsultationStatus.CANCELLED:
-                logger.warning(f"Consultation {consultation_id} is already cancelled.")
-                # Optionally return the consultation object if needed by caller
-                return consultation
-            
-            if consultation.status not in [ConsultationStatus.PENDING, ConsultationStatus.ACCEPTED]:
-                logger.warning(f"Consultation {consultation_id} cannot be cancelled. Status: {consultation.status.value}")
+                if not current:
+                    logger.error(f"Consultation not found for cancellation: {consultation_id}")
+                    return None
+
+                if current.status == ConsultationStatus.CANCELLED:
+                    logger.warning(f"Consultation {consultation_id} is already cancelled.")
+                    # Optionally return the consultation object if needed by caller
+                    return current
+
+                logger.warning(f"Consultation {consultation_id} cannot be cancelled. Status: {current.status.value}")
                 # Depending on requirements, this might raise an error or return a specific status
                 return None # Or raise an exception like ValueError("Consultation cannot be cancelled")
 
-            consultation.status = ConsultationStatus.CANCELLED
-            consultation.cancelled_at = datetime.datetime.now() # Add a timestamp for cancellation
-            consultation.updated_at = datetime.datetime.now()
-
-            db.commit()
             logger.info(f"Consultation {consultation_id} status updated to CANCELLED in DB.")
 
             # Publish cancellation to faculty desk unit
-            if consultation.faculty:
+            if consultation.faculty_id:
                 self._publish_consultation_update(
-                    faculty_id=consultation.faculty.id,
+                    faculty_id=consultation.faculty_id,
                     consultation_id=consultation.id,
                     action="CANCEL_CONSULTATION"
                 )
             else:
                 logger.warning(f"Faculty information not available for consultation {consultation_id}. Cannot send MQTT cancellation.")
 
-
             # Invalidate caches
             try:
-                invalidate_consultation_cache(consultation.student_id)
-                if consultation.faculty_id:
-                    invalidate_consultation_cache(consultation.faculty_id) # Faculty might also have a cache view
-                    invalidate_faculty_cache(consultation.faculty_id)
+                # Faculty might also have a cache view
+                invalidate_consultation_cache_bulk(
+                    (consultation.student_id, consultation.faculty_id),
+                    include_faculty=bool(consultation.faculty_id)
+                )
                 logger.debug(f"Invalidated caches for consultation {consultation_id}")
             except Exception as e:
                 logger.warning(f"Failed to invalidate cache during cancellation: {str(e)}")
@@ -354,9 +487,8 @@ class ConsultationController:
             logger.error(f"Error cancelling consultation {consultation_id}: {str(e)}")
             db.rollback()
             return None
-        finally:
-            db.close()
 
+    @with_session
     def get_consultations(self, student_id=None, faculty_id=None, status=None):
         """
         Get consultations from the database with various filters.
@@ -364,24 +496,24 @@ class ConsultationController:
         """
         db = get_db()
         try:
-            query = db.query(Consultation).options(
-                joinedload(Consultation.student),
-                joinedload(Consultation.faculty)
-            )
+            # Lambda statements are cached by code location, so each filter combination is
+            # built and compiled once; later calls only bind the new parameter values
+            stmt = lambda_stmt(lambda: select(Consultation).options(*_RELATED_LOAD_OPTIONS))
 
             if student_id:
-                query = query.filter(Consultation.student_id == student_id)
+                stmt += lambda s: s.where(Consultation.student_id == student_id)
             if faculty_id:
-                query = query.filter(Consultation.faculty_id == faculty_id)
+                stmt += lambda s: s.where(Consultation.faculty_id == faculty_id)
             if status:
                 if isinstance(status, list):
-                    query = query.filter(Consultation.status.in_(status))
+                    stmt += lambda s: s.where(Consultation.status.in_(status))
                 else:
-                    query = query.filter(Consultation.status == status)
-            
+                    stmt += lambda s: s.where(Consultation.status == status)
+
             # Order by most recent first
-            consultations = query.order_by(Consultation.requested_at.desc()).all()
-            
+            stmt += lambda s: s.order_by(Consultation.requested_at.desc())
+            consultations = db.execute(stmt).scalars().all()
+
             # Log consultation details if any found
             if consultations:
                 logger.debug(f"Retrieved {len(consultations)} consultations with filters (student: {student_id}, faculty: {faculty_id}, status: {status})")
@@ -394,19 +526,17 @@ class ConsultationController:
         except Exception as e:
             logger.error(f"Error getting consultations: {str(e)}")
             return []
-        finally:
-            db.close()
 
+    @with_session
     def get_consultation_by_id(self, consultation_id: int):
         """
         Get a single consultation by ID with related student and faculty data.
         """
         db = get_db()
         try:
-            consultation = db.query(Consultation).options(
-                joinedload(Consultation.student),
-                joinedload(Consultation.faculty)
-            ).filter(Consultation.id == consultation_id).first()
+            consultation = db.execute(lambda_stmt(
+                lambda: select(Consultation).options(*_RELATED_LOAD_OPTIONS).where(Consultation.id == consultation_id)
+            )).scalars().first()
             
             if consultation:
                 logger.debug(f"Retrieved consultation ID {consultation_id}: Status {consultation.status.value}")
@@ -417,9 +547,8 @@ class ConsultationController:
         except Exception as e:
             logger.error(f"Error getting consultation by ID {consultation_id}: {str(e)}")
             return None
-        finally:
-            db.close()
 
+    @with_session
     def test_faculty_desk_connection(self, faculty_id: int):
         """
         Test the connection to a faculty desk unit by sending a test message.
@@ -439,11 +568,20 @@ class ConsultationController:
                 logger.error(f"Faculty not found: {faculty_id}")
                 return False
 
+            # Only skip when the faculty is known to be offline; presence is not tracked until
+            # the first update after startup, and an unknown status is worth testing
+            if self.queue_service.is_faculty_known_offline(faculty_id):
+                logger.warning(f"Skipped test message to faculty desk unit {faculty_id} ({faculty.name}): "
+                               f"faculty is reported offline")
+                return False
+
             # Create a test message
-            message = f"Test message from ConsultEase central system.\nTimestamp: {datetime.datetime.now().isoformat()}"
+            timestamp = datetime.datetime.now().isoformat()
+            message = f"Test message from ConsultEase central system.\nTimestamp: {timestamp}"
 
-            # Publish to faculty-specific topic using standardized format
+            # Publish to faculty-specific topics using standardized format
             faculty_requests_topic = MQTTTopics.get_faculty_requests_topic(faculty_id)
+            faculty_messages_topic = MQTTTopics.get_faculty_messages_topic(faculty_id)
             payload = {
                 'id': 0,
                 'student_id': 0,
@@ -454,24 +592,24 @@ class ConsultationController:
                 'request_message': message,
                 'course_code': "TEST",
                 'status': "test",
-                'requested_at': datetime.datetime.now().isoformat(),
-                'message': message
+                'requested_at': timestamp
             }
 
-            # Publish using async MQTT service
-            success_json = publish_mqtt_message(faculty_requests_topic, payload)
-
-            # Publish to legacy plain text topic for backward compatibility
-            success_text = publish_mqtt_message(MQTTTopics.LEGACY_FACULTY_MESSAGES, message, qos=2)
-
-            # Publish to faculty-specific plain text topic
-            faculty_messages_topic = MQTTTopics.get_faculty_messages_topic(faculty_id)
-            success_faculty = publish_mqtt_message(faculty_messages_topic, message, qos=2)
+            # JSON and faculty plain text topics (plus the legacy topic if enabled) in one batch
+            messages = [
+                (faculty_requests_topic, payload, 1),
+                (faculty_messages_topic, message, 0),
+            ]
+            if _publish_legacy_messages():
+                messages.append((MQTTTopics.LEGACY_FACULTY_MESSAGES, message, 0))
+            results = publish_mqtt_batch(messages)
+            success_json, success_faculty = results[0], results[1]
+            success_text = results[2] if len(results) > 2 else None
 
             logger.info(f"Test message sent to faculty desk unit {faculty_id} ({faculty.name}) using async MQTT")
             logger.info(f"JSON topic success: {success_json}, Text topic success: {success_text}, Faculty topic success: {success_faculty}")
 
-            return success_json or success_text or success_faculty
+            return any(results)
         except Exception as e:
             logger.error(f"Error testing faculty desk connection: {str(e)}")
             return False
\ No newline at end of file
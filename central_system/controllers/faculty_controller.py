@@ -705,6 +705,102 @@ class FacultyController:
         except Exception as e:
             logger.error(f"Error publishing faculty status notification: {str(e)}")
 
+    def bulk_upsert_faculty(self, faculty_rows):
+        """
+        Create or update several faculty members in a single transaction.
+
+        Existing faculty are matched by email and only have their status updated;
+        new faculty are validated and inserted with their initial status. New rows
+        that fail validation, or whose email or BLE ID is already taken by another
+        faculty member or an earlier row, are skipped. Status changes are published
+        over MQTT after the commit, as update_faculty_status does.
+
+        Args:
+            faculty_rows (list): Dicts with name, department, email, ble_id and status
+
+        Returns:
+            tuple: (created count, updated count, list of error messages)
+        """
+        errors = []
+        if not faculty_rows:
+            return 0, 0, errors
+
+        db = get_db()
+        try:
+            emails = [row.get('email') for row in faculty_rows if row.get('email')]
+            ble_ids = [row.get('ble_id') for row in faculty_rows if row.get('ble_id')]
+
+            # One lookup for every email and BLE ID that is already taken
+            existing = db.query(Faculty.id, Faculty.name, Faculty.email, Faculty.ble_id, Faculty.status).filter(
+                or_(Faculty.email.in_(emails), Faculty.ble_id.in_(ble_ids))
+            ).all()
+            faculty_by_email = {faculty.email: faculty for faculty in existing}
+            taken_emails = set(faculty_by_email)
+            taken_ble_ids = {faculty.ble_id for faculty in existing}
+
+            now = datetime.datetime.now()
+            new_rows = []
+            updated_count = 0
+            status_updates = []
+            status_changes = []
+            for row in faculty_rows:
+                status = bool(row.get('status', False))
+                faculty = faculty_by_email.get(row.get('email'))
+                if faculty is not None:
+                    updated_count += 1
+                    if faculty.status != status:
+                        status_updates.append({'id': faculty.id, 'status': status, 'last_seen': now})
+                        status_changes.append(({'id': faculty.id, 'name': faculty.name,
+                                                'last_seen': now.isoformat()}, status, faculty.status))
+                    continue
+
+                validation_errors = self._validate_faculty_inputs(
+                    row.get('name'), row.get('department'), row.get('email'), row.get('ble_id')
+                )
+                if validation_errors:
+                    errors.append(f"{row.get('name')}: {', '.join(validation_errors)}")
+                elif row['email'] in taken_emails:
+                    errors.append(f"{row['name']}: email {row['email']} is repeated in the batch")
+                elif row['ble_id'] in taken_ble_ids:
+                    errors.append(f"{row['name']}: BLE ID {row['ble_id']} already exists")
+                else:
+                    # Reserve the email and BLE ID so later rows in the batch can't reuse them
+                    taken_emails.add(row['email'])
+                    taken_ble_ids.add(row['ble_id'])
+                    new_rows.append({
+                        'name': row['name'],
+                        'department': row['department'],
+                        'email': row['email'],
+                        'ble_id': row['ble_id'],
+                        'image_path': row.get('image_path'),
+                        'status': status,
+                        'always_available': False
+                    })
+
+            if new_rows:
+                db.bulk_insert_mappings(Faculty, new_rows)
+                # New faculty start unavailable, so only those created available report a change
+                available_emails = [row['email'] for row in new_rows if row['status']]
+                if available_emails:
+                    for faculty_id, name in db.query(Faculty.id, Faculty.name).filter(
+                            Faculty.email.in_(available_emails)):
+                        status_changes.append(({'id': faculty_id, 'name': name,
+                                                'last_seen': now.isoformat()}, True, False))
+            if status_updates:
+                db.bulk_update_mappings(Faculty, status_updates)
+            db.commit()
+        except Exception as e:
+            db.rollback()
+            logger.error(f"Error bulk upserting faculty: {str(e)}")
+            return 0, 0, errors + [str(e)]
+
+        if new_rows or status_updates:
+            self._invalidate_faculty_caches()
+        for faculty_data, status, previous_status in status_changes:
+            self._publish_status_update_with_sequence_safe(faculty_data, status, previous_status)
+        logger.info(f"Bulk upserted faculty: {len(new_rows)} created, {updated_count} updated")
+        return len(new_rows), updated_count, errors
+
     def handle_faculty_heartbeat(self, topic: str, data):
         """
         Handle faculty heartbeat messages for enhanced monitoring.
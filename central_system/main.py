@@ -4,8 +4,10 @@ import logging
 from PyQt5.QtWidgets import QApplication
 from PyQt5.QtCore import Qt, QTimer
 
-# Add parent directory to path to help with imports
-sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(__file__))))
+# Add parent directory to path to help with imports when run as a script
+_project_root = os.path.abspath(os.path.dirname(os.path.dirname(__file__)))
+if _project_root not in sys.path:
+    sys.path.insert(0, _project_root)
 
 # Configure logging
 logging.basicConfig(
@@ -32,6 +34,7 @@ from central_system.controllers import (
 from central_system.services.async_mqtt_service import get_async_mqtt_service
 
 # Import views
+from central_system.views.base_window import BaseWindow
 from central_system.views.login_window import LoginWindow
 from central_system.views.dashboard_window import DashboardWindow
 from central_system.views.admin_login_window import AdminLoginWindow
@@ -68,8 +71,11 @@ class ConsultEaseApp:
 
         # Apply centralized theme stylesheet
         try:
-            # Apply base stylesheet from theme system
-            self.app.setStyleSheet(ConsultEaseTheme.get_base_stylesheet())
+            # Shared theme colors; the stylesheets below only add what differs
+            self.app.setPalette(ConsultEaseTheme.get_palette())
+            # Apply base stylesheet from theme system, followed by the touch-friendly
+            # window styles so Qt parses them once for every window
+            self.app.setStyleSheet(ConsultEaseTheme.get_base_stylesheet() + BaseWindow.TOUCH_STYLE)
             logger.info("Applied centralized theme stylesheet")
         except Exception as e:
             logger.error(f"Failed to apply theme stylesheet: {e}")
@@ -77,6 +83,7 @@ class ConsultEaseApp:
             try:
                 theme = self._get_theme_preference()
                 apply_stylesheet(self.app, theme)
+                self.app.setStyleSheet(self.app.styleSheet() + BaseWindow.TOUCH_STYLE)
                 logger.info(f"Applied fallback {theme} theme stylesheet")
             except Exception as e2:
                 logger.error(f"Failed to apply fallback stylesheet: {e2}")
@@ -189,9 +196,23 @@ class ConsultEaseApp:
         # Show login window
         self.show_login_window()
 
+        # Build the faculty cards while the login screen is idle, not during the first dashboard paint
+        QTimer.singleShot(0, self._prewarm_faculty_cards)
+
         # Store fullscreen preference for use in window creation
         self.fullscreen = fullscreen
 
+    def _prewarm_faculty_cards(self):
+        """
+        Fill the faculty card pool with one card per faculty member.
+        """
+        try:
+            from .ui.pooled_faculty_card import get_faculty_card_manager
+            faculty_count = len(self.faculty_controller.get_all_faculty())
+            get_faculty_card_manager().prewarm(faculty_count)
+        except Exception as e:
+            logger.warning(f"Could not prewarm faculty cards: {e}")
+
     def _register_system_services(self):
         """Register services with the system coordinator."""
         logger.info("Registering system services with coordinator")
@@ -556,7 +577,7 @@ class ConsultEaseApp:
         if self.login_window is None:
             self.login_window = LoginWindow()
             self.login_window.student_authenticated.connect(self.handle_student_authenticated)
-            self.login_window.change_window.connect(self.handle_window_change)
+            self.login_window.connect_change_window(self.handle_window_change)
 
         # Determine which window is currently visible
         current_window = None
@@ -585,8 +606,8 @@ class ConsultEaseApp:
         else:
             # No transition needed, just show the window
             logger.info("Showing login window without transition")
+            self.login_window.set_fullscreen(True)
             self.login_window.show()
-            self.login_window.showFullScreen()  # Force fullscreen again to ensure it takes effect
 
     def show_dashboard_window(self, student_data=None):
         """
@@ -605,7 +626,7 @@ class ConsultEaseApp:
             logger.info("DashboardWindow instance created successfully")
             
             # Connect signals
-            self.dashboard_window.change_window.connect(self.handle_window_change)
+            self.dashboard_window.connect_change_window(self.handle_window_change)
             self.dashboard_window.consultation_requested.connect(self.handle_consultation_request)
             self.dashboard_window.logout_requested.connect(self._handle_user_logout)
         else:
@@ -686,8 +707,8 @@ class ConsultEaseApp:
         else:
             # No transition needed, just show the window
             logger.info("Showing dashboard window without transition")
+            self.dashboard_window.set_fullscreen(True)
             self.dashboard_window.show()
-            self.dashboard_window.showFullScreen()  # Force fullscreen to ensure it takes effect
 
         # Log that we've shown the dashboard
         student_name = student_data.get('name', 'Unknown') if student_data else 'Unknown'
@@ -700,7 +721,7 @@ class ConsultEaseApp:
         if self.admin_login_window is None:
             self.admin_login_window = AdminLoginWindow()
             self.admin_login_window.admin_authenticated.connect(self.handle_admin_authenticated)
-            self.admin_login_window.change_window.connect(self.handle_window_change)
+            self.admin_login_window.connect_change_window(self.handle_window_change)
             # Set the admin controller for first-time setup detection
             self.admin_login_window.set_admin_controller(self.admin_controller)
 
@@ -738,8 +759,8 @@ class ConsultEaseApp:
         else:
             # No transition needed, just show the window
             logger.info("Showing admin login window without transition")
+            self.admin_login_window.set_fullscreen(True)
             self.admin_login_window.show()
-            self.admin_login_window.showFullScreen()  # Force fullscreen
             # Call the callback directly
             after_transition()
 
@@ -749,7 +770,7 @@ class ConsultEaseApp:
         """
         if self.admin_dashboard_window is None:
             self.admin_dashboard_window = AdminDashboardWindow(admin)
-            self.admin_dashboard_window.change_window.connect(self.handle_window_change)
+            self.admin_dashboard_window.connect_change_window(self.handle_window_change)
             self.admin_dashboard_window.faculty_updated.connect(self.handle_faculty_updated)
             self.admin_dashboard_window.student_updated.connect(self.handle_student_updated)
 
@@ -780,8 +801,8 @@ class ConsultEaseApp:
         else:
             # No transition needed, just show the window
             logger.info("Showing admin dashboard window without transition")
+            self.admin_dashboard_window.set_fullscreen(True)
             self.admin_dashboard_window.show()
-            self.admin_dashboard_window.showFullScreen()  # Force fullscreen
 
     def handle_rfid_scan(self, student, rfid_uid):
         """
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker, scoped_session
 from sqlalchemy.pool import QueuePool
@@ -8,6 +8,7 @@ import getpass
 import logging
 import time
 import functools
+import threading
 
 # Set up logging (configuration handled centrally in main.py)
 logger = logging.getLogger(__name__)
@@ -122,7 +123,7 @@ def get_db(force_new=False, max_retries=3):
 
             # Enhanced connection test with health check
             try:
-                result = db.execute("SELECT 1 as health_check")
+                result = db.execute(text("SELECT 1 as health_check"))
                 health_check = result.fetchone()
                 if not health_check or health_check[0] != 1:
                     raise DatabaseConnectionError("Health check failed")
@@ -184,6 +185,40 @@ def close_db():
     except Exception as e:
         logger.error(f"Error releasing database connection: {str(e)}")
 
+# Nesting depth of with_session-decorated calls on the current thread
+_session_scope = threading.local()
+
+def with_session(func):
+    """
+    Decorator that scopes a function to the thread-local session.
+
+    Inside the function, get_db() returns the same scoped session, so the body
+    does not need to close it. The session is rolled back if the function raises
+    and is only removed (returning its connection to the pool) when the outermost
+    decorated call on this thread returns, so nested controller calls share it.
+
+    Args:
+        func: Function that obtains its session via get_db()
+
+    Returns:
+        Decorated function
+    """
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        depth = getattr(_session_scope, 'depth', 0)
+        _session_scope.depth = depth + 1
+        try:
+            return func(*args, **kwargs)
+        except Exception:
+            SessionLocal().rollback()
+            raise
+        finally:
+            _session_scope.depth = depth
+            if depth == 0:
+                close_db()
+
+    return wrapper
+
 def get_connection_pool_status():
     """
     Get current connection pool status for monitoring.
@@ -210,6 +245,38 @@ def get_connection_pool_status():
             'error': str(e)
         }
 
+def warm_connection_pool(connections=None):
+    """
+    Open pooled connections ahead of time so the first request does not pay for connecting.
+
+    The connections are checked out together (so the pool has to create each one),
+    pinged, and then all returned to the pool.
+
+    Args:
+        connections (int, optional): Number of connections to open; defaults to the pool size
+
+    Returns:
+        int: Number of connections that were opened
+    """
+    if connections is None:
+        # StaticPool (SQLite) only ever holds a single connection
+        connections = pool_size if DB_TYPE.lower() != 'sqlite' else 1
+
+    opened = []
+    try:
+        for _ in range(connections):
+            conn = engine.connect()
+            opened.append(conn)
+            conn.execute(text("SELECT 1"))
+        logger.info(f"Warmed database connection pool with {len(opened)} connection(s)")
+    except Exception as e:
+        logger.warning(f"Database connection pool warm-up stopped after {len(opened)} connection(s): {e}")
+    finally:
+        for conn in opened:
+            conn.close()
+
+    return len(opened)
+
 def monitor_connection_pool():
     """
     Monitor connection pool health and log warnings if issues detected.
@@ -348,6 +415,10 @@ def _create_performance_indexes():
             "CREATE INDEX IF NOT EXISTS idx_consultation_faculty_status ON consultations(faculty_id, status);",
             "CREATE INDEX IF NOT EXISTS idx_consultation_requested_at ON consultations(requested_at);",
 
+            # Filter + ordered scan indexes for consultation history (also declared on the model)
+            "CREATE INDEX IF NOT EXISTS ix_consult_fac_status_req ON consultations(faculty_id, status, requested_at DESC);",
+            "CREATE INDEX IF NOT EXISTS ix_consult_stu_status_req ON consultations(student_id, status, requested_at DESC);",
+
             # New indexes for enhanced consultation features
             "CREATE INDEX IF NOT EXISTS idx_consultation_busy_at ON consultations(busy_at);",
         ]
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum
+from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, Enum, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -36,6 +36,12 @@ class Consultation(Base):
     student = relationship("Student", backref="consultations")
     faculty = relationship("Faculty", backref="consultations")
 
+    # Covering indexes for the filter + ORDER BY requested_at DESC pattern in get_consultations
+    __table_args__ = (
+        Index('ix_consult_fac_status_req', 'faculty_id', 'status', requested_at.desc()),
+        Index('ix_consult_stu_status_req', 'student_id', 'status', requested_at.desc()),
+    )
+
     def __repr__(self):
         return f"<Consultation {self.id}>"
     
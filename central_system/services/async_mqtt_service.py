@@ -11,7 +11,7 @@ import time
 import uuid  # Added import for uuid
 from concurrent.futures import ThreadPoolExecutor
 from queue import Queue, Empty
-from typing import Dict, Callable, Optional, Any
+from typing import Dict, Callable, Iterable, Optional, Any
 import paho.mqtt.client as mqtt
 
 logger = logging.getLogger(__name__)
@@ -23,6 +23,11 @@ class AsyncMQTTService:
     Uses a background thread pool and message queuing for optimal performance on Raspberry Pi.
     """
 
+    # Untracked acks are pruned once there are more than this many, dropping those older
+    # than the TTL; a late track_publish arrives within milliseconds of its ack
+    _UNTRACKED_ACK_LIMIT = 256
+    _UNTRACKED_ACK_TTL = 5.0
+
     def __init__(self, broker_host='localhost', broker_port=1883, username=None, password=None, max_queue_size=1000):
         """
         Initialize the asynchronous MQTT service.
@@ -75,6 +80,14 @@ class AsyncMQTTService:
         self.batched_messages = 0
 
         self.pending_subscriptions: Dict[int, str] = {} # Added to track pending subscriptions
+        self.pending_publishes: Dict[int, str] = {}  # mid -> topic for QoS > 0 publishes awaiting broker ack
+        # Acks whose mid was not tracked (yet): QoS 0 publishes, or a PUBACK that reached the
+        # network thread before the publisher called track_publish. mid -> time received
+        self._untracked_acks: Dict[int, float] = {}
+        # Guards pending_publishes and _untracked_acks, which the publisher, network and
+        # disconnect paths all touch. Never held around client.publish(): Paho calls
+        # on_publish while holding its own message lock, which publish() also takes.
+        self._pending_lock = threading.Lock()
 
         # Initialize client
         self._initialize_client()
@@ -149,6 +162,16 @@ class AsyncMQTTService:
     def _on_disconnect(self, client, userdata, rc):
         """Handle MQTT disconnection."""
         self.is_connected = False
+
+        # Anything still awaiting a broker ack will not be confirmed on this connection
+        with self._pending_lock:
+            unconfirmed = self.pending_publishes
+            self.pending_publishes = {}
+            self._untracked_acks.clear()
+        if unconfirmed:
+            self.publish_errors += len(unconfirmed)
+            logger.warning(f"{len(unconfirmed)} MQTT publish(es) were not confirmed before disconnect: "
+                           f"{sorted(set(unconfirmed.values()))}")
         try:
             self.client.loop_stop(force=True) # Force stop the network loop
             logger.info("MQTT client network loop stopped.")
@@ -205,7 +228,38 @@ class AsyncMQTTService:
 
     def _on_publish(self, client, userdata, mid):
         """Handle successful message publication."""
-        logger.debug(f"Message published successfully (mid: {mid})")
+        with self._pending_lock:
+            topic = self.pending_publishes.pop(mid, None)
+            if topic is None:
+                # Remember the ack briefly in case track_publish for this mid is still to come
+                now = time.monotonic()
+                self._untracked_acks[mid] = now
+                if len(self._untracked_acks) > self._UNTRACKED_ACK_LIMIT:
+                    self._untracked_acks = {
+                        acked_mid: acked_at for acked_mid, acked_at in self._untracked_acks.items()
+                        if now - acked_at < self._UNTRACKED_ACK_TTL
+                    }
+        if topic:
+            logger.debug(f"Message confirmed by broker (mid: {mid}, topic: {topic})")
+        else:
+            logger.debug(f"Message published successfully (mid: {mid})")
+
+    def track_publish(self, mid: int, topic: str):
+        """
+        Record a QoS > 0 publish so its broker confirmation is handled by _on_publish.
+        Callers can return as soon as the message is handed to the client instead of
+        waiting for the ack; unconfirmed messages are logged on disconnect.
+
+        Args:
+            mid: Message ID returned by the Paho client
+            topic: Topic the message was published to
+        """
+        with self._pending_lock:
+            # The broker may already have confirmed it before we got here
+            if self._untracked_acks.pop(mid, None) is not None:
+                logger.debug(f"Message confirmed by broker (mid: {mid}, topic: {topic})")
+                return
+            self.pending_publishes[mid] = topic
 
     def _find_message_handler(self, topic: str) -> Optional[Callable]:
         """Find the appropriate message handler for a topic."""
@@ -365,7 +419,7 @@ class AsyncMQTTService:
 
         Args:
             topic: MQTT topic
-            data: Data to publish (will be JSON encoded if not string)
+            data: Data to publish (will be JSON encoded if not string or bytes)
             qos: Quality of service level
             retain: Whether to retain the message
             batch: Whether to use message batching for performance
@@ -481,10 +535,10 @@ class AsyncMQTTService:
 
                 # Prepare payload
                 try:
-                    if isinstance(message['data'], str):
+                    if isinstance(message['data'], (str, bytes, bytearray)):
                         payload = message['data']
                     else:
-                        payload = json.dumps(message['data'])
+                        payload = json.dumps(message['data'], separators=(',', ':'))
                 except Exception as e:
                     logger.error(f"Error serializing payload: {e}")
                     self.publish_errors += 1
@@ -590,6 +644,37 @@ class AsyncMQTTService:
 
         logger.debug(f"Registered handler for topic: {topic}")
 
+    def register_topic_handlers(self, topics: Iterable[str], handler: Callable, qos: int = 0):
+        """
+        Register the same handler for several topics and subscribe to them in one request.
+
+        Args:
+            topics: MQTT topics (support wildcards + and #)
+            handler: Callable that takes (topic, data) as arguments
+            qos: QoS level requested for every topic
+        """
+        topics = list(topics)
+        if not topics:
+            return
+
+        for topic in topics:
+            self.message_handlers[topic] = handler
+
+        # Subscribe to all topics with a single SUBSCRIBE packet if connected
+        if self.is_connected and self.client:
+            joined = ", ".join(topics)
+            try:
+                result, mid = self.client.subscribe([(topic, qos) for topic in topics])
+                if result == mqtt.MQTT_ERR_SUCCESS:
+                    self.pending_subscriptions[mid] = joined
+                    logger.info(f"Subscription request sent for topics: {joined}, mid: {mid}")
+                else:
+                    logger.error(f"Failed to send subscription request for topics {joined} during registration. Paho error code: {result}")
+            except Exception as e:
+                logger.error(f"Error subscribing to topics {joined}: {e}")
+
+        logger.debug(f"Registered handler for {len(topics)} topic(s)")
+
     def unregister_topic_handler(self, topic: str):
         """Unregister a topic handler."""
         if topic in self.message_handlers:
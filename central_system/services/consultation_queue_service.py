@@ -231,6 +231,19 @@ class ConsultationQueueService:
         with self.lock:
             return self.faculty_online_status.get(faculty_id, False)
 
+    def is_faculty_known_offline(self, faculty_id: int) -> bool:
+        """
+        Check if faculty has been reported offline, as opposed to not reported at all.
+
+        Args:
+            faculty_id: Faculty ID
+
+        Returns:
+            bool: True only if an offline status has been recorded for the faculty
+        """
+        with self.lock:
+            return self.faculty_online_status.get(faculty_id) is False
+
     def _process_faculty_queue(self, faculty_id: int):
         """
         Process all pending requests for a specific faculty.
@@ -0,0 +1,178 @@
+"""
+Buffered publisher for ConsultEase system.
+Collects items on an in-process queue and hands them to a publish function in batches,
+so callers on the UI path only pay for an enqueue instead of a broker round-trip.
+"""
+
+import logging
+import threading
+import time
+from queue import Queue, Empty, Full
+from typing import Any, Callable, List
+
+logger = logging.getLogger(__name__)
+
+# Sentinel used to wake the worker on shutdown
+_STOP = object()
+
+
+class PublishBuffer:
+    """
+    Bounded producer queue drained by a background worker.
+
+    The worker waits for the first item, then keeps collecting until either
+    ``max_count`` items are buffered or no new item arrives for ``flush_idle_ms``,
+    and passes the whole batch to ``publish_func`` in one call.
+    """
+
+    def __init__(self, publish_func: Callable[[List[Any]], None], max_count: int = 16,
+                 flush_idle_ms: int = 25, max_queue_size: int = 1000, name: str = "publish-buffer"):
+        """
+        Initialize the publish buffer.
+
+        Args:
+            publish_func: Callable that takes a list of buffered items
+            max_count: Maximum number of items handed to publish_func at once
+            flush_idle_ms: Idle time after which a partial batch is flushed
+            max_queue_size: Maximum number of items waiting in the buffer
+            name: Name of the worker thread
+        """
+        self.publish_func = publish_func
+        self.max_count = max_count
+        self.flush_idle = flush_idle_ms / 1000.0
+        self.name = name
+
+        self._queue = Queue(maxsize=max_queue_size)
+        self._lock = threading.Lock()
+        self._thread = None
+        self.running = False
+
+        # Statistics
+        self.items_published = 0
+        self.batches_published = 0
+        self.publish_errors = 0
+
+    def start(self):
+        """Start the background worker if it is not already running."""
+        with self._lock:
+            if self.running:
+                return
+            self.running = True
+            self._thread = threading.Thread(target=self._worker, name=self.name, daemon=True)
+            self._thread.start()
+        logger.info(f"Publish buffer '{self.name}' started")
+
+    def stop(self, timeout: float = 5.0):
+        """
+        Stop the background worker and publish anything still buffered.
+
+        Args:
+            timeout: Seconds to wait for the worker thread to exit
+        """
+        with self._lock:
+            if not self.running:
+                return
+            self.running = False
+            thread = self._thread
+            self._thread = None
+
+        try:
+            self._queue.put_nowait(_STOP)
+        except Full:
+            pass
+        if thread and thread.is_alive():
+            thread.join(timeout=timeout)
+            if thread.is_alive():
+                logger.warning(f"Publish buffer '{self.name}' worker did not exit in time")
+
+        self.flush()
+        logger.info(f"Publish buffer '{self.name}' stopped")
+
+    def enqueue(self, item: Any) -> bool:
+        """
+        Add an item to the buffer, starting the worker on first use.
+
+        Args:
+            item: Item to hand to publish_func
+
+        Returns:
+            bool: True if the item was buffered, False if the buffer is full
+        """
+        if not self.running:
+            self.start()
+
+        try:
+            self._queue.put_nowait(item)
+            return True
+        except Full:
+            logger.warning(f"Publish buffer '{self.name}' is full, item not buffered")
+            return False
+
+    def flush(self):
+        """Synchronously publish every item currently in the buffer."""
+        batch = []
+        while True:
+            try:
+                item = self._queue.get_nowait()
+            except Empty:
+                break
+            if item is _STOP:
+                continue
+            batch.append(item)
+            if len(batch) >= self.max_count:
+                self._publish(batch)
+                batch = []
+        if batch:
+            self._publish(batch)
+
+    def get_stats(self) -> dict:
+        """Get buffer statistics."""
+        return {
+            'running': self.running,
+            'queue_size': self._queue.qsize(),
+            'items_published': self.items_published,
+            'batches_published': self.batches_published,
+            'publish_errors': self.publish_errors
+        }
+
+    def _collect_batch(self) -> List[Any]:
+        """Block for the first item, then gather more until the count or idle threshold is hit."""
+        try:
+            first = self._queue.get(timeout=1)
+        except Empty:
+            return []
+        if first is _STOP:
+            return []
+
+        batch = [first]
+        deadline = time.monotonic() + self.flush_idle
+        while len(batch) < self.max_count:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=remaining)
+            except Empty:
+                break
+            if item is _STOP:
+                break
+            batch.append(item)
+            deadline = time.monotonic() + self.flush_idle
+        return batch
+
+    def _publish(self, batch: List[Any]):
+        """Hand a batch to the publish function, keeping the worker alive on errors."""
+        try:
+            self.publish_func(batch)
+            self.items_published += len(batch)
+            self.batches_published += 1
+        except Exception as e:
+            self.publish_errors += 1
+            logger.error(f"Error publishing batch of {len(batch)} item(s) from '{self.name}': {e}")
+
+    def _worker(self):
+        """Background worker that drains the buffer in batches."""
+        while self.running:
+            batch = self._collect_batch()
+            if batch:
+                self._publish(batch)
@@ -4,18 +4,55 @@ Optimized for reuse and performance on Raspberry Pi.
 """
 
 import logging
+from collections import namedtuple
 from typing import Optional, Callable
 from PyQt5.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
     QFrame, QSizePolicy
 )
-from PyQt5.QtCore import Qt, pyqtSignal
-from PyQt5.QtGui import QFont, QPalette
+from PyQt5.QtCore import Qt, QTimer, pyqtSignal
+from PyQt5.QtGui import QColor, QFont, QPainter, QPalette, QPixmap
 
 from .component_pool import get_component_pool
 
 logger = logging.getLogger(__name__)
 
+# Everything a card derives from a faculty status, computed once per status
+StatusView = namedtuple('StatusView', ['state', 'available', 'button_text', 'button_enabled'])
+
+_STATUS_TABLE = {
+    'available': StatusView('available', True, "Request Consultation", True),
+    'busy': StatusView('busy', False, "Not Available", False),
+    'offline': StatusView('offline', False, "Not Available", False),
+    'unavailable': StatusView('unavailable', False, "Not Available", False),
+    'in_consultation': StatusView('in_consultation', False, "Not Available", False),
+}
+_OFFLINE_VIEW = _STATUS_TABLE['offline']
+_BOOL_STATUS = {True: 'available', False: 'offline'}
+
+# Single-lookup index for the common inputs: booleans and already-lowercase strings
+_STATUS_LOOKUP = dict(_STATUS_TABLE)
+_STATUS_LOOKUP.update({flag: _STATUS_TABLE[status] for flag, status in _BOOL_STATUS.items()})
+
+
+def _normalize_status(raw) -> StatusView:
+    """
+    Map a boolean or string faculty status to its StatusView.
+
+    Args:
+        raw: Status as received (bool, string or anything else)
+
+    Returns:
+        StatusView: Shared view for the status; unknown values map to offline
+    """
+    if isinstance(raw, (bool, str)):
+        view = _STATUS_LOOKUP.get(raw)
+        if view is not None:
+            return view
+        if isinstance(raw, str):
+            return _STATUS_TABLE.get(raw.lower(), _OFFLINE_VIEW)
+    return _OFFLINE_VIEW
+
 
 class PooledFacultyCard(QWidget):
     """
@@ -25,6 +62,25 @@ class PooledFacultyCard(QWidget):
     # Signals
     consultation_requested = pyqtSignal(int)  # faculty_id
 
+    # Status dot colors; each dot is drawn once into a pixmap shared by all cards,
+    # so the indicator is a plain blit and never goes through the stylesheet engine
+    _DOT_SIZE = 16
+    _DOT_COLORS = {
+        'unknown': '#cccccc',
+        'available': '#27ae60',        # Success green from theme
+        'busy': '#f39c12',             # Warning orange from theme
+        'offline': '#95a5a6',          # Secondary gray from theme
+        'unavailable': '#95a5a6',      # Secondary gray from theme
+        'in_consultation': '#e74c3c',  # Error red from theme
+    }
+    _DOT_PIXMAPS = {}  # state -> QPixmap, filled on first use
+
+    # Fonts shared by every card (QFont is implicitly shared). Created with the first card,
+    # since the class body is evaluated before the QApplication exists.
+    _FONT_NAME = None
+    _FONT_DEPT = None
+    _FONT_BTN = None
+
     def __init__(self, parent=None):
         """
         Initialize the pooled faculty card.
@@ -39,6 +95,10 @@ class PooledFacultyCard(QWidget):
         self.faculty_data = None
         self.consultation_callback = None
 
+        # Last applied status views; the shared _STATUS_TABLE entries allow identity checks
+        self._last_status_view = None
+        self._last_button_view = None
+
         # Setup UI
         self._setup_ui()
 
@@ -47,12 +107,23 @@ class PooledFacultyCard(QWidget):
 
         logger.debug("Created new PooledFacultyCard")
 
+    @classmethod
+    def _init_fonts(cls):
+        """Create the shared card fonts on first use."""
+        if cls._FONT_NAME is None:
+            cls._FONT_NAME = QFont("Segoe UI", 12, QFont.Bold)
+            cls._FONT_DEPT = QFont("Segoe UI", 10)
+            cls._FONT_BTN = QFont("Segoe UI", 10, QFont.Bold)
+
     def _setup_ui(self):
         """Setup the user interface."""
+        self._init_fonts()
+
         # Main layout
         self.setFixedSize(280, 140)  # Increased height for better touch interface
-        # Remove inline styling to allow theme styling to take effect
-        self.setObjectName("faculty_card_unavailable")  # Default state
+        # Theme styling targets the "available" property, so availability changes only re-polish
+        self.setObjectName("faculty_card")
+        self.setProperty("available", False)
 
         # Main layout
         main_layout = QVBoxLayout(self)
@@ -65,21 +136,22 @@ class PooledFacultyCard(QWidget):
 
         # Faculty name label
         self.name_label = QLabel()
-        self.name_label.setFont(QFont("Segoe UI", 12, QFont.Bold))
+        self.name_label.setFont(PooledFacultyCard._FONT_NAME)
         self.name_label.setWordWrap(True)
         header_layout.addWidget(self.name_label, 1)
 
         # Status indicator
-        self.status_widget = QWidget()
-        self.status_widget.setFixedSize(16, 16)
-        self.status_widget.setStyleSheet("background-color: #cccccc; border-radius: 8px;")
+        self.status_widget = QLabel()
+        self.status_widget.setFixedSize(self._DOT_SIZE, self._DOT_SIZE)
+        self._dot_state = None
+        self._set_status_dot('unknown')
         header_layout.addWidget(self.status_widget, 0, Qt.AlignTop)
 
         main_layout.addLayout(header_layout)
 
         # Department label
         self.department_label = QLabel()
-        self.department_label.setFont(QFont("Segoe UI", 10))
+        self.department_label.setFont(PooledFacultyCard._FONT_DEPT)
         main_layout.addWidget(self.department_label)
 
         # Spacer
@@ -87,7 +159,7 @@ class PooledFacultyCard(QWidget):
 
         # Consult button
         self.consult_button = QPushButton("Request Consultation")
-        self.consult_button.setFont(QFont("Segoe UI", 10, QFont.Bold))
+        self.consult_button.setFont(PooledFacultyCard._FONT_BTN)
         self.consult_button.setFixedHeight(36)
         # Use theme-based button styling instead of inline styles
         self.consult_button.setObjectName("consultButton")
@@ -101,11 +173,15 @@ class PooledFacultyCard(QWidget):
         """
         Configure the card with faculty data.
 
+        The card keeps a reference to ``faculty_data`` rather than a copy and replaces
+        it with a new dict when its status changes, so callers must not mutate the
+        dict after handing it over.
+
         Args:
             faculty_data: Dictionary containing faculty information
             consultation_callback: Callback function for consultation requests
         """
-        self.faculty_data = faculty_data.copy()  # Store a copy
+        self.faculty_data = faculty_data
         self.faculty_id = faculty_data.get('id')
         self.consultation_callback = consultation_callback
         self.is_active = True
@@ -116,7 +192,8 @@ class PooledFacultyCard(QWidget):
         # Ensure the card is visible when configured
         self.show()
 
-        logger.debug(f"Configured faculty card for: {faculty_data.get('name', 'Unknown')}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Configured faculty card for: %s", faculty_data.get('name', 'Unknown'))
 
     def _update_display(self):
         """Update the display with current faculty data."""
@@ -131,69 +208,94 @@ class PooledFacultyCard(QWidget):
         department = self.faculty_data.get('department', 'Unknown Department')
         self.department_label.setText(department)
 
-        # Update status - handle both boolean and string status values
-        raw_status = self.faculty_data.get('status', 'offline')
-        
-        # Convert boolean status to string
-        if isinstance(raw_status, bool):
-            status = 'available' if raw_status else 'offline'
-        elif isinstance(raw_status, str):
-            status = raw_status
-        else:
-            # Fallback for any other type
-            status = 'offline'
-        
-        self._update_status_indicator(status)
-        
-        # Update card styling based on availability using theme object names
-        if status.lower() == 'available':
-            self.setObjectName("faculty_card_available")
-        else:
-            self.setObjectName("faculty_card_unavailable")
-        
-        # Force style refresh
-        self.setStyleSheet(self.styleSheet())
-
-        # Update button state - check for availability
-        # Handle both 'available' field and converted status
-        is_available = False
+        view = _normalize_status(self.faculty_data.get('status', 'offline'))
+        # An explicit 'available' flag decides the button, even if the status string disagrees
         if 'available' in self.faculty_data:
-            is_available = bool(self.faculty_data.get('available', False))
+            button_view = _STATUS_LOOKUP[bool(self.faculty_data['available'])]
         else:
-            # Fallback to status-based availability
-            is_available = status.lower() == 'available'
-        
-        self.consult_button.setEnabled(is_available)
+            button_view = view
+        self._apply_status_view(view, button_view)
 
-        if not is_available:
-            self.consult_button.setText("Not Available")
-        else:
-            self.consult_button.setText("Request Consultation")
+    def _apply_status_view(self, view: StatusView, button_view: StatusView):
+        """
+        Apply a precomputed status view to the status dot, card styling and button.
+
+        Args:
+            view: View for the faculty status
+            button_view: View that decides the consult button state
+        """
+        # Heartbeats republish the same status; nothing to restyle in that case
+        if view is self._last_status_view and button_view is self._last_button_view:
+            return
+        self._last_status_view = view
+        self._last_button_view = button_view
 
-    def _update_status_indicator(self, status: str):
+        self._set_status_dot(view.state)
+        self._set_available_style(view.available)
+        self.consult_button.setEnabled(button_view.button_enabled)
+        self.consult_button.setText(button_view.button_text)
+
+    @classmethod
+    def _dot_pixmap(cls, state: str) -> QPixmap:
         """
-        Update the status indicator color.
+        Get the shared status dot pixmap for a state, drawing it on first use.
 
         Args:
-            status: Faculty status (string or boolean)
+            state: Status dot state (a key of _DOT_COLORS)
+
+        Returns:
+            QPixmap: Antialiased filled circle in the state's color
         """
-        # Ensure status is a string and handle edge cases
-        if not isinstance(status, str):
-            if isinstance(status, bool):
-                status = 'available' if status else 'offline'
-            else:
-                status = str(status).lower() if status else 'offline'
-        
-        status_colors = {
-            'available': '#27ae60',      # Success green from theme
-            'busy': '#f39c12',           # Warning orange from theme  
-            'offline': '#95a5a6',        # Secondary gray from theme
-            'unavailable': '#95a5a6',    # Secondary gray from theme
-            'in_consultation': '#e74c3c' # Error red from theme
-        }
+        pixmap = cls._DOT_PIXMAPS.get(state)
+        if pixmap is None:
+            pixmap = QPixmap(cls._DOT_SIZE, cls._DOT_SIZE)
+            pixmap.fill(Qt.transparent)
+            painter = QPainter(pixmap)
+            painter.setRenderHint(QPainter.Antialiasing)
+            painter.setPen(Qt.NoPen)
+            painter.setBrush(QColor(cls._DOT_COLORS[state]))
+            painter.drawEllipse(0, 0, cls._DOT_SIZE, cls._DOT_SIZE)
+            painter.end()
+            cls._DOT_PIXMAPS[state] = pixmap
+        return pixmap
+
+    def _set_status_dot(self, state: str):
+        """
+        Show the status dot for a state.
 
-        color = status_colors.get(status.lower(), '#95a5a6')
-        self.status_widget.setStyleSheet(f"background-color: {color}; border-radius: 8px;")
+        Args:
+            state: Status dot state (a key of _DOT_COLORS)
+        """
+        if state == self._dot_state:
+            return
+        self._dot_state = state
+        self.status_widget.setPixmap(self._dot_pixmap(state))
+
+    def _set_available_style(self, is_available: bool):
+        """
+        Switch the card between the theme's available and unavailable styling.
+
+        Args:
+            is_available: Whether the faculty is available
+        """
+        self._repolish(self, "available", is_available)
+
+    @staticmethod
+    def _repolish(widget: QWidget, name: str, value):
+        """
+        Set a dynamic property and re-polish only that widget so its QSS selectors re-apply.
+
+        Args:
+            widget: Widget whose property changed
+            name: Property name used in the stylesheet selectors
+            value: New property value
+        """
+        if widget.property(name) == value:
+            return
+        widget.setProperty(name, value)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def _on_consult_clicked(self):
         """Handle consultation button click."""
@@ -213,11 +315,9 @@ class PooledFacultyCard(QWidget):
                 else:
                     # Fallback: pass faculty_id if faculty_data is not available
                     logger.warning(f"Faculty data not available for ID {self.faculty_id}, passing ID only")
-                self.consultation_callback(self.faculty_id)
+                    self.consultation_callback(self.faculty_id)
             except Exception as e:
-                logger.error(f"Error in consultation callback: {e}")
-                import traceback
-                logger.error(f"Traceback: {traceback.format_exc()}")
+                logger.exception(f"Error in consultation callback: {e}")
 
     def reset(self):
         """Reset the card to default state for pooling."""
@@ -232,20 +332,16 @@ class PooledFacultyCard(QWidget):
         self.consult_button.setText("Request Consultation")
         self.consult_button.setEnabled(True)
 
-        # Reset status indicator
-        self.status_widget.setStyleSheet("background-color: #cccccc; border-radius: 8px;")
+        # Reset status indicator and card styling to the default theme state
+        self._last_status_view = None
+        self._last_button_view = None
+        self._set_status_dot('unknown')
+        self._set_available_style(False)
 
-        # Reset to default object name for theme styling
-        self.setObjectName("faculty_card_unavailable")
-        
-        # Force style refresh
-        self.setStyleSheet(self.styleSheet())
-
-        # Disconnect signals
-        try:
+        # Disconnect signals; slots are connected from outside the card (e.g. the
+        # dashboard), so ask Qt whether any exist instead of catching the TypeError
+        if self.receivers(self.consultation_requested) > 0:
             self.consultation_requested.disconnect()
-        except TypeError:
-            pass  # No connections to disconnect
 
         # Hide the widget
         self.hide()
@@ -260,41 +356,14 @@ class PooledFacultyCard(QWidget):
             new_status: New status (string or boolean)
         """
         if self.faculty_data:
-            # Handle both boolean and string status
-            if isinstance(new_status, bool):
-                status_str = 'available' if new_status else 'offline'
-                self.faculty_data['status'] = status_str
-                self.faculty_data['available'] = new_status  # Also update available field
-            elif isinstance(new_status, str):
-                status_str = new_status
-                self.faculty_data['status'] = status_str
-                # Update available field based on status string
-                self.faculty_data['available'] = status_str.lower() == 'available'
-            else:
-                # Fallback
-                status_str = 'offline'
-                self.faculty_data['status'] = status_str
-                self.faculty_data['available'] = False
-            
-            self._update_status_indicator(status_str)
-            
-            # Update card styling based on availability using theme object names
-            if status_str.lower() == 'available':
-                self.setObjectName("faculty_card_available")
-            else:
-                self.setObjectName("faculty_card_unavailable")
-            
-            # Force style refresh
-            self.setStyleSheet(self.styleSheet())
-
-            # Update button state
-            is_available = self.faculty_data.get('available', False)
-            self.consult_button.setEnabled(is_available)
-
-            if not is_available:
-                self.consult_button.setText("Not Available")
-            else:
-                self.consult_button.setText("Request Consultation")
+            view = _normalize_status(new_status)
+            # Copy on write: the dict passed to configure() is shared with the caller
+            self.faculty_data = {
+                **self.faculty_data,
+                'status': new_status if isinstance(new_status, str) else view.state,
+                'available': view.available
+            }
+            self._apply_status_view(view, view)
 
 
 class FacultyCardManager:
@@ -302,10 +371,21 @@ class FacultyCardManager:
     Manager for pooled faculty cards.
     """
 
+    # Window in which status updates are collected before being applied to the cards
+    STATUS_FLUSH_INTERVAL_MS = 30
+
     def __init__(self):
         """Initialize the faculty card manager."""
         self.component_pool = get_component_pool()
-        self.active_cards = {}  # faculty_id -> (card, component_id)
+        # Parallel maps so lookups return the card directly, without a tuple to unpack
+        self.active_cards = {}  # faculty_id -> card
+        self._component_ids = {}  # faculty_id -> component_id
+
+        # Pending status updates, newest value per faculty wins
+        self._pending_status = {}  # faculty_id -> status
+        self._flush_timer = QTimer()
+        self._flush_timer.setSingleShot(True)
+        self._flush_timer.timeout.connect(self._flush_status_updates)
 
         logger.info("Faculty card manager initialized")
 
@@ -323,8 +403,13 @@ class FacultyCardManager:
         faculty_id = faculty_data.get('id')
 
         # Check if we already have an active card for this faculty
-        if faculty_id in self.active_cards:
-            card, component_id = self.active_cards[faculty_id]
+        card = self.active_cards.get(faculty_id)
+        if card is not None:
+            # Republished but unchanged data: skip the redisplay and style re-polish
+            if (card.faculty_data == faculty_data
+                    and card.consultation_callback == consultation_callback
+                    and not card.isHidden()):
+                return card
             # Update the existing card
             card.configure(faculty_data, consultation_callback)
             return card
@@ -341,11 +426,43 @@ class FacultyCardManager:
         card.configure(faculty_data, consultation_callback)
 
         # Track the active card
-        self.active_cards[faculty_id] = (card, component_id)
+        self.active_cards[faculty_id] = card
+        self._component_ids[faculty_id] = component_id
 
-        logger.debug(f"Retrieved faculty card for faculty {faculty_id}")
+        logger.debug("Retrieved faculty card for faculty %s", faculty_id)
         return card
 
+    def prewarm(self, count: int) -> int:
+        """
+        Create faculty cards ahead of first use and park them in the component pool.
+
+        Must run on the GUI thread, since it constructs widgets.
+
+        Args:
+            count: Number of cards the pool should hold (capped at the pool's max size)
+
+        Returns:
+            int: Number of cards created
+        """
+        pooled = len(self.component_pool.pools.get("faculty_card", []))
+        needed = min(count, self.component_pool.max_pool_size) - pooled
+        if needed <= 0:
+            return 0
+
+        # Take them all out before returning any, otherwise each get reuses the last card
+        component_ids = [f"faculty_card_prewarm_{i}" for i in range(needed)]
+        for component_id in component_ids:
+            self.component_pool.get_component(
+                component_type="faculty_card",
+                component_class=PooledFacultyCard,
+                component_id=component_id
+            )
+        for component_id in component_ids:
+            self.component_pool.return_component(component_id, "faculty_card")
+
+        logger.info(f"Prewarmed faculty card pool with {needed} card(s)")
+        return needed
+
     def return_faculty_card(self, faculty_id: int):
         """
         Return a faculty card to the pool.
@@ -353,34 +470,52 @@ class FacultyCardManager:
         Args:
             faculty_id: ID of the faculty whose card to return
         """
-        if faculty_id not in self.active_cards:
+        card = self.active_cards.pop(faculty_id, None)
+        component_id = self._component_ids.pop(faculty_id, None)
+        if card is None:
             logger.warning(f"Attempted to return unknown faculty card: {faculty_id}")
             return
 
-        card, component_id = self.active_cards.pop(faculty_id)
-
         # Reset the card
         card.reset()
 
         # Return to pool
         self.component_pool.return_component(component_id, "faculty_card")
 
-        logger.debug(f"Returned faculty card for faculty {faculty_id}")
+        logger.debug("Returned faculty card for faculty %s", faculty_id)
 
     def update_faculty_status(self, faculty_id: int, new_status: str):
         """
-        Update the status of a specific faculty card.
+        Queue a status update for a specific faculty card.
+
+        Updates arriving within STATUS_FLUSH_INTERVAL_MS are coalesced so each card
+        is restyled at most once per flush, with the most recent status.
 
         Args:
             faculty_id: ID of the faculty
             new_status: New status string
         """
-        if faculty_id in self.active_cards:
-            card, _ = self.active_cards[faculty_id]
-            card.update_status(new_status)
+        self._pending_status[faculty_id] = new_status
+        if not self._flush_timer.isActive():
+            self._flush_timer.start(self.STATUS_FLUSH_INTERVAL_MS)
+
+    def _flush_status_updates(self):
+        """Apply all pending status updates in one pass."""
+        while self._pending_status:
+            faculty_id, new_status = self._pending_status.popitem()
+            card = self.active_cards.get(faculty_id)
+            if card is None:
+                continue
+            # Suppress intermediate paints while the dot, card and button change
+            card.setUpdatesEnabled(False)
+            try:
+                card.update_status(new_status)
+            finally:
+                card.setUpdatesEnabled(True)
 
     def clear_all_cards(self):
         """Clear all active faculty cards."""
+        self._pending_status.clear()
         for faculty_id in list(self.active_cards.keys()):
             self.return_faculty_card(faculty_id)
 
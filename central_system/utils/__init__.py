@@ -1,9 +1,23 @@
-from .input_sanitizer import (
-    sanitize_string, sanitize_email, sanitize_filename, 
-    sanitize_path, sanitize_boolean, sanitize_integer
-)
-from .stylesheet import apply_stylesheet
-from .transitions import WindowTransitionManager
+"""
+Utility package for ConsultEase.
+
+The convenience re-exports below are resolved lazily (PEP 562), so importing a
+single utility submodule does not pull in the Qt-based stylesheet and
+transition helpers.
+"""
+import importlib
+
+# Public name -> submodule that defines it
+_LAZY_ATTRS = {
+    'sanitize_string': '.input_sanitizer',
+    'sanitize_email': '.input_sanitizer',
+    'sanitize_filename': '.input_sanitizer',
+    'sanitize_path': '.input_sanitizer',
+    'sanitize_boolean': '.input_sanitizer',
+    'sanitize_integer': '.input_sanitizer',
+    'apply_stylesheet': '.stylesheet',
+    'WindowTransitionManager': '.transitions',
+}
 
 __all__ = [
     'sanitize_string',
@@ -14,4 +28,17 @@ __all__ = [
     'sanitize_integer',
     'apply_stylesheet',
     'WindowTransitionManager'
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name):
+    module_name = _LAZY_ATTRS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value  # Cache so later lookups skip __getattr__
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS))
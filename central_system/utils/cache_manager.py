@@ -6,7 +6,7 @@ Provides intelligent caching for frequently accessed data to improve performance
 import time
 import threading
 import logging
-from typing import Any, Dict, Optional, Callable
+from typing import Any, Dict, Iterable, Optional, Callable
 from functools import wraps
 
 logger = logging.getLogger(__name__)
@@ -267,3 +267,27 @@ def invalidate_consultation_cache(student_id: Optional[int] = None):
             cache.delete(key)
     
     logger.debug(f"Invalidated {len(consultation_keys)} consultation cache entries")
+
+
+def invalidate_consultation_cache_bulk(ids: Iterable[Optional[int]], include_faculty: bool = False):
+    """
+    Invalidate consultation cache entries for several IDs in a single pass.
+    Equivalent to calling invalidate_consultation_cache() for each ID (and
+    invalidate_faculty_cache() if requested), but takes the cache lock once.
+
+    Args:
+        ids: IDs to invalidate; None/0 entries are ignored
+        include_faculty: Also invalidate all faculty-related cache entries
+    """
+    markers = tuple(f"student_id={item_id}" for item_id in ids if item_id)
+    cache = get_cache_manager()
+    with cache._lock:
+        stale_keys = [
+            key for key in cache._cache.keys()
+            if (key.startswith('consultation') and any(marker in key for marker in markers))
+            or (include_faculty and key.startswith('faculty'))
+        ]
+        for key in stale_keys:
+            del cache._cache[key]
+
+    logger.debug(f"Invalidated {len(stale_keys)} cache entries for ids {list(markers)}")
@@ -3,16 +3,21 @@ MQTT test publisher for testing real-time faculty status updates.
 This utility can be used to manually test if the real-time update system is working.
 """
 
-import json
+import asyncio
 import time
 import logging
-from .mqtt_utils import publish_faculty_status, publish_mqtt_message
 
 logger = logging.getLogger(__name__)
 
+# Rapid status payload, serialized once; only the changing fields are filled in per publish
+_RAPID_STATUS_TEMPLATE = b'{"present":%s,"status":"%s","timestamp":%f,"test_sequence":%d}'
+
 
 class MQTTTestPublisher:
     """Test publisher for simulating faculty status changes."""
+
+    # Maximum number of faculty test sequences publishing at the same time
+    MAX_CONCURRENT_TESTS = 5
     
     def __init__(self):
         self.faculty_ids = [1, 2, 3, 4, 5]  # Test with faculty IDs 1-5
@@ -26,6 +31,17 @@ class MQTTTestPublisher:
             faculty_id: Faculty ID to update
             status: New status (available, busy, offline)
         """
+        return asyncio.run(self.test_faculty_status_update_async(faculty_id, status))
+
+    async def test_faculty_status_update_async(self, faculty_id: int, status: str):
+        """
+        Test publishing a faculty status update without blocking between payload formats.
+        
+        Args:
+            faculty_id: Faculty ID to update
+            status: New status (available, busy, offline)
+        """
+        from .mqtt_utils import publish_mqtt_message  # Deferred: pulls in the MQTT stack
         logger.info(f"🧪 Testing faculty status update: Faculty {faculty_id} -> {status}")
         
         # Test different payload formats
@@ -50,8 +66,8 @@ class MQTTTestPublisher:
         ]
         
         success_count = 0
+        topic = f"consultease/faculty/{faculty_id}/status"
         for i, payload in enumerate(test_formats):
-            topic = f"consultease/faculty/{faculty_id}/status"
             logger.info(f"  🔄 Test {i+1}: Publishing to {topic} with payload: {payload}")
             
             if publish_mqtt_message(topic, payload):
@@ -61,21 +77,36 @@ class MQTTTestPublisher:
                 logger.error(f"  ❌ Test {i+1}: Failed")
             
             # Wait between tests
-            time.sleep(0.5)
+            await asyncio.sleep(0.5)
         
         logger.info(f"🧪 Test completed: {success_count}/{len(test_formats)} successful")
         return success_count == len(test_formats)
     
     def test_all_faculty_status_cycle(self):
         """Test cycling through all faculty and all statuses."""
+        return asyncio.run(self.test_all_faculty_status_cycle_async())
+
+    async def test_all_faculty_status_cycle_async(self):
+        """
+        Test cycling through all faculty and all statuses.
+
+        Each faculty member steps through the statuses in order, while different
+        faculty members are tested concurrently (bounded by MAX_CONCURRENT_TESTS).
+        """
         logger.info("🧪 Starting comprehensive faculty status test cycle")
         
-        results = []
-        for faculty_id in self.faculty_ids:
-            for status in self.statuses:
-                result = self.test_faculty_status_update(faculty_id, status)
-                results.append(result)
-                time.sleep(1)  # Wait between each test
+        semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_TESTS)
+
+        async def cycle_faculty(faculty_id):
+            async with semaphore:
+                faculty_results = []
+                for status in self.statuses:
+                    faculty_results.append(await self.test_faculty_status_update_async(faculty_id, status))
+                    await asyncio.sleep(1)  # Wait between each test
+                return faculty_results
+
+        per_faculty = await asyncio.gather(*(cycle_faculty(faculty_id) for faculty_id in self.faculty_ids))
+        results = [result for faculty_results in per_faculty for result in faculty_results]
         
         successful_tests = sum(results)
         total_tests = len(results)
@@ -85,21 +116,27 @@ class MQTTTestPublisher:
     
     def test_rapid_status_changes(self, faculty_id: int = 1, count: int = 10):
         """Test rapid status changes for a single faculty member."""
+        return asyncio.run(self.test_rapid_status_changes_async(faculty_id, count))
+
+    async def test_rapid_status_changes_async(self, faculty_id: int = 1, count: int = 10):
+        """Test rapid status changes for a single faculty member without blocking the caller."""
+        from .mqtt_utils import publish_mqtt_message
         logger.info(f"🧪 Testing rapid status changes for Faculty {faculty_id}")
         
         import random
         success_count = 0
         
+        topic = f"consultease/faculty/{faculty_id}/status"
+        encoded_statuses = {status: status.encode() for status in self.statuses}
+
         for i in range(count):
             status = random.choice(self.statuses)
-            topic = f"consultease/faculty/{faculty_id}/status"
-            
-            payload = {
-                "present": status != "offline",
-                "status": status,
-                "timestamp": time.time(),
-                "test_sequence": i
-            }
+            payload = _RAPID_STATUS_TEMPLATE % (
+                b'true' if status != "offline" else b'false',
+                encoded_statuses[status],
+                time.time(),
+                i
+            )
             
             if publish_mqtt_message(topic, payload):
                 success_count += 1
@@ -107,13 +144,14 @@ class MQTTTestPublisher:
             else:
                 logger.error(f"  ❌ Rapid test {i+1}: Failed")
             
-            time.sleep(0.1)  # Very short delay
+            await asyncio.sleep(0.1)  # Very short delay
         
         logger.info(f"🧪 Rapid test completed: {success_count}/{count} successful")
         return success_count == count
     
     def test_system_notification(self, message: str = "Test system notification"):
         """Test publishing a system notification."""
+        from .mqtt_utils import publish_mqtt_message
         logger.info(f"🧪 Testing system notification: {message}")
         
         payload = {
@@ -135,6 +173,7 @@ class MQTTTestPublisher:
     
     def test_faculty_status_change_notification(self, faculty_id: int, new_status: str):
         """Test publishing a faculty status change system notification."""
+        from .mqtt_utils import publish_mqtt_message
         logger.info(f"🧪 Testing faculty status change notification: Faculty {faculty_id} -> {new_status}")
         
         payload = {
@@ -5,6 +5,8 @@ This module provides a centralized place for all MQTT topic definitions
 to ensure consistency across the system.
 """
 
+import functools
+
 class MQTTTopics:
     """
     MQTT topic definitions for ConsultEase.
@@ -16,6 +18,8 @@ class MQTTTopics:
     - component: The component type (faculty, student, system)
     - id: The ID of the component (faculty ID, student ID, etc.)
     - action: The action being performed (status, requests, etc.)
+
+    The per-faculty getters are cached, so each topic string is formatted once per faculty ID.
     """
 
     # Faculty topics
@@ -35,31 +39,37 @@ class MQTTTopics:
     LEGACY_FACULTY_MESSAGES = "professor/messages"
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_faculty_status_topic(faculty_id):
         """Get the topic for faculty status updates."""
         return MQTTTopics.FACULTY_STATUS.format(faculty_id=faculty_id)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_faculty_mac_status_topic(faculty_id):
         """Get the topic for faculty MAC address status updates."""
         return MQTTTopics.FACULTY_MAC_STATUS.format(faculty_id=faculty_id)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_faculty_requests_topic(faculty_id):
         """Get the topic for faculty consultation requests."""
         return MQTTTopics.FACULTY_REQUESTS.format(faculty_id=faculty_id)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_faculty_responses_topic(faculty_id):
         """Get the topic for faculty consultation responses."""
         return MQTTTopics.FACULTY_RESPONSES.format(faculty_id=faculty_id)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_faculty_heartbeat_topic(faculty_id):
         """Get the topic for faculty heartbeat messages."""
         return MQTTTopics.FACULTY_HEARTBEAT.format(faculty_id=faculty_id)
 
     @staticmethod
+    @functools.lru_cache(maxsize=1024)
     def get_faculty_messages_topic(faculty_id):
         """Get the topic for faculty messages."""
         return MQTTTopics.FACULTY_MESSAGES.format(faculty_id=faculty_id)
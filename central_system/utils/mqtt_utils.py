@@ -7,9 +7,14 @@ import logging
 import json
 import inspect
 import threading
-from typing import Any, Optional
+from typing import Any, List, Optional, Tuple
 from ..services.async_mqtt_service import get_async_mqtt_service
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 # Add a thread lock for MQTT publishing operations
@@ -26,6 +31,22 @@ def get_mqtt_service():
     return get_async_mqtt_service()
 
 
+def encode_payload(payload: Any):
+    """
+    Serialize a dict/list payload to compact JSON, using orjson when it is installed.
+    Both paths emit the same wire format without whitespace after separators.
+
+    Args:
+        payload: JSON-serializable data
+
+    Returns:
+        bytes or str: Encoded payload, suitable for passing straight to publish
+    """
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(',', ':'))
+
+
 def publish_mqtt_message(topic: str, payload: any, qos: int = 0, retain: bool = False) -> bool:
     """
     Publish a message to an MQTT topic using the async MQTT service.
@@ -34,7 +55,7 @@ def publish_mqtt_message(topic: str, payload: any, qos: int = 0, retain: bool =
 
     Args:
         topic: MQTT topic to publish to
-        payload: Data to publish (will be JSON encoded if not string)
+        payload: Data to publish (dicts/lists are JSON encoded, bytes are sent as-is)
         qos: Quality of service level (0, 1, or 2)
         retain: Whether to retain the message on the broker
 
@@ -71,7 +92,10 @@ def publish_mqtt_message(topic: str, payload: any, qos: int = 0, retain: bool =
         # Prepare the payload safely
         try:
             if isinstance(payload, dict) or isinstance(payload, list):
-                message_str = json.dumps(payload)
+                message_str = encode_payload(payload)
+            elif isinstance(payload, (bytes, bytearray)):
+                # Already serialized by the caller
+                message_str = payload
             else:
                 message_str = str(payload)
         except Exception as e:
@@ -137,6 +161,86 @@ def publish_mqtt_message(topic: str, payload: any, qos: int = 0, retain: bool =
     return publish_successful
 
 
+def publish_mqtt_batch(messages: List[Tuple[str, Any, int]], retain: bool = False) -> List[bool]:
+    """
+    Publish several messages in one submission.
+    The connection is checked once and the publish lock is acquired once for
+    the whole batch, instead of once per message as with publish_mqtt_message.
+
+    Args:
+        messages: List of (topic, payload, qos) tuples; payloads are JSON encoded if not string
+        retain: Whether to retain the messages on the broker
+
+    Returns:
+        list: Per-message success flags, in the same order as ``messages``
+    """
+    results = [False] * len(messages)
+    if not messages:
+        return results
+
+    try:
+        mqtt_service = get_async_mqtt_service()
+        if mqtt_service is None:
+            logger.error("Failed to get MQTT service, service is None")
+            return results
+
+        client = mqtt_service.client
+        if client is None:
+            logger.error("Failed to get MQTT client, client is None")
+            return results
+
+        try:
+            is_connected = client.is_connected()
+        except Exception as e:
+            logger.error(f"Error checking MQTT connection status: {str(e)}")
+            return results
+
+        if not is_connected:
+            logger.warning(f"MQTT client not connected. Cannot publish batch of {len(messages)} messages")
+            return results
+
+        # Serialize everything before taking the lock
+        prepared = []
+        for topic, payload, qos in messages:
+            try:
+                if isinstance(payload, (dict, list)):
+                    message_str = encode_payload(payload)
+                elif isinstance(payload, (bytes, bytearray)):
+                    message_str = payload
+                else:
+                    message_str = str(payload)
+            except Exception as e:
+                logger.error(f"Error serializing payload for topic {topic}: {str(e)}")
+                message_str = None
+            prepared.append((topic, message_str, qos))
+
+        with _mqtt_publish_lock:
+            for index, (topic, message_str, qos) in enumerate(prepared):
+                if message_str is None:
+                    continue
+                try:
+                    result = client.publish(topic, message_str, qos=qos, retain=retain)
+                    if result.rc == 0:
+                        results[index] = True
+                        if qos > 0:
+                            # Confirmation is handled asynchronously by the service
+                            mqtt_service.track_publish(result.mid, topic)
+                    else:
+                        logger.error(f"Failed to publish to {topic} - MQTT Error Code: {result.rc}")
+                except Exception as e:
+                    logger.error(f"Exception during MQTT publish to {topic}: {str(e)}")
+
+    except Exception as e:
+        logger.error(f"Unexpected exception in publish_mqtt_batch: {str(e)}")
+        return results
+
+    logger.info(
+        f"MQTT_PUBLISH_BATCH: {sum(results)}/{len(messages)} published, "
+        f"Topics={[topic for topic, _, _ in messages]}"
+    )
+    return results
+
+
 def subscribe_to_topic(topic: str, callback: callable) -> bool:
     """
     Subscribe to an MQTT topic with a callback function.
@@ -215,45 +319,58 @@ def publish_faculty_status(faculty_id: int, status: str, additional_data: dict =
     return publish_mqtt_message(topic, data)
 
 
-def publish_consultation_request(consultation_data: dict) -> bool:
+def build_consultation_request_messages(consultation_data: dict) -> List[Tuple[str, Any, int]]:
     """
-    Publish consultation request to multiple topics.
+    Build the (topic, payload, qos) entries for a consultation request.
 
     Args:
         consultation_data: Dictionary containing consultation information
 
     Returns:
-        bool: True if all messages were queued successfully
+        list: Messages for the general, faculty requests and faculty messages topics,
+              or an empty list if the consultation or faculty ID is missing
     """
-    success_count = 0
-    total_topics = 3
-
     consultation_id = consultation_data.get('id')
     faculty_id = consultation_data.get('faculty_id')
 
     if not consultation_id or not faculty_id:
         logger.error("Missing consultation_id or faculty_id in consultation data")
-        return False
-
-    # 1. General consultation topic
-    general_topic = f"consultease/consultations/{consultation_id}"
-    if publish_mqtt_message(general_topic, consultation_data):
-        success_count += 1
+        return []
 
-    # 2. Faculty-specific topic
-    faculty_topic = f"consultease/faculty/{faculty_id}/requests"
-    if publish_mqtt_message(faculty_topic, consultation_data):
-        success_count += 1
-
-    # 3. Faculty messages topic (plain text for desk unit)
     student_name = consultation_data.get('student_name', 'Unknown')
     student_id = consultation_data.get('student_id', 'Unknown')
     message = consultation_data.get('request_message', 'No actual message provided')
-
     plain_message = f"CID:{consultation_id} From:{student_name} (SID:{student_id}): {message}"
-    faculty_messages_topic = f"consultease/faculty/{faculty_id}/messages"
-    if publish_mqtt_message(faculty_messages_topic, plain_message, qos=2):
-        success_count += 1
 
-    logger.info(f"Published consultation {consultation_id} to {success_count}/{total_topics} topics")
-    return success_count == total_topics
+    # Both JSON topics carry the same payload, so encode it once; unset fields are left out
+    payload = encode_payload({k: v for k, v in consultation_data.items() if v is not None})
+
+    return [
+        # 1. General consultation topic
+        (f"consultease/consultations/{consultation_id}", payload, 0),
+        # 2. Faculty-specific topic
+        (f"consultease/faculty/{faculty_id}/requests", payload, 0),
+        # 3. Faculty messages topic (plain text for desk unit)
+        (f"consultease/faculty/{faculty_id}/messages", plain_message, 2),
+    ]
+
+
+def publish_consultation_request(consultation_data: dict) -> bool:
+    """
+    Publish consultation request to multiple topics.
+
+    Args:
+        consultation_data: Dictionary containing consultation information
+
+    Returns:
+        bool: True if all messages were queued successfully
+    """
+    messages = build_consultation_request_messages(consultation_data)
+    if not messages:
+        return False
+
+    results = publish_mqtt_batch(messages)
+    success_count = sum(results)
+
+    logger.info(f"Published consultation {consultation_data.get('id')} to {success_count}/{len(messages)} topics")
+    return success_count == len(messages)
@@ -226,6 +226,128 @@ class ConsultEaseTheme:
             }}
         """
 
+    @classmethod
+    def get_palette(cls):
+        """
+        Get the application palette built from the theme colors.
+
+        Widgets pick these colors up from the shared palette, so stylesheets
+        only need to declare colors where they differ from it.
+        """
+        from PyQt5.QtGui import QPalette, QColor
+
+        palette = QPalette()
+        palette.setColor(QPalette.Window, QColor(cls.BG_SECONDARY))
+        palette.setColor(QPalette.WindowText, QColor(cls.TEXT_PRIMARY))
+        palette.setColor(QPalette.Base, QColor(cls.BG_PRIMARY))
+        palette.setColor(QPalette.Text, QColor(cls.TEXT_PRIMARY))
+        palette.setColor(QPalette.Button, QColor(cls.PRIMARY_COLOR))
+        palette.setColor(QPalette.ButtonText, QColor(cls.TEXT_LIGHT))
+        palette.setColor(QPalette.Highlight, QColor(cls.PRIMARY_COLOR))
+        palette.setColor(QPalette.HighlightedText, QColor(cls.TEXT_LIGHT))
+        return palette
+
+    @classmethod
+    def get_consultation_form_stylesheet(cls):
+        """
+        Get the stylesheet for the consultation request form.
+        Child widgets are matched by object name, so the whole form is styled by
+        a single stylesheet set on the form frame.
+        """
+        return """
+            QFrame#consultation_request_form {
+                background-color: #ffffff;
+                border: 2px solid #DAA520;
+                border-radius: 10px;
+                padding: 20px;
+            }
+            QLabel {
+                font-size: 16pt;
+                color: #1E90FF;
+                font-weight: 500;
+                margin-bottom: 5px;
+            }
+            QLabel#form_title {
+                font-size: 20pt;
+                font-weight: bold;
+                color: #DAA520;
+            }
+            QLabel#form_field_label {
+                font-size: 14pt;
+                font-weight: bold;
+                color: #1E90FF;
+            }
+            QLabel#char_count_label {
+                font-size: 11pt;
+                font-weight: bold;
+            }
+            QLabel#char_count_label[state="ok"] { color: #1E90FF; }
+            QLabel#char_count_label[state="warn"] { color: #DAA520; }
+            QLabel#char_count_label[state="over"] { color: #FF6347; }
+            QLabel#char_limit_info {
+                color: #DAA520;
+                font-size: 10pt;
+                font-weight: bold;
+            }
+            QLineEdit, QTextEdit, QComboBox {
+                border: 2px solid #4169E1;
+                border-radius: 5px;
+                padding: 15px;
+                background-color: #ffffff;
+                font-size: 16pt;
+                color: #333333;
+                margin: 5px 0;
+            }
+            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
+                border: 2px solid #FFD700;
+                background-color: #FFFEF7;
+            }
+            QComboBox#faculty_combo, QLineEdit#course_input, QTextEdit#message_input {
+                padding: 10px;
+                font-size: 12pt;
+            }
+            QComboBox#faculty_combo::drop-down {
+                subcontrol-origin: padding;
+                subcontrol-position: top right;
+                width: 30px;
+                border-left: 1px solid #4169E1;
+            }
+            QComboBox#faculty_combo QAbstractItemView {
+                border: 2px solid #4169E1;
+                selection-background-color: #FFD700;
+                selection-color: #333333;
+                background-color: #ffffff;
+                font-size: 12pt;
+            }
+            QProgressBar#char_count_progress {
+                background-color: #f0f0f0;
+                border: 1px solid #DAA520;
+                border-radius: 5px;
+            }
+            QProgressBar#char_count_progress::chunk {
+                border-radius: 5px;
+            }
+            QProgressBar#char_count_progress[state="ok"]::chunk { background-color: #4169E1; }
+            QProgressBar#char_count_progress[state="warn"]::chunk { background-color: #DAA520; }
+            QProgressBar#char_count_progress[state="over"]::chunk { background-color: #FF6347; }
+            QPushButton {
+                border-radius: 5px;
+                padding: 15px 25px;
+                font-size: 16pt;
+                font-weight: bold;
+                color: white;
+                margin: 10px 0;
+            }
+            QPushButton#cancel_request_button {
+                background-color: #DAA520;
+                min-width: 120px;
+            }
+            QPushButton#submit_request_button {
+                background-color: #4169E1;
+                min-width: 120px;
+            }
+        """
+
     @classmethod
     def get_login_stylesheet(cls):
         """
@@ -277,7 +399,9 @@ class ConsultEaseTheme:
             }}
 
             /* Faculty Card Styling - Modern design with proper theming */
-            QWidget#faculty_card_available {{
+            /* Pooled cards keep one object name and toggle the "available" property */
+            QWidget#faculty_card_available,
+            QWidget#faculty_card[available="true"] {{
                 background-color: #ffffff;
                 border: 2px solid {cls.SUCCESS_COLOR};
                 border-radius: {cls.BORDER_RADIUS_LARGE}px;
@@ -285,7 +409,8 @@ class ConsultEaseTheme:
                 padding: {cls.PADDING_NORMAL}px;
             }}
 
-            QWidget#faculty_card_unavailable {{
+            QWidget#faculty_card_unavailable,
+            QWidget#faculty_card[available="false"] {{
                 background-color: #ffffff;
                 border: 2px solid {cls.SECONDARY_COLOR};
                 border-radius: {cls.BORDER_RADIUS_LARGE}px;
@@ -295,7 +420,8 @@ class ConsultEaseTheme:
 
             /* Faculty Card Text Elements - No borders as per user preference */
             QWidget#faculty_card_available QLabel,
-            QWidget#faculty_card_unavailable QLabel {{
+            QWidget#faculty_card_unavailable QLabel,
+            QWidget#faculty_card QLabel {{
                 border: none;
                 background: transparent;
                 color: {cls.TEXT_PRIMARY};
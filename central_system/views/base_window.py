@@ -1,20 +1,71 @@
-from PyQt5.QtWidgets import (QMainWindow, QDesktopWidget, QShortcut, QPushButton,
+from PyQt5.QtWidgets import (QMainWindow, QDesktopWidget, QPushButton, QAction,
                              QStatusBar, QApplication, QLineEdit, QTextEdit,
                              QPlainTextEdit, QComboBox)
 from PyQt5.QtCore import Qt, pyqtSignal, QSize, QTimer, QEvent
-from PyQt5.QtGui import QKeySequence, QIcon
+from PyQt5.QtGui import QKeySequence, QIcon, QGuiApplication
 import logging
-import sys
-import os
-import subprocess
 
-# Add parent directory to path to help with imports
-sys.path.insert(0, os.path.abspath(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))))
+logger = logging.getLogger(__name__)
 
-# Import utilities
-from central_system.utils.icons import IconProvider, Icons  # Import IconProvider and Icons
+# Touch-friendly stylesheet shared by every window, built once at import time.
+# Only sizing rules live here; colors come from ConsultEaseTheme and its palette.
+_TOUCH_STYLE = '''
+    /* General styles */
+    QWidget {
+        font-size: 14pt;
+    }
 
-logger = logging.getLogger(__name__)
+    /* Touch-friendly buttons */
+    QPushButton {
+        min-height: 50px;
+        padding: 10px 20px;
+        font-size: 14pt;
+        border-radius: 5px;
+    }
+
+    /* Touch-friendly input fields */
+    QLineEdit, QTextEdit, QComboBox {
+        min-height: 40px;
+        padding: 5px 10px;
+        font-size: 14pt;
+        border-radius: 5px;
+    }
+
+    /* Table headers and cells */
+    QTableWidget {
+        font-size: 12pt;
+    }
+
+    QTableWidget::item {
+        padding: 8px;
+    }
+
+    QHeaderView::section {
+        background-color: #e0e0e0;
+        padding: 8px;
+        font-size: 12pt;
+        font-weight: bold;
+    }
+
+    /* Tabs for better touch */
+    QTabBar::tab {
+        min-width: 120px;
+        min-height: 40px;
+        padding: 8px 16px;
+        font-size: 14pt;
+    }
+
+    /* Dialog buttons */
+    QDialogButtonBox > QPushButton {
+        min-width: 100px;
+        min-height: 40px;
+    }
+
+    /* Window status bar */
+    QStatusBar {
+        border-top: 1px solid #cccccc;
+    }
+'''
 
 class BaseWindow(QMainWindow):
     """
@@ -24,6 +75,26 @@ class BaseWindow(QMainWindow):
     # Signal for changing windows
     change_window = pyqtSignal(str, object)
 
+    # Touch-friendly stylesheet, applied once application-wide by ConsultEaseApp
+    TOUCH_STYLE = _TOUCH_STYLE
+
+    # Fullscreen state preference (set through set_fullscreen by ConsultEaseApp)
+    fullscreen = False
+
+    # Application icon shared by all windows, loaded on first window creation
+    _APP_ICON = None
+    _APP_ICON_MISSING = False
+    _APP_ICON_SIZE = QSize(64, 64)
+
+    # Center of the primary screen's available area, refreshed on screen changes
+    _screen_center = None
+    _screen_signal = None
+
+    # F11 key sequence and the single fullscreen action shared by all windows,
+    # built on first window creation
+    _F11_SEQ = None
+    _FULLSCREEN_ACTION = None
+
     def __init__(self, parent=None):
         super().__init__(parent)
 
@@ -32,8 +103,8 @@ class BaseWindow(QMainWindow):
         self.setGeometry(100, 100, 1024, 768) # Default size
 
         # Set application icon (use helper from icons module)
-        app_icon = IconProvider.get_icon(Icons.APP_ICON if hasattr(Icons, 'APP_ICON') else "app", QSize(64, 64))
-        if app_icon and not app_icon.isNull():
+        app_icon = self._get_app_icon()
+        if app_icon is not None:
             self.setWindowIcon(app_icon)
         else:
             logger.warning("Could not load application icon.")
@@ -41,12 +112,79 @@ class BaseWindow(QMainWindow):
         # Initialize UI (must be called after basic setup)
         self.init_ui()
 
-        # Add F11 shortcut to toggle fullscreen
-        self.fullscreen_shortcut = QShortcut(QKeySequence(Qt.Key_F11), self)
-        self.fullscreen_shortcut.activated.connect(self.toggle_fullscreen)
+        # Add the shared F11 action that toggles fullscreen on the active window
+        self.addAction(BaseWindow._get_fullscreen_action())
+
+    def connect_change_window(self, slot):
+        """
+        Connect a slot to change_window with a queued connection.
+
+        The slot then runs on the next event-loop iteration, so the emitting
+        window finishes its current event handling and paint before the next
+        window is built and shown.
+
+        Args:
+            slot: Callable taking (window_name, data)
+        """
+        self.change_window.connect(slot, Qt.QueuedConnection)
+
+    @classmethod
+    def _get_app_icon(cls):
+        """
+        Get the application icon, loading it only once per process.
+
+        Returns:
+            QIcon: The application icon, or None if it could not be loaded
+        """
+        if BaseWindow._APP_ICON is None and not BaseWindow._APP_ICON_MISSING:
+            # Imported here so importing this module does not load the icon system
+            from central_system.utils.icons import IconProvider, Icons
+            app_icon = IconProvider.get_icon(getattr(Icons, 'APP_ICON', "app"), BaseWindow._APP_ICON_SIZE)
+            if app_icon.isNull():
+                # get_icon returns an empty icon on failure; remember it so later
+                # windows don't repeat the lookup
+                BaseWindow._APP_ICON_MISSING = True
+            else:
+                BaseWindow._APP_ICON = app_icon
+        return BaseWindow._APP_ICON
+
+    @classmethod
+    def _get_f11_seq(cls):
+        """
+        Get the F11 key sequence used for the fullscreen shortcut.
 
-        # Store fullscreen state preference (will be set by ConsultEaseApp)
-        self.fullscreen = False
+        Returns:
+            QKeySequence: The shared F11 key sequence
+        """
+        if BaseWindow._F11_SEQ is None:
+            BaseWindow._F11_SEQ = QKeySequence(Qt.Key_F11)
+        return BaseWindow._F11_SEQ
+
+    @classmethod
+    def _get_fullscreen_action(cls):
+        """
+        Get the application-wide F11 action that toggles fullscreen.
+
+        A single action is added to every window, so Qt keeps one shortcut
+        registration no matter how many windows exist.
+
+        Returns:
+            QAction: The shared fullscreen action
+        """
+        if BaseWindow._FULLSCREEN_ACTION is None:
+            action = QAction("Toggle Fullscreen", QApplication.instance())
+            action.setShortcut(BaseWindow._get_f11_seq())
+            action.setShortcutContext(Qt.ApplicationShortcut)
+            action.triggered.connect(BaseWindow._toggle_active_window_fullscreen)
+            BaseWindow._FULLSCREEN_ACTION = action
+        return BaseWindow._FULLSCREEN_ACTION
+
+    @staticmethod
+    def _toggle_active_window_fullscreen():
+        """Toggle fullscreen on the active window if it is a BaseWindow."""
+        window = QApplication.activeWindow()
+        if isinstance(window, BaseWindow):
+            window.toggle_fullscreen()
 
     def init_ui(self):
         """
@@ -57,102 +195,67 @@ class BaseWindow(QMainWindow):
         self.setMinimumSize(800, 480)  # Minimum size for Raspberry Pi 7" touchscreen
         self.apply_touch_friendly_style()
 
-        # Add status bar
-        self.statusBar().setStyleSheet("QStatusBar { border-top: 1px solid #cccccc; }")
+        # Add status bar (styled by TOUCH_STYLE)
+        self.statusBar()
 
         # Center window on screen
         self.center()
 
     def apply_touch_friendly_style(self):
         """
-        Apply touch-friendly styles to the application
-        """
-        self.setStyleSheet('''
-            /* General styles */
-            QWidget {
-                font-size: 14pt;
-            }
-
-            QMainWindow {
-                background-color: #f0f0f0;
-            }
-
-            /* Touch-friendly buttons */
-            QPushButton {
-                min-height: 50px;
-                padding: 10px 20px;
-                font-size: 14pt;
-                border-radius: 5px;
-                background-color: #4a86e8;
-                color: white;
-            }
-
-            QPushButton:hover {
-                background-color: #5a96f8;
-            }
-
-            QPushButton:pressed {
-                background-color: #3a76d8;
-            }
-
-            /* Touch-friendly input fields */
-            QLineEdit, QTextEdit, QComboBox {
-                min-height: 40px;
-                padding: 5px 10px;
-                font-size: 14pt;
-                border: 1px solid #cccccc;
-                border-radius: 5px;
-            }
-
-            QLineEdit:focus, QTextEdit:focus {
-                border: 2px solid #4a86e8;
-            }
-
-            /* Table headers and cells */
-            QTableWidget {
-                font-size: 12pt;
-            }
-
-            QTableWidget::item {
-                padding: 8px;
-            }
-
-            QHeaderView::section {
-                background-color: #e0e0e0;
-                padding: 8px;
-                font-size: 12pt;
-                font-weight: bold;
-            }
-
-            /* Tabs for better touch */
-            QTabBar::tab {
-                min-width: 120px;
-                min-height: 40px;
-                padding: 8px 16px;
-                font-size: 14pt;
-            }
-
-            /* Dialog buttons */
-            QDialogButtonBox > QPushButton {
-                min-width: 100px;
-                min-height: 40px;
-            }
-        ''')
-        logger.info("Applied touch-optimized UI settings")
+        Apply touch-friendly styles to the application.
+
+        The styles are set once on the QApplication at startup (see
+        ConsultEaseApp), so windows inherit them through the stylesheet
+        cascade instead of re-polishing their widgets on every construction.
+        Kept for backward compatibility with subclasses that still call it.
+        """
+        logger.debug("Touch-optimized UI settings are applied application-wide")
 
     def center(self):
         """
         Center the window on the screen.
         """
-        # Get the screen geometry
-        screen = QApplication.desktop().screenGeometry()
-        # Get the window geometry
-        window = self.geometry()
-        # Calculate the center position
-        x = (screen.width() - window.width()) // 2
-        y = (screen.height() - window.height()) // 2
-        # Move the window to the center
-        self.move(x, y)
+        screen_center = BaseWindow._get_screen_center()
+        if screen_center is None:
+            return
+        # Move the frame (including window decorations) so its center lands on the
+        # center of the usable screen area; for a top-level window pos() is the
+        # frame's top-left corner, so the frame rect already gives both positions
+        frame = self.frameGeometry()
+        pos = frame.topLeft()
+        frame.moveCenter(screen_center)
+        # Skip the move (and the relayout it triggers) if already centered
+        if frame.topLeft() != pos:
+            self.move(frame.topLeft())
+
+    @classmethod
+    def _get_screen_center(cls):
+        """
+        Get the center of the primary screen's available area.
+
+        The value is cached on the class and invalidated when the primary screen
+        or its available geometry changes.
+
+        Returns:
+            QPoint: Center of the available screen area, or None if there is no screen
+        """
+        if BaseWindow._screen_center is None:
+            screen = QGuiApplication.primaryScreen()
+            if screen is None:
+                return None
+            if BaseWindow._screen_signal is not screen:
+                screen.availableGeometryChanged.connect(BaseWindow._invalidate_screen_cache)
+                if BaseWindow._screen_signal is None:
+                    QGuiApplication.instance().primaryScreenChanged.connect(BaseWindow._invalidate_screen_cache)
+                BaseWindow._screen_signal = screen
+            BaseWindow._screen_center = screen.availableGeometry().center()
+        return BaseWindow._screen_center
+
+    @staticmethod
+    def _invalidate_screen_cache(*args):
+        """Drop the cached screen center so the next center() call re-reads it."""
+        BaseWindow._screen_center = None
 
     def keyPressEvent(self, event):
         """
@@ -178,14 +281,24 @@ class BaseWindow(QMainWindow):
             logger.info("Entering fullscreen mode")
             self.showFullScreen()
 
-    def showEvent(self, event):
+    def set_fullscreen(self, state):
         """
-        Override showEvent to apply fullscreen if needed.
+        Set the fullscreen state of the window.
+
+        If the window is not shown yet, the state is applied through the window
+        flags so the first show() opens it directly in that state instead of
+        showing it normally and then re-showing it fullscreen.
+
+        Args:
+            state (bool): True for fullscreen, False for a normal window
         """
-        # This ensures the window respects the initial fullscreen setting
-        # The `fullscreen` flag is set by ConsultEaseApp
-        if hasattr(self, 'fullscreen') and self.fullscreen:
-            if not self.isFullScreen(): # Avoid toggling if already fullscreen
+        self.fullscreen = state
+        if self.isVisible():
+            if state and not self.isFullScreen():
                 self.showFullScreen()
-
-        super().showEvent(event)
\ No newline at end of file
+            elif not state and self.isFullScreen():
+                self.showNormal()
+        elif state:
+            self.setWindowState(self.windowState() | Qt.WindowFullScreen)
+        else:
+            self.setWindowState(self.windowState() & ~Qt.WindowFullScreen)
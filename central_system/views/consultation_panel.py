@@ -3,24 +3,109 @@ Consultation panel module.
 Contains the consultation request form and consultation history panel.
 """
 
+import json
 import logging
+import re
 import time
 from datetime import datetime, timedelta
 from typing import List, Optional, Dict, Any
 
-from PyQt5.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
+from PyQt5.QtWidgets import (QVBoxLayout, QHBoxLayout, QLabel,
                             QPushButton, QFrame, QLineEdit, QTextEdit,
                             QComboBox, QMessageBox, QTabWidget, QTableWidget,
                             QTableWidgetItem, QHeaderView, QDialog, QFormLayout,
-                            QSizePolicy, QProgressBar, QApplication)
-from PyQt5.QtCore import Qt, pyqtSignal, QTimer, QPoint, pyqtSlot
-from PyQt5.QtGui import QColor
+                            QSizePolicy, QProgressBar, QApplication, QStyledItemDelegate)
+from PyQt5.QtCore import (Qt, pyqtSignal, QTimer, QPoint, QPointF, QRect, QRectF, QEvent,
+                          QObject, QThread, pyqtSlot)
+from PyQt5.QtGui import (QBrush, QColor, QFont, QFontMetrics, QIcon, QPainter, QStaticText,
+                         QTransform, QStandardItemModel, QStandardItem)
 
 from ..models import ConsultationStatus # Import ConsultationStatus
+from ..utils.theme import ConsultEaseTheme
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from ..utils.notification import NotificationManager
+except ImportError:
+    NotificationManager = None
+
+try:
+    from ..services.async_mqtt_service import get_async_mqtt_service
+    from ..controllers.faculty_response_controller import get_faculty_response_controller
+except ImportError:
+    get_async_mqtt_service = None
+    get_faculty_response_controller = None
+
+# Parse MQTT payloads with orjson when it is installed; its JSONDecodeError
+# subclasses json.JSONDecodeError, so callers handle both the same way
+_json_loads = orjson.loads if orjson is not None else json.loads
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Status cell colors (gold and blue theme), shared by every row of the history table
+_STATUS_STYLE = {
+    status: {
+        "bg": QBrush(bg),
+        "fg": QBrush(fg),
+        "css": f"border: 2px solid {border}; border-radius: 4px; padding: 4px;"
+    }
+    for status, bg, fg, border in (
+        # Light goldenrod background, dark goldenrod text
+        ("pending", QColor(255, 248, 220), QColor(184, 134, 11), "#DAA520"),
+        # Very light blue background, forest green text
+        ("accepted", QColor(240, 248, 255), QColor(34, 139, 34), "#228B22"),
+        # Very light red background, red text
+        ("busy", QColor(255, 245, 245), QColor(220, 53, 69), "#dc3545"),
+        # Light blue background, royal blue text
+        ("completed", QColor(230, 240, 255), QColor(65, 105, 225), "#4169E1"),
+        # Light red background, dark goldenrod text
+        ("cancelled", QColor(255, 245, 245), QColor(178, 134, 11), "#B8860B"),
+    )
+}
+
+# Consultation status each faculty desk response moves a consultation to
+# (mirrors FacultyResponseController._process_faculty_response)
+_RESPONSE_STATUS = {
+    "ACKNOWLEDGE": ConsultationStatus.ACCEPTED,
+    "ACCEPTED": ConsultationStatus.ACCEPTED,
+    "BUSY": ConsultationStatus.BUSY,
+    "UNAVAILABLE": ConsultationStatus.BUSY,
+    "REJECTED": ConsultationStatus.CANCELLED,
+    "DECLINED": ConsultationStatus.CANCELLED,
+    "COMPLETED": ConsultationStatus.COMPLETED,
+}
+
+# Course code format: 2-4 letters followed by 3-4 numbers, optionally followed by a letter
+# (e.g. CS101, MATH202, ENG101A)
+_COURSE_CODE_RE = re.compile(r'^[A-Za-z]{2,4}\d{3,4}[A-Za-z]?\Z')
+
+# Stylesheet for the fallback validation error dialog
+_ERR_QSS = """
+    QMessageBox {
+        background-color: #f8f9fa;
+    }
+    QLabel {
+        color: #212529;
+        font-size: 12pt;
+    }
+    QPushButton {
+        background-color: #0d3b66;
+        color: white;
+        border-radius: 4px;
+        padding: 6px 12px;
+        font-weight: bold;
+        min-width: 80px;
+    }
+    QPushButton:hover {
+        background-color: #0a2f52;
+    }
+"""
+
 class ConsultationRequestForm(QFrame):
     """
     Form to request a consultation with a faculty member.
@@ -31,57 +116,21 @@ class ConsultationRequestForm(QFrame):
         super().__init__(parent)
         self.faculty = faculty
         self.faculty_options = []
+        self._faculty_by_id = {}
+        self._index_by_id = {}
+        self._err_box = None
         self.init_ui()
 
     def init_ui(self):
         """
         Initialize the consultation request form UI.
         """
-        # Import theme system
-        from ..utils.theme import ConsultEaseTheme
-
         self.setFrameShape(QFrame.StyledPanel)
         self.setObjectName("consultation_request_form")
 
-        # Apply theme-based stylesheet with gold and blue theme
-        self.setStyleSheet('''
-            QFrame#consultation_request_form {
-                background-color: #ffffff;
-                border: 2px solid #DAA520;
-                border-radius: 10px;
-                padding: 20px;
-            }
-            QLabel {
-                font-size: 16pt;
-                color: #1E90FF;
-                font-weight: 500;
-                margin-bottom: 5px;
-            }
-            QLineEdit, QTextEdit, QComboBox {
-                border: 2px solid #4169E1;
-                border-radius: 5px;
-                padding: 15px;
-                background-color: #ffffff;
-                font-size: 16pt;
-                color: #333333;
-                margin: 5px 0;
-            }
-            QLineEdit:focus, QTextEdit:focus, QComboBox:focus {
-                border: 2px solid #FFD700;
-                background-color: #FFFEF7;
-            }
-            QPushButton {
-                border-radius: 5px;
-                padding: 15px 25px;
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                margin: 10px 0;
-            }
-            QPushButton:hover {
-                opacity: 0.9;
-            }
-        ''')
+        # Apply the theme-based stylesheet (gold and blue) once for the whole form;
+        # children are matched by object name instead of carrying their own stylesheets
+        self.setStyleSheet(ConsultEaseTheme.get_consultation_form_stylesheet())
 
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -89,43 +138,17 @@ class ConsultationRequestForm(QFrame):
 
         # Form title
         title_label = QLabel("Request Consultation")
-        title_label.setStyleSheet("font-size: 20pt; font-weight: bold; color: #DAA520;")
+        title_label.setObjectName("form_title")
         main_layout.addWidget(title_label)
 
         # Faculty selection
         faculty_layout = QHBoxLayout()
         faculty_label = QLabel("Faculty:")
+        faculty_label.setObjectName("form_field_label")
         faculty_label.setFixedWidth(120)
-        faculty_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #1E90FF;")
         self.faculty_combo = QComboBox()
+        self.faculty_combo.setObjectName("faculty_combo")
         self.faculty_combo.setMinimumWidth(300)
-        self.faculty_combo.setStyleSheet("""
-            QComboBox {
-                border: 2px solid #4169E1;
-                border-radius: 5px;
-                padding: 10px;
-                background-color: #ffffff;
-                font-size: 12pt;
-                color: #333333;
-            }
-            QComboBox:focus {
-                border: 2px solid #FFD700;
-                background-color: #FFFEF7;
-            }
-            QComboBox::drop-down {
-                subcontrol-origin: padding;
-                subcontrol-position: top right;
-                width: 30px;
-                border-left: 1px solid #4169E1;
-            }
-            QComboBox QAbstractItemView {
-                border: 2px solid #4169E1;
-                selection-background-color: #FFD700;
-                selection-color: #333333;
-                background-color: #ffffff;
-                font-size: 12pt;
-            }
-        """)
         faculty_layout.addWidget(faculty_label)
         faculty_layout.addWidget(self.faculty_combo)
         main_layout.addLayout(faculty_layout)
@@ -133,24 +156,11 @@ class ConsultationRequestForm(QFrame):
         # Course code input
         course_layout = QHBoxLayout()
         course_label = QLabel("Course Code:")
+        course_label.setObjectName("form_field_label")
         course_label.setFixedWidth(120)
-        course_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #1E90FF;")
         self.course_input = QLineEdit()
+        self.course_input.setObjectName("course_input")
         self.course_input.setPlaceholderText("e.g., CS101 (optional)")
-        self.course_input.setStyleSheet("""
-            QLineEdit {
-                border: 2px solid #4169E1;
-                border-radius: 5px;
-                padding: 10px;
-                background-color: #ffffff;
-                font-size: 12pt;
-                color: #333333;
-            }
-            QLineEdit:focus {
-                border: 2px solid #FFD700;
-                background-color: #FFFEF7;
-            }
-        """)
         course_layout.addWidget(course_label)
         course_layout.addWidget(self.course_input)
         main_layout.addLayout(course_layout)
@@ -158,23 +168,10 @@ class ConsultationRequestForm(QFrame):
         # Message input
         message_layout = QVBoxLayout()
         message_label = QLabel("Consultation Details:")
-        message_label.setStyleSheet("font-size: 14pt; font-weight: bold; color: #1E90FF;")
+        message_label.setObjectName("form_field_label")
         self.message_input = QTextEdit()
+        self.message_input.setObjectName("message_input")
         self.message_input.setPlaceholderText("Describe what you'd like to discuss...")
-        self.message_input.setStyleSheet("""
-            QTextEdit {
-                border: 2px solid #4169E1;
-                border-radius: 5px;
-                padding: 10px;
-                background-color: #ffffff;
-                font-size: 12pt;
-                color: #333333;
-            }
-            QTextEdit:focus {
-                border: 2px solid #FFD700;
-                background-color: #FFFEF7;
-            }
-        """)
         self.message_input.setMinimumHeight(150)
         message_layout.addWidget(message_label)
         message_layout.addWidget(self.message_input)
@@ -191,12 +188,13 @@ class ConsultationRequestForm(QFrame):
         count_indicator_layout.setContentsMargins(0, 0, 0, 0)
 
         self.char_count_label = QLabel("0/500 characters")
+        self.char_count_label.setObjectName("char_count_label")
         self.char_count_label.setAlignment(Qt.AlignLeft)
-        self.char_count_label.setStyleSheet("color: #1E90FF; font-size: 11pt; font-weight: bold;")
+        self.char_count_label.setProperty("state", "ok")
 
         # Add a small info label about the limit
         char_limit_info = QLabel("(500 character limit)")
-        char_limit_info.setStyleSheet("color: #DAA520; font-size: 10pt; font-weight: bold;")
+        char_limit_info.setObjectName("char_limit_info")
         char_limit_info.setAlignment(Qt.AlignRight)
 
         count_indicator_layout.addWidget(self.char_count_label)
@@ -207,47 +205,32 @@ class ConsultationRequestForm(QFrame):
 
         # Add progress bar for visual feedback
         self.char_count_progress = QProgressBar()
+        self.char_count_progress.setObjectName("char_count_progress")
         self.char_count_progress.setRange(0, 500)
         self.char_count_progress.setValue(0)
         self.char_count_progress.setTextVisible(False)
         self.char_count_progress.setFixedHeight(10)
-        self.char_count_progress.setStyleSheet("""
-            QProgressBar {
-                background-color: #f0f0f0;
-                border: 1px solid #DAA520;
-                border-radius: 5px;
-            }
-            QProgressBar::chunk {
-                background-color: #4169E1;
-                border-radius: 5px;
-            }
-        """)
+        self.char_count_progress.setProperty("state", "ok")
 
         char_count_layout.addWidget(self.char_count_progress)
         main_layout.addWidget(char_count_frame)
 
-        # Connect text changed signal to update character count
-        self.message_input.textChanged.connect(self.update_char_count)
+        # Update the character count once typing pauses rather than on every keystroke
+        self._char_count_timer = QTimer(self)
+        self._char_count_timer.setSingleShot(True)
+        self._char_count_timer.setInterval(50)
+        self._char_count_timer.timeout.connect(self.update_char_count)
+        self.message_input.textChanged.connect(self._char_count_timer.start)
 
         # Buttons
         button_layout = QHBoxLayout()
 
         cancel_button = QPushButton("Cancel")
-        cancel_button.setStyleSheet('''
-            QPushButton {
-                background-color: #DAA520;
-                min-width: 120px;
-            }
-        ''')
+        cancel_button.setObjectName("cancel_request_button")
         cancel_button.clicked.connect(self.cancel_request)
 
         submit_button = QPushButton("Submit Request")
-        submit_button.setStyleSheet('''
-            QPushButton {
-                background-color: #4169E1;
-                min-width: 120px;
-            }
-        ''')
+        submit_button.setObjectName("submit_request_button")
         submit_button.clicked.connect(self.submit_request)
 
         button_layout.addWidget(cancel_button)
@@ -256,37 +239,42 @@ class ConsultationRequestForm(QFrame):
 
         main_layout.addLayout(button_layout)
 
+    @pyqtSlot()
     def update_char_count(self):
         """
         Update the character count label and progress bar.
         """
-        count = len(self.message_input.toPlainText())
-        color = "#1E90FF"  # Default blue
-        progress_color = "#4169E1"  # Default blue
-
+        # characterCount() includes the final paragraph separator; unlike
+        # toPlainText() it doesn't copy the whole text
+        count = self.message_input.document().characterCount() - 1
+        state = "ok"
         if count > 400:
-            color = "#DAA520"  # Warning gold
-            progress_color = "#DAA520"
+            state = "warn"  # Warning gold
         if count > 500:
-            color = "#FF6347"  # Error red-orange
-            progress_color = "#FF6347"
+            state = "over"  # Error red-orange
 
         self.char_count_label.setText(f"{count}/500 characters")
-        self.char_count_label.setStyleSheet(f"color: {color}; font-size: 11pt; font-weight: bold;")
-
-        # Update progress bar
         self.char_count_progress.setValue(count)
-        self.char_count_progress.setStyleSheet(f"""
-            QProgressBar {{
-                background-color: #f0f0f0;
-                border: 1px solid #DAA520;
-                border-radius: 5px;
-            }}
-            QProgressBar::chunk {{
-                background-color: {progress_color};
-                border-radius: 5px;
-            }}
-        """)
+
+        # Colors come from the state selectors in the form stylesheet
+        self._set_count_state(self.char_count_label, state)
+        self._set_count_state(self.char_count_progress, state)
+
+    @staticmethod
+    def _set_count_state(widget, state):
+        """
+        Set the character count state property and re-polish the widget if it changed.
+
+        Args:
+            widget: Label or progress bar styled by the state selectors
+            state (str): One of "ok", "warn" or "over"
+        """
+        if widget.property("state") == state:
+            return
+        widget.setProperty("state", state)
+        style = widget.style()
+        style.unpolish(widget)
+        style.polish(widget)
 
     def set_faculty(self, faculty):
         """
@@ -296,30 +284,40 @@ class ConsultationRequestForm(QFrame):
         self.faculty = faculty
 
         # Update the combo box
-        if self.faculty and self.faculty_combo.count() > 0:
-            for i in range(self.faculty_combo.count()):
-                faculty_id = self.faculty_combo.itemData(i)
-                if faculty_id == self.faculty.id:
-                    self.faculty_combo.setCurrentIndex(i)
-                    break
+        if self.faculty:
+            index = self._index_by_id.get(self.faculty.id)
+            if index is not None:
+                self.faculty_combo.setCurrentIndex(index)
 
     def set_faculty_options(self, faculty_list):
         """
         Set the available faculty options in the dropdown.
         """
         self.faculty_options = faculty_list
-        self.faculty_combo.clear()
-
-        for faculty in faculty_list:
-            self.faculty_combo.addItem(f"{faculty.name} ({faculty.department})", faculty.id)
+        self._faculty_by_id = {faculty.id: faculty for faculty in faculty_list}
+        self._index_by_id = {faculty.id: row for row, faculty in enumerate(faculty_list)}
+
+        # Build the rows off-line and swap the model in once, instead of one
+        # insert (and view relayout) per addItem call
+        model = QStandardItemModel(len(faculty_list), 1, self.faculty_combo)
+        for row, faculty in enumerate(faculty_list):
+            item = QStandardItem(f"{faculty.name} ({faculty.department})")
+            item.setData(faculty.id, Qt.UserRole)
+            model.setItem(row, 0, item)
+
+        self.faculty_combo.setUpdatesEnabled(False)
+        self.faculty_combo.blockSignals(True)
+        try:
+            self.faculty_combo.setModel(model)
 
-        # If we have a selected faculty, select it in the dropdown
-        if self.faculty:
-            for i in range(self.faculty_combo.count()):
-                faculty_id = self.faculty_combo.itemData(i)
-                if faculty_id == self.faculty.id:
-                    self.faculty_combo.setCurrentIndex(i)
-                    break
+            # If we have a selected faculty, select it in the dropdown
+            if self.faculty:
+                index = self._index_by_id.get(self.faculty.id)
+                if index is not None:
+                    self.faculty_combo.setCurrentIndex(index)
+        finally:
+            self.faculty_combo.blockSignals(False)
+            self.faculty_combo.setUpdatesEnabled(True)
 
     def get_selected_faculty(self):
         """
@@ -328,13 +326,7 @@ class ConsultationRequestForm(QFrame):
         if self.faculty_combo.count() == 0:
             return self.faculty
 
-        faculty_id = self.faculty_combo.currentData()
-
-        for faculty in self.faculty_options:
-            if faculty.id == faculty_id:
-                return faculty
-
-        return None
+        return self._faculty_by_id.get(self.faculty_combo.currentData())
 
     def submit_request(self):
         """
@@ -348,28 +340,31 @@ class ConsultationRequestForm(QFrame):
             return
 
         # Check if faculty is available
-        if hasattr(faculty, 'status') and not faculty.status:
+        if not getattr(faculty, 'status', True):
             self.show_validation_error("Faculty Availability",
                 f"Faculty {faculty.name} is currently unavailable. Please select an available faculty member.")
             self.faculty_combo.setFocus()
             return
 
-        # Validate message content
-        message = self.message_input.toPlainText().strip()
-        if not message:
+        # Validate message content (skip copying the text out when the field is empty)
+        message = ""
+        if self.message_input.document().characterCount() > 1:
+            message = self.message_input.toPlainText().strip()
+        length = len(message)
+        if not length:
             self.show_validation_error("Consultation Details", "Please enter consultation details.")
             self.message_input.setFocus()
             return
 
         # Check message length
-        if len(message) > 500:
+        if length > 500:
             self.show_validation_error("Message Length",
                 "Consultation details are too long. Please limit to 500 characters.")
             self.message_input.setFocus()
             return
 
         # Check message minimum length for meaningful content
-        if len(message) < 10:
+        if length < 10:
             self.show_validation_error("Message Content",
                 "Please provide more details about your consultation request (minimum 10 characters).")
             self.message_input.setFocus()
@@ -404,35 +399,17 @@ class ConsultationRequestForm(QFrame):
                 NotificationManager.WARNING
             )
         except ImportError:
-            # Fallback to basic implementation
-            error_dialog = QMessageBox(self)
-            error_dialog.setWindowTitle("Validation Error")
-            error_dialog.setIcon(QMessageBox.Warning)
-            error_dialog.setText(f"<b>{title}</b>")
-            error_dialog.setInformativeText(message)
-            error_dialog.setStandardButtons(QMessageBox.Ok)
-            error_dialog.setDefaultButton(QMessageBox.Ok)
-            error_dialog.setStyleSheet("""
-                QMessageBox {
-                    background-color: #f8f9fa;
-                }
-                QLabel {
-                    color: #212529;
-                    font-size: 12pt;
-                }
-                QPushButton {
-                    background-color: #0d3b66;
-                    color: white;
-                    border-radius: 4px;
-                    padding: 6px 12px;
-                    font-weight: bold;
-                    min-width: 80px;
-                }
-                QPushButton:hover {
-                    background-color: #0a2f52;
-                }
-            """)
-            error_dialog.exec_()
+            # Fallback to basic implementation, reusing one styled message box
+            if self._err_box is None:
+                self._err_box = QMessageBox(self)
+                self._err_box.setWindowTitle("Validation Error")
+                self._err_box.setIcon(QMessageBox.Warning)
+                self._err_box.setStandardButtons(QMessageBox.Ok)
+                self._err_box.setDefaultButton(QMessageBox.Ok)
+                self._err_box.setStyleSheet(_ERR_QSS)
+            self._err_box.setText(f"<b>{title}</b>")
+            self._err_box.setInformativeText(message)
+            self._err_box.exec_()
 
     def is_valid_course_code(self, course_code):
         """
@@ -444,12 +421,7 @@ class ConsultationRequestForm(QFrame):
         Returns:
             bool: True if valid, False otherwise
         """
-        # Basic validation: 2-4 letters followed by 3-4 numbers, optionally followed by a letter
-        import re
-        pattern = r'^[A-Za-z]{2,4}\d{3,4}[A-Za-z]?$'
-
-        # Allow common formats like CS101, MATH202, ENG101A
-        return bool(re.match(pattern, course_code))
+        return _COURSE_CODE_RE.match(course_code) is not None
 
     def cancel_request(self):
         """
@@ -459,18 +431,144 @@ class ConsultationRequestForm(QFrame):
         self.course_input.clear()
         self.setVisible(False)
 
+# Data role on the Actions column holding the consultation status
+_ACTION_STATUS_ROLE = Qt.UserRole + 1
+
+# Consultation statuses that can still be cancelled from the history table
+_CANCELLABLE_STATUSES = (ConsultationStatus.PENDING, ConsultationStatus.ACCEPTED)
+
+
+class _CancelActionDelegate(QStyledItemDelegate):
+    """
+    Paints the "Cancel" button in the history table's Actions column.
+
+    The button is drawn directly instead of creating a widget, layout and
+    stylesheet per row; clicks are detected in editorEvent.
+    """
+    cancel_requested = pyqtSignal(int)
+
+    BUTTON_TEXT = "Cancel"
+    MARGIN = 5
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._font = QFont()
+        self._font.setPointSize(11)
+        self._font.setBold(True)
+        self._brush = QBrush(QColor("#dc3545"))
+        self._text_color = QColor("white")
+        self._button_width = QFontMetrics(self._font).horizontalAdvance(self.BUTTON_TEXT) + 4 * self.MARGIN
+
+        # Lay the label out once; paint() then only blits the cached glyph run
+        self._button_text = QStaticText(self.BUTTON_TEXT)
+        self._button_text.setTextFormat(Qt.PlainText)
+        self._button_text.prepare(QTransform(), self._font)
+        text_size = self._button_text.size()
+        self._text_offset = QPointF(text_size.width() / 2, text_size.height() / 2)
+
+    def _button_rect(self, cell_rect):
+        """Get the button rectangle, left-aligned within the cell."""
+        return QRect(cell_rect.left() + self.MARGIN, cell_rect.top() + self.MARGIN,
+                     self._button_width, cell_rect.height() - 2 * self.MARGIN)
+
+    def paint(self, painter, option, index):
+        super().paint(painter, option, index)
+        if index.data(_ACTION_STATUS_ROLE) not in _CANCELLABLE_STATUSES:
+            return
+
+        rect = self._button_rect(option.rect)
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self._brush)
+        painter.drawRoundedRect(rect, 5, 5)
+        painter.setFont(self._font)
+        painter.setPen(self._text_color)
+        painter.drawStaticText(QRectF(rect).center() - self._text_offset, self._button_text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and index.data(_ACTION_STATUS_ROLE) in _CANCELLABLE_STATUSES
+                and self._button_rect(option.rect).contains(event.pos())):
+            self.cancel_requested.emit(index.row())
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class ConsultationFetcher(QObject):
+    """
+    Worker that loads a student's consultations off the GUI thread.
+    """
+    finished = pyqtSignal(object, list)
+    error = pyqtSignal(str)
+
+    def __init__(self, consultation_controller, student_id):
+        super().__init__()
+        self.consultation_controller = consultation_controller
+        self.student_id = student_id
+
+    @pyqtSlot()
+    def run(self):
+        try:
+            consultations = self.consultation_controller.get_consultations(student_id=self.student_id)
+            self.finished.emit(self.student_id, consultations if consultations else [])
+        except Exception as e:
+            logger.error(f"ConsultationFetcher: Error fetching consultations: {str(e)}")
+            self.error.emit(str(e))
+
+
 class ConsultationHistoryPanel(QFrame):
     """
     Panel to display consultation history.
     """
     consultation_selected = pyqtSignal(object)
     consultation_cancelled = pyqtSignal(int)
+    # Carries (topic, data) from the MQTT thread to the GUI thread
+    _mqtt_message_received = pyqtSignal(str, object)
+
+    # Placeholder texts shown in the table instead of consultation rows
+    _LOADING_ITEM_TEXT = "Loading consultations..."
+    _ERROR_ITEM_TEXT = "Error loading consultations"
 
     def __init__(self, student=None, parent=None):
         super().__init__(parent)
         self.student = student
+        self._student_id = self._student_id_of(student)
         self.consultations = []
+        # Lookups over self.consultations used when matching MQTT updates
+        self._consult_by_id = {}
+        self._pending_by_faculty = {}
         self.mqtt_client = None
+        self._status_font = None
+        self._consultation_controller = None
+        self._fetch_thread = None
+        self._fetcher = None
+        self._refresh_pending = False
+        self._loaded_student_id = None
+        # Track last refresh so automatic refreshes hit the database at most once per interval
+        self._last_refresh_time = None
+        self._min_refresh_interval = 30  # Minimum 30 seconds between automatic refreshes
+        # Consultation ids and displayed values of the current table rows (None when
+        # the table shows a placeholder instead)
+        self._row_ids = None
+        self._row_snapshots = []
+        # MQTT message handlers keyed by the (first, last) segments of the subscribed
+        # topics; anything not listed is treated as a consultation update
+        self._topic_dispatch = {
+            ('consultease', 'responses'): self._handle_consultation_update,
+            ('faculty', 'responses'): self._handle_consultation_update,
+            ('consultation', 'status'): self._handle_consultation_update,
+            ('professor', 'messages'): self._handle_consultation_update,
+            ('faculty', 'status'): self._handle_status_update,
+        }
+        # A single re-armable timer so a burst of MQTT updates triggers one refresh
+        self._refresh_debounce = QTimer(self)
+        self._refresh_debounce.setSingleShot(True)
+        self._refresh_debounce.setTimerType(Qt.CoarseTimer)
+        self._refresh_debounce.timeout.connect(self.refresh_consultations)
+        self._mqtt_message_received.connect(self._process_mqtt_message, Qt.QueuedConnection)
         self.init_ui()
         self.setup_mqtt_monitoring()
 
@@ -478,9 +576,6 @@ class ConsultationHistoryPanel(QFrame):
         """
         Initialize the consultation history panel UI.
         """
-        # Import theme system
-        from ..utils.theme import ConsultEaseTheme
-
         self.setFrameShape(QFrame.StyledPanel)
         self.setObjectName("consultation_history_panel")
 
@@ -580,6 +675,11 @@ class ConsultationHistoryPanel(QFrame):
         self.consultation_table.setSelectionMode(QTableWidget.SingleSelection)
         self.consultation_table.setAlternatingRowColors(True)
 
+        # Cancel buttons are painted by a delegate rather than a widget per row
+        self._cancel_delegate = _CancelActionDelegate(self.consultation_table)
+        self._cancel_delegate.cancel_requested.connect(self._on_cancel_requested)
+        self.consultation_table.setItemDelegateForColumn(4, self._cancel_delegate)
+
         main_layout.addWidget(self.consultation_table)
 
         # Refresh button
@@ -590,7 +690,7 @@ class ConsultationHistoryPanel(QFrame):
                 min-width: 120px;
             }
         ''')
-        refresh_button.clicked.connect(self.refresh_consultations)
+        refresh_button.clicked.connect(lambda: self.refresh_consultations(force=True))
 
         button_layout = QHBoxLayout()
         button_layout.addStretch()
@@ -603,163 +703,324 @@ class ConsultationHistoryPanel(QFrame):
         Set the student for the consultation history.
         """
         self.student = student
-        self.refresh_consultations()
+        self._student_id = self._student_id_of(student)
+        self.refresh_consultations(force=True)
+
+    @staticmethod
+    def _student_id_of(student):
+        """Get the id of a student, whether stored as a dict or a model."""
+        if not student:
+            return None
+        return student.get('id') if isinstance(student, dict) else student.id
+
+    def _get_student_id(self):
+        """Get the id of the current student."""
+        return self._student_id
+
+    def _set_consultations(self, consultations):
+        """
+        Replace the consultation list and rebuild the lookups used to match MQTT updates.
+
+        Args:
+            consultations (list): Consultations of the current student
+        """
+        self.consultations = consultations
+        self._index_consultations()
+
+    def _index_consultations(self):
+        """Rebuild the consultation lookups by id and pending consultations by faculty."""
+        self._consult_by_id = {str(c.id): c for c in self.consultations}
+        self._pending_by_faculty = {}
+        for consultation in self.consultations:
+            if consultation.status == ConsultationStatus.PENDING:
+                self._pending_by_faculty.setdefault(
+                    getattr(consultation, 'faculty_id', None), []).append(consultation)
 
-    def refresh_consultations(self):
+    def schedule_refresh(self, delay_ms):
+        """
+        Refresh the consultation list after a delay, coalescing repeated requests.
+
+        A pending refresh is pushed back rather than brought forward, so an update
+        that waits for the database to catch up is never cut short by a later one.
+
+        Args:
+            delay_ms (int): Delay before refreshing, in milliseconds
+        """
+        if self._refresh_debounce.isActive():
+            delay_ms = max(delay_ms, self._refresh_debounce.remainingTime())
+        self._refresh_debounce.start(delay_ms)
+
+    def refresh_consultations(self, force=False):
         """
         Refresh the consultation list from the database.
+
+        The query runs on a background thread and the table is updated when it
+        returns. A refresh requested while one is in flight is run once the
+        current one finishes. Unless forced, a refresh requested within the
+        minimum refresh interval of the previous one is postponed to the end
+        of the interval.
+
+        Args:
+            force (bool): Refresh immediately, e.g. for user-initiated refreshes
         """
         if not self.student:
             logger.warning("Cannot refresh consultations - no student set")
             return
 
-        # Add debug logging
-        student_id = self.student.get('id') if isinstance(self.student, dict) else getattr(self.student, 'id', None)
-        logger.info(f"🔄 REFRESHING CONSULTATIONS for student {student_id}")
+        now = time.monotonic()
+        if not force and self._last_refresh_time is not None:
+            elapsed = now - self._last_refresh_time
+            if elapsed < self._min_refresh_interval:
+                logger.debug("Consultation refresh throttled for %.1fs",
+                             self._min_refresh_interval - elapsed)
+                self.schedule_refresh(int((self._min_refresh_interval - elapsed) * 1000))
+                return
 
-        # Clear existing consultations
-        self.consultations.clear()
+        if self._fetch_thread is not None:
+            self._refresh_pending = True
+            return
+
+        self._refresh_debounce.stop()
+        self._last_refresh_time = now
+
+        # Add debug logging
+        student_id = self._get_student_id()
+        logger.debug("Refreshing consultations for student %s", student_id)
+
+        # Show loading state when switching students; otherwise keep the current rows
+        # on screen until the new ones arrive
+        if student_id != self._loaded_student_id:
+            self._set_consultations([])
+            self._row_ids = None
+            # Drop the previous rows first; setRowCount(1) alone would keep row 0's cells
+            self.consultation_table.setRowCount(0)
+            self.consultation_table.setRowCount(1)
+            self.consultation_table.setItem(0, 0, QTableWidgetItem(self._LOADING_ITEM_TEXT))
 
-        # Show loading state
-        self.consultation_table.setRowCount(0)
-        self.consultation_table.setItem(0, 0, QTableWidgetItem("Loading consultations..."))
-        
         try:
-            # Import consultation controller
-            from ..controllers.consultation_controller import ConsultationController
-            consultation_controller = ConsultationController()
+            if self._consultation_controller is None:
+                # Import consultation controller
+                from ..controllers.consultation_controller import ConsultationController
+                self._consultation_controller = ConsultationController()
+
+            self._fetch_thread = QThread(self)
+            self._fetcher = ConsultationFetcher(self._consultation_controller, student_id)
+            self._fetcher.moveToThread(self._fetch_thread)
+
+            self._fetcher.finished.connect(self._handle_consultations_loaded)
+            self._fetcher.error.connect(self._handle_consultations_load_error)
+            self._fetch_thread.started.connect(self._fetcher.run)
+
+            # Clean up thread and worker when the fetch is done
+            self._fetcher.finished.connect(self._fetch_thread.quit)
+            self._fetcher.error.connect(self._fetch_thread.quit)
+            self._fetch_thread.finished.connect(self._fetcher.deleteLater)
+            self._fetch_thread.finished.connect(self._fetch_thread.deleteLater)
+            self._fetch_thread.finished.connect(self._handle_fetch_finished)
+
+            self._fetch_thread.start()
+        except Exception as e:
+            logger.error("Error starting consultation refresh: %s", e)
+            self._fetch_thread = None
+            self._fetcher = None
+            self._handle_consultations_load_error(str(e))
+
+    @pyqtSlot(object, list)
+    def _handle_consultations_loaded(self, student_id, consultations):
+        """Update the table with consultations fetched by the background worker."""
+        if student_id != self._get_student_id():
+            logger.debug("Discarding consultations loaded for previous student %s", student_id)
+            return
 
-            # Get consultations for the current student using the correct method
-            consultations = consultation_controller.get_consultations(student_id=student_id)
-            logger.info(f"📊 CONSULTATION REFRESH - Found {len(consultations)} consultations for student {student_id}")
-            
-            # Log details of each consultation
+        logger.debug("Loaded %d consultations for student %s", len(consultations), student_id)
+
+        # Log details of each consultation
+        if logger.isEnabledFor(logging.DEBUG):
             for i, consultation in enumerate(consultations):
-                logger.debug(f"   Consultation {i+1}: ID={consultation.id}, Status={consultation.status.value}, Faculty={consultation.faculty_id}, Created={consultation.created_at}")
-            
-            # Update consultations and table
-            logger.info(f"✅ CONSULTATION LOAD SUCCESS - Processing {len(consultations)} consultations")
-            self.consultations = consultations
-            self.update_consultation_table()
-            logger.info(f"✅ CONSULTATION TABLE UPDATED with {len(consultations)} rows")
-            
-        except Exception as e:
-            logger.error(f"❌ CONSULTATION REFRESH ERROR: {e}")
-            import traceback
-            logger.error(f"❌ Traceback: {traceback.format_exc()}")
-            
-            # Show error state in table
-            self.consultation_table.setRowCount(1)
-            self.consultation_table.setItem(0, 0, QTableWidgetItem("Error loading consultations"))
+                logger.debug("   Consultation %d: ID=%s, Status=%s, Faculty=%s, Created=%s",
+                             i + 1, consultation.id, consultation.status.value,
+                             consultation.faculty_id, consultation.created_at)
+
+        # Update consultations and table
+        self._set_consultations(consultations)
+        self._loaded_student_id = student_id
+        self.update_consultation_table()
+        logger.debug("Consultation table updated with %d rows", len(consultations))
+
+    @pyqtSlot(str)
+    def _handle_consultations_load_error(self, error_message):
+        """Show the error state when the background fetch fails."""
+        logger.error("Error loading consultations: %s", error_message)
+
+        # Show error state in table
+        self._set_consultations([])
+        self._loaded_student_id = None
+        self._row_ids = None
+        # Drop the previous rows first; setRowCount(1) alone would keep row 0's cells
+        self.consultation_table.setRowCount(0)
+        self.consultation_table.setRowCount(1)
+        self.consultation_table.setItem(0, 0, QTableWidgetItem(self._ERROR_ITEM_TEXT))
+
+    @pyqtSlot()
+    def _handle_fetch_finished(self):
+        """Forget the finished fetch thread and run any refresh requested meanwhile."""
+        self._fetch_thread = None
+        self._fetcher = None
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_consultations(force=True)
 
     def update_consultation_table(self):
         """
         Update the consultation table with the current consultations.
+
+        When the same consultations are listed in the same order (e.g. after a
+        status update), only rows whose contents changed are rewritten;
+        otherwise the table is rebuilt.
         """
-        # Clear the table
-        self.consultation_table.setRowCount(0)
+        # Bold, slightly larger status font, built once and shared by every status cell
+        if self._status_font is None:
+            font = QTableWidgetItem().font()
+            font.setBold(True)
+            font.setPointSize(font.pointSize() + 1)
+            self._status_font = font
 
-        # Add consultations to the table
-        for consultation in self.consultations:
-            row_position = self.consultation_table.rowCount()
-            self.consultation_table.insertRow(row_position)
-
-            # Faculty name
-            faculty_name = consultation.faculty.name if hasattr(consultation, 'faculty') and consultation.faculty else "N/A"
-            faculty_item = QTableWidgetItem(faculty_name)
-            self.consultation_table.setItem(row_position, 0, faculty_item)
-
-            # Course code
-            course_item = QTableWidgetItem(consultation.course_code if consultation.course_code else "N/A")
-            self.consultation_table.setItem(row_position, 1, course_item)
-
-            # Status with enhanced color coding and improved contrast
-            status_item = QTableWidgetItem(consultation.status.value.capitalize())
-
-            # Define status colors with gold and blue theme
-            status_colors = {
-                "pending": {
-                    "bg": QColor(255, 248, 220),  # Light goldenrod background
-                    "fg": QColor(184, 134, 11),   # Dark goldenrod text
-                    "border": "#DAA520"           # Goldenrod border
-                },
-                "accepted": {
-                    "bg": QColor(240, 248, 255),  # Very light blue background
-                    "fg": QColor(34, 139, 34),    # Forest green text
-                    "border": "#228B22"           # Green border for accepted
-                },
-                "busy": {
-                    "bg": QColor(255, 245, 245),  # Very light red background  
-                    "fg": QColor(220, 53, 69),    # Red text
-                    "border": "#dc3545"           # Red border
-                },
-                "completed": {
-                    "bg": QColor(230, 240, 255),  # Light blue background
-                    "fg": QColor(65, 105, 225),   # Royal blue text
-                    "border": "#4169E1"           # Royal blue border
-                },
-                "cancelled": {
-                    "bg": QColor(255, 245, 245),  # Light red background
-                    "fg": QColor(178, 134, 11),   # Dark goldenrod text
-                    "border": "#B8860B"           # Dark goldenrod border
-                }
-            }
+        row_ids = tuple(consultation.id for consultation in self.consultations)
+        snapshots = [self._row_snapshot(consultation) for consultation in self.consultations]
 
-            # Apply the appropriate color scheme
-            status_value = consultation.status.value
-            if status_value in status_colors:
-                colors = status_colors[status_value]
-                status_item.setBackground(colors["bg"])
-                status_item.setForeground(colors["fg"])
-
-                # Apply custom styling with border for better definition
-                status_item.setData(
-                    Qt.UserRole,
-                    f"border: 2px solid {colors['border']}; border-radius: 4px; padding: 4px;"
-                )
+        if row_ids == self._row_ids:
+            for row_position, snapshot in enumerate(snapshots):
+                if snapshot != self._row_snapshots[row_position]:
+                    self._set_table_row(row_position, snapshot)
+            self._row_snapshots = snapshots
+            return
 
-            # Make text bold and slightly larger for better readability
-            font = status_item.font()
-            font.setBold(True)
-            font.setPointSize(font.pointSize() + 1)
-            status_item.setFont(font)
-            self.consultation_table.setItem(row_position, 2, status_item)
-
-            # Date
-            date_str = consultation.requested_at.strftime("%Y-%m-%d %H:%M")
-            date_item = QTableWidgetItem(date_str)
-            self.consultation_table.setItem(row_position, 3, date_item)
-
-            # Actions
-            actions_widget = QWidget()
-            actions_layout = QHBoxLayout(actions_widget)
-            actions_layout.setContentsMargins(5, 0, 5, 0) # Reduced margins
-            actions_layout.setSpacing(5) # Reduced spacing
-
-            # View Details Button (example)
-            # view_button = QPushButton("View")
-            # view_button.setStyleSheet("background-color: #17a2b8; font-size: 11pt; padding: 5px;") # Smaller padding
-            # view_button.clicked.connect(lambda _, c=consultation: self.view_consultation_details(c))
-            # actions_layout.addWidget(view_button)
-
-            # Cancel Button - only if status is PENDING or ACCEPTED
-            if consultation.status in [ConsultationStatus.PENDING, ConsultationStatus.ACCEPTED]:
-                cancel_button = QPushButton("Cancel")
-                cancel_button.setStyleSheet("background-color: #dc3545; font-size: 11pt; padding: 5px;") # Smaller padding
-                # Use a lambda to pass the specific consultation object to the handler
-                cancel_button.clicked.connect(lambda checked, c=consultation: self.cancel_consultation(c))
-                actions_layout.addWidget(cancel_button)
-            else:
-                # Add a placeholder or an empty stretch if no actions applicable for this row, to keep alignment
-                actions_layout.addStretch()
+        # Fill the table as one batch: suspend repaints, sorting and signals while the
+        # rows are written, then repaint once
+        table = self.consultation_table
+        sorting_enabled = table.isSortingEnabled()
+        table.setUpdatesEnabled(False)
+        table.setSortingEnabled(False)
+        table.blockSignals(True)
+        try:
+            # Clear the table and allocate all rows at once
+            table.setRowCount(0)
+            table.setRowCount(len(snapshots))
+
+            # Add consultations to the table
+            for row_position, snapshot in enumerate(snapshots):
+                self._set_table_row(row_position, snapshot)
+
+                # Set row height for better visuals with buttons
+                table.setRowHeight(row_position, 55) # Adjusted row height
+        finally:
+            table.blockSignals(False)
+            table.setSortingEnabled(sorting_enabled)
+            table.setUpdatesEnabled(True)
+            table.viewport().update()
+
+        self._row_ids = row_ids
+        self._row_snapshots = snapshots
+
+    @staticmethod
+    def _row_snapshot(consultation):
+        """
+        Get the values shown in a consultation's table row.
+
+        Returns:
+            tuple: (faculty name, course code, status, requested date)
+        """
+        faculty_name = consultation.faculty.name if hasattr(consultation, 'faculty') and consultation.faculty else "N/A"
+        requested_at = consultation.requested_at
+        return (
+            faculty_name,
+            consultation.course_code if consultation.course_code else "N/A",
+            consultation.status,
+            # Same "YYYY-MM-DD HH:MM" text as strftime for the naive timestamps stored,
+            # without parsing a format string per row
+            requested_at.isoformat(' ', 'minutes') if requested_at else "N/A"
+        )
+
+    def _set_table_row(self, row_position, snapshot):
+        """
+        Write one consultation row into the table.
+
+        Args:
+            row_position (int): Table row to write
+            snapshot (tuple): Row values from _row_snapshot
+        """
+        faculty_name, course_code, status, date_str = snapshot
+        table = self.consultation_table
+
+        # Faculty name
+        table.setItem(row_position, 0, QTableWidgetItem(faculty_name))
+
+        # Course code
+        table.setItem(row_position, 1, QTableWidgetItem(course_code))
+
+        # Status with enhanced color coding and improved contrast
+        status_item = QTableWidgetItem(status.value.capitalize())
+
+        # Apply the appropriate color scheme
+        status_style = _STATUS_STYLE.get(status.value)
+        if status_style is not None:
+            status_item.setBackground(status_style["bg"])
+            status_item.setForeground(status_style["fg"])
+
+            # Apply custom styling with border for better definition
+            status_item.setData(Qt.UserRole, status_style["css"])
 
-            actions_layout.addStretch() # Ensure buttons are to the left
-            self.consultation_table.setCellWidget(row_position, 4, actions_widget)
+        # Make text bold and slightly larger for better readability
+        status_item.setFont(self._status_font)
+        table.setItem(row_position, 2, status_item)
 
-            # Set row height for better visuals with buttons
-            self.consultation_table.setRowHeight(row_position, 55) # Adjusted row height
+        # Date
+        table.setItem(row_position, 3, QTableWidgetItem(date_str))
 
-        self.consultation_table.resizeRowsToContents()
+        # Actions - the Cancel button (PENDING or ACCEPTED only) is painted by
+        # _CancelActionDelegate from the status stored on this item
+        actions_item = QTableWidgetItem()
+        actions_item.setData(_ACTION_STATUS_ROLE, status)
+        table.setItem(row_position, 4, actions_item)
+
+    def _on_cancel_requested(self, row):
+        """
+        Handle a click on a row's Cancel button.
+
+        Args:
+            row (int): Table row of the consultation
+        """
+        if 0 <= row < len(self.consultations):
+            self.cancel_consultation(self.consultations[row])
+
+    def _apply_status_update(self, consultation_id, status):
+        """
+        Apply a consultation status change to its table row without reloading.
+
+        Args:
+            consultation_id (int): ID of the consultation whose status changed
+            status (ConsultationStatus): New status
+
+        Returns:
+            bool: True if the consultation is shown in the table and was updated
+        """
+        if self._row_ids is None:
+            return False
+        try:
+            row_position = self._row_ids.index(consultation_id)
+        except ValueError:
+            return False
+
+        consultation = self.consultations[row_position]
+        if consultation.status != status:
+            consultation.status = status
+            self._index_consultations()
+        snapshot = self._row_snapshot(consultation)
+        if snapshot != self._row_snapshots[row_position]:
+            self._set_table_row(row_position, snapshot)
+            self._row_snapshots[row_position] = snapshot
+        logger.debug("Applied status %s to consultation %s", status.value, consultation_id)
+        return True
 
     def view_consultation_details(self, consultation):
         """
@@ -805,12 +1066,12 @@ class ConsultationHistoryPanel(QFrame):
         """
         Set up MQTT monitoring for faculty responses using the centralized async MQTT service.
         """
+        if get_async_mqtt_service is None:
+            logger.warning("MQTT service not available - consultation updates will not be monitored")
+            return
+
         try:
             # Use the centralized async MQTT service instead of creating a separate client
-            from ..services.async_mqtt_service import get_async_mqtt_service
-            from ..utils.mqtt_utils import subscribe_to_topic
-            
-            # Get the async MQTT service
             mqtt_service = get_async_mqtt_service()
             
             # Subscribe to faculty response topics using the centralized service
@@ -822,16 +1083,22 @@ class ConsultationHistoryPanel(QFrame):
                 "professor/messages",  # Faculty desk unit responses (IMPORTANT!)
             ]
             
+            # Reject malformed topics up front so the rest can be registered together
+            valid_topics = []
             for topic in topics:
-                try:
-                    # Register topic handler directly with the MQTT service
-                    mqtt_service.register_topic_handler(topic, self._handle_mqtt_message_safe)
-                    logger.debug(f"Registered MQTT topic handler: {topic}")
-                except Exception as e:
-                    logger.error(f"Failed to register topic handler {topic}: {e}")
+                if isinstance(topic, str) and topic and '#' not in topic[:-1]:
+                    valid_topics.append(topic)
+                else:
+                    logger.error(f"Failed to register topic handler {topic!r}: invalid topic")
+
+            try:
+                # Register the topic handlers directly with the MQTT service in one batch
+                mqtt_service.register_topic_handlers(valid_topics, self._handle_mqtt_message_safe)
+                logger.debug(f"Registered MQTT topic handlers: {valid_topics}")
+            except Exception as e:
+                logger.error(f"Failed to register topic handlers {valid_topics}: {e}")
                     
             # Also register with the faculty response controller
-            from ..controllers.faculty_response_controller import get_faculty_response_controller
             faculty_controller = get_faculty_response_controller()
             faculty_controller.register_callback(self._handle_faculty_response_callback)
             
@@ -864,29 +1131,32 @@ class ConsultationHistoryPanel(QFrame):
             if not self.student:
                 return
                 
-            student_id = self.student.get('id') if isinstance(self.student, dict) else getattr(self.student, 'id', None)
+            student_id = self._get_student_id()
             
             consultation_id = response_data.get('consultation_id') or response_data.get('message_id')
             response_type = response_data.get('response_type', '')
             faculty_name = response_data.get('faculty_name', 'Unknown Faculty')
             callback_student_id = response_data.get('student_id')
             
-            logger.info(f"🔄 Processing faculty callback - Student: {student_id}, Consultation: {consultation_id}, Response: {response_type}")
+            logger.debug("Processing faculty callback - Student: %s, Consultation: %s, Response: %s",
+                         student_id, consultation_id, response_type)
             
             # Check if this response is for the current student
             if callback_student_id and str(callback_student_id) == str(student_id):
-                logger.info(f"✅ Faculty response matches current student - showing notification and refreshing")
+                logger.debug("Faculty response matches current student - showing notification")
                 
                 # Show immediate notification
                 self.show_faculty_response_notification(response_type, faculty_name)
+
+                # The controller has already stored the new status, so update just that
+                # row; fall back to a full refresh if the row isn't on screen
+                new_status = _RESPONSE_STATUS.get(str(response_type).upper())
+                if not (new_status and consultation_id and
+                        self._apply_status_update(int(consultation_id), new_status)):
+                    self.schedule_refresh(1500)
                 
-                # Refresh consultations after a short delay to ensure database is updated
-                QTimer.singleShot(1500, self.refresh_consultations)
-                
-        except Exception as e:
-            logger.error(f"Error processing faculty callback: {e}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing faculty callback")
 
     def _handle_mqtt_message_safe(self, topic: str, data):
         """
@@ -896,9 +1166,9 @@ class ConsultationHistoryPanel(QFrame):
             topic: MQTT topic
             data: Message data
         """
-        # Schedule the GUI update in the main thread using QTimer.singleShot
+        # Queue the GUI update onto the main thread through a queued signal
         # This prevents Qt threading violations
-        QTimer.singleShot(0, lambda: self._process_mqtt_message(topic, data))
+        self._mqtt_message_received.emit(topic, data)
 
     def _process_mqtt_message(self, topic: str, data):
         """
@@ -909,50 +1179,30 @@ class ConsultationHistoryPanel(QFrame):
             data: Message data
         """
         try:
-            import json
-            
-            # Enhanced logging for debugging
-            logger.info(f"🔥 CONSULTATION PANEL - Processing MQTT message:")
-            logger.info(f"🔥 Topic: {topic}")
-            logger.info(f"🔥 Data Type: {type(data)}")
-            logger.info(f"🔥 Raw Data: {data}")
-            
             # Parse the message
             if isinstance(data, str):
-                message_str = data
                 try:
-                    response_data = json.loads(message_str)
-                    logger.info(f"🔥 Parsed JSON: {response_data}")
+                    response_data = _json_loads(data)
                 except json.JSONDecodeError:
                     # Handle non-JSON messages
-                    response_data = {'raw_message': message_str, 'topic': topic}
-                    logger.info(f"🔥 Non-JSON message, created wrapper: {response_data}")
+                    response_data = {'raw_message': data, 'topic': topic}
             elif isinstance(data, dict):
                 response_data = data
-                message_str = json.dumps(data) if data else str(data)
-                logger.info(f"🔥 Dict data received: {response_data}")
             else:
                 response_data = {'raw_message': str(data), 'topic': topic}
-                message_str = str(data)
-                logger.info(f"🔥 Unknown data type, created wrapper: {response_data}")
-                
-            logger.info(f"🔥 Final response_data: {response_data}")
-            
-            # Process different types of updates
-            if 'consultation' in topic.lower() or 'responses' in topic.lower() or 'professor/messages' in topic.lower():
-                logger.info(f"🔥 Routing to consultation update handler")
-                self._handle_consultation_update(response_data, topic)
-            elif 'status' in topic.lower():
-                logger.info(f"🔥 Routing to status update handler")
-                self._handle_status_update(response_data, topic)
-            else:
-                logger.info(f"🔥 Unknown topic type, routing to consultation update as fallback")
-                self._handle_consultation_update(response_data, topic)
+
+            # Route by topic segments (MQTT topics are case-sensitive)
+            handler = self._topic_dispatch.get(
+                (topic.split('/', 1)[0], topic.rsplit('/', 1)[-1]),
+                self._handle_consultation_update
+            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Routing MQTT message on %s (%s) to %s: %s",
+                             topic, type(data).__name__, handler.__name__, response_data)
+            handler(response_data, topic)
                 
-        except Exception as e:
-            logger.error(f"🔥 Error processing MQTT message: {e}")
-            import traceback
-            logger.error(f"🔥 Traceback: {traceback.format_exc()}")
+        except Exception:
+            logger.exception("Error processing MQTT message")
 
     def _handle_consultation_update(self, response_data, topic):
         """
@@ -961,7 +1211,7 @@ class ConsultationHistoryPanel(QFrame):
         if not self.student:
             return
             
-        student_id = self.student.get('id') if isinstance(self.student, dict) else getattr(self.student, 'id', None)
+        student_id = self._get_student_id()
         
         # Extract message details from different possible formats
         message_id = response_data.get('message_id', '') or response_data.get('consultation_id', '')
@@ -969,10 +1219,14 @@ class ConsultationHistoryPanel(QFrame):
         faculty_id = response_data.get('faculty_id', '')
         faculty_name = response_data.get('faculty_name', 'Unknown Faculty')
         
-        logger.info(f"Processing consultation update - Topic: {topic}, Response Type: {response_type}, Message ID: {message_id}, Faculty ID: {faculty_id}")
+        logger.debug("Processing consultation update - Topic: %s, Response Type: %s, Message ID: %s, Faculty ID: %s",
+                     topic, response_type, message_id, faculty_id)
         
         # Check if any of our consultations match this response
         consultation_found = False
+        # Responses matched by consultation id are applied to the row by the faculty
+        # response controller callback once stored, so they don't need a refresh
+        handled_by_callback = False
         
         # Handle different topic formats
         if 'consultease/faculty/' in topic and '/responses' in topic:
@@ -981,21 +1235,19 @@ class ConsultationHistoryPanel(QFrame):
                 topic_parts = topic.split('/')
                 topic_faculty_id = int(topic_parts[2])  # consultease/faculty/{ID}/responses
                 
-                # Check if this matches any of our consultations
-                for consultation in self.consultations:
-                    consultation_id_str = str(consultation.id)
-                    consultation_faculty_id = getattr(consultation, 'faculty_id', None)
-                    
-                    # Match by message_id (consultation ID) or by faculty_id for pending consultations
-                    if (message_id == consultation_id_str or 
-                        (topic_faculty_id == consultation_faculty_id and consultation.status.value == 'pending')):
-                        
-                        logger.info(f"✅ Found matching consultation {consultation.id} for faculty response")
-                        consultation_found = True
-                        
-                        # Show immediate notification
-                        self.show_faculty_response_notification(response_type, faculty_name)
-                        break
+                # Match by message_id (consultation ID) or by faculty_id for pending consultations
+                consultation = self._consult_by_id.get(str(message_id))
+                handled_by_callback = consultation is not None
+                if consultation is None:
+                    pending = self._pending_by_faculty.get(topic_faculty_id)
+                    consultation = pending[0] if pending else None
+
+                if consultation is not None:
+                    logger.debug("Found matching consultation %s for faculty response", consultation.id)
+                    consultation_found = True
+
+                    # Show immediate notification
+                    self.show_faculty_response_notification(response_type, faculty_name)
                         
             except (IndexError, ValueError) as e:
                 logger.error(f"Error parsing faculty ID from topic {topic}: {e}")
@@ -1004,7 +1256,7 @@ class ConsultationHistoryPanel(QFrame):
         elif topic == 'professor/messages':
             # For professor/messages, we need to parse the message content
             # This might contain consultation information
-            logger.info("Processing professor/messages topic")
+            logger.debug("Processing professor/messages topic")
             consultation_found = True  # Assume it's relevant for now
             
             # Show a generic notification
@@ -1016,53 +1268,51 @@ class ConsultationHistoryPanel(QFrame):
             consultation_found = True
             self.show_faculty_response_notification(response_type or 'UPDATE', faculty_name)
         
-        if consultation_found:
+        if consultation_found and not handled_by_callback:
             # Schedule refresh after a short delay to allow database update
-            QTimer.singleShot(2000, self.refresh_consultations)  # Increased delay to ensure DB is updated
-            logger.info(f"Scheduled consultation history refresh due to faculty response")
+            self.schedule_refresh(2000)  # Increased delay to ensure DB is updated
+            logger.debug("Scheduled consultation history refresh due to faculty response")
 
     def _handle_status_update(self, response_data, topic):
         """
         Handle general status updates (faculty availability, etc.) in the main thread.
         """
-        logger.debug(f"Processing status update: {response_data}")
+        logger.debug("Processing status update: %s", response_data)
         # Trigger a consultation refresh in case status affects pending consultations
-        QTimer.singleShot(500, self.refresh_consultations)
+        self.schedule_refresh(500)
 
     def show_faculty_response_notification(self, response_type, faculty_name):
         """
         Show notification when faculty responds via desk unit.
         """
-        try:
-            from ..utils.notification import NotificationManager
-            
-            if response_type.upper() in ['ACKNOWLEDGE', 'ACCEPTED']:
-                title = "Consultation Accepted! ✅"
-                message = f"{faculty_name} has accepted your consultation request."
-                notification_type = NotificationManager.SUCCESS
-            elif response_type.upper() in ['BUSY', 'UNAVAILABLE']:
-                title = "Faculty Busy ⏳"
-                message = f"{faculty_name} is currently busy and cannot take your consultation."
-                notification_type = NotificationManager.WARNING
-            else:
-                title = "Consultation Update 📬"
-                message = f"{faculty_name} has responded to your consultation request."
-                notification_type = NotificationManager.INFO
-                
-            NotificationManager.show_message(
-                self,
-                title,
-                message,
-                notification_type
-            )
-            
-        except ImportError:
+        if NotificationManager is None:
             # Fallback to basic message box
             QMessageBox.information(
                 self,
                 "Faculty Response",
                 f"{faculty_name} has responded to your consultation request. Please refresh to see the update."
             )
+            return
+
+        if response_type.upper() in ['ACKNOWLEDGE', 'ACCEPTED']:
+            title = "Consultation Accepted! ✅"
+            message = f"{faculty_name} has accepted your consultation request."
+            notification_type = NotificationManager.SUCCESS
+        elif response_type.upper() in ['BUSY', 'UNAVAILABLE']:
+            title = "Faculty Busy ⏳"
+            message = f"{faculty_name} is currently busy and cannot take your consultation."
+            notification_type = NotificationManager.WARNING
+        else:
+            title = "Consultation Update 📬"
+            message = f"{faculty_name} has responded to your consultation request."
+            notification_type = NotificationManager.INFO
+
+        NotificationManager.show_message(
+            self,
+            title,
+            message,
+            notification_type
+        )
 
     def __del__(self):
         """
@@ -1072,10 +1322,82 @@ class ConsultationHistoryPanel(QFrame):
         # No need to cleanup MQTT connection as it's handled by the centralized service
         pass
 
+# Stylesheet for the consultation details dialog (gold and blue theme)
+_DETAILS_DIALOG_STYLESHEET = '''
+    QDialog#consultation_details_dialog {
+        background-color: #ffffff;
+        padding: 15px;
+    }
+    QLabel {
+        font-size: 16pt;
+        color: #333333;
+        padding: 5px 0;
+    }
+    QLabel[heading="true"] {
+        font-size: 22pt;
+        font-weight: bold;
+        color: #4169E1;
+        margin-bottom: 15px;
+        padding: 10px 0;
+    }
+    QFrame {
+        border: 2px solid #DAA520;
+        border-radius: 10px;
+        background-color: #ffffff;
+        padding: 25px;
+        margin: 10px 0;
+    }
+    QPushButton {
+        border-radius: 8px;
+        padding: 15px 25px;
+        font-size: 16pt;
+        font-weight: bold;
+        color: white;
+        background-color: #4169E1;
+        min-width: 120px;
+        min-height: 45px;
+    }
+    QPushButton:hover {
+        background-color: #1E90FF;
+    }
+    QPushButton:pressed {
+        background-color: #0066CC;
+    }
+'''
+
+
 class ConsultationDetailsDialog(QDialog):
     """
     Dialog to display consultation details.
     """
+
+    # Status label stylesheets with gold and blue theme, keyed by status value
+    _STATUS_STYLESHEETS = {
+        # Dark goldenrod text, cornsilk background, goldenrod border
+        "pending": (
+            "font-weight: bold; font-size: 17pt; color: #B8860B; background-color: #FFF8DC; "
+            "border: 2px solid #DAA520; padding: 10px 15px; border-radius: 8px;"),
+        # Forest green text, very light blue background, green border
+        "accepted": (
+            "font-weight: bold; font-size: 17pt; color: #228B22; background-color: #f0f8ff; "
+            "border: 2px solid #228B22; padding: 10px 15px; border-radius: 8px;"),
+        # Red text, very light red background, red border
+        "busy": (
+            "font-weight: bold; font-size: 17pt; color: #dc3545; background-color: #fff5f5; "
+            "border: 2px solid #dc3545; padding: 10px 15px; border-radius: 8px;"),
+        # Royal blue text, light blue background, royal blue border
+        "completed": (
+            "font-weight: bold; font-size: 17pt; color: #4169E1; background-color: #E6F0FF; "
+            "border: 2px solid #4169E1; padding: 10px 15px; border-radius: 8px;"),
+        # Dark goldenrod text, cornsilk background, dark goldenrod border
+        "cancelled": (
+            "font-weight: bold; font-size: 17pt; color: #B8860B; background-color: #FFF8DC; "
+            "border: 2px solid #B8860B; padding: 10px 15px; border-radius: 8px;"),
+    }
+    _DEFAULT_STATUS_STYLESHEET = (
+        "font-weight: bold; font-size: 17pt; color: #212529; background-color: #e9ecef; "
+        "border: 2px solid #adb5bd; padding: 10px 15px; border-radius: 8px;")
+
     def __init__(self, consultation, parent=None):
         super().__init__(parent)
         self.consultation = consultation
@@ -1085,56 +1407,13 @@ class ConsultationDetailsDialog(QDialog):
         """
         Initialize the dialog UI.
         """
-        # Import theme system
-        from ..utils.theme import ConsultEaseTheme
-
         self.setWindowTitle("Consultation Details")
         self.setMinimumWidth(700)  # Slightly wider for better content display
         self.setMinimumHeight(600)  # Slightly taller for better spacing
         self.setObjectName("consultation_details_dialog")
 
         # Apply theme-based stylesheet with gold and blue theme
-        self.setStyleSheet('''
-            QDialog#consultation_details_dialog {
-                background-color: #ffffff;
-                padding: 15px;
-            }
-            QLabel {
-                font-size: 16pt;
-                color: #333333;
-                padding: 5px 0;
-            }
-            QLabel[heading="true"] {
-                font-size: 22pt;
-                font-weight: bold;
-                color: #4169E1;
-                margin-bottom: 15px;
-                padding: 10px 0;
-            }
-            QFrame {
-                border: 2px solid #DAA520;
-                border-radius: 10px;
-                background-color: #ffffff;
-                padding: 25px;
-                margin: 10px 0;
-            }
-            QPushButton {
-                border-radius: 8px;
-                padding: 15px 25px;
-                font-size: 16pt;
-                font-weight: bold;
-                color: white;
-                background-color: #4169E1;
-                min-width: 120px;
-                min-height: 45px;
-            }
-            QPushButton:hover {
-                background-color: #1E90FF;
-            }
-            QPushButton:pressed {
-                background-color: #0066CC;
-            }
-        ''')
+        self.setStyleSheet(_DETAILS_DIALOG_STYLESHEET)
 
         layout = QVBoxLayout(self)
         layout.setSpacing(20)  # Increased spacing between elements
@@ -1179,55 +1458,9 @@ class ConsultationDetailsDialog(QDialog):
         status_label.setStyleSheet("font-weight: bold; color: #DAA520;")
         status_value = QLabel(self.consultation.status.value.capitalize())
 
-        # Define status colors with gold and blue theme
-        status_styles = {
-            "pending": {
-                "color": "#B8860B",                # Dark goldenrod text
-                "background": "#FFF8DC",           # Cornsilk background
-                "border": "2px solid #DAA520",     # Goldenrod border
-                "padding": "10px 15px",
-                "border-radius": "8px"
-            },
-            "accepted": {
-                "color": "#228B22",                # Forest green text
-                "background": "#f0f8ff",           # Very light blue background
-                "border": "2px solid #228B22",     # Green border
-                "padding": "10px 15px",
-                "border-radius": "8px"
-            },
-            "busy": {
-                "color": "#dc3545",                # Red text
-                "background": "#fff5f5",           # Very light red background
-                "border": "2px solid #dc3545",     # Red border
-                "padding": "10px 15px",
-                "border-radius": "8px"
-            },
-            "completed": {
-                "color": "#4169E1",                # Royal blue text
-                "background": "#E6F0FF",           # Light blue background
-                "border": "2px solid #4169E1",     # Royal blue border
-                "padding": "10px 15px",
-                "border-radius": "8px"
-            },
-            "cancelled": {
-                "color": "#B8860B",                # Dark goldenrod text
-                "background": "#FFF8DC",           # Cornsilk background
-                "border": "2px solid #B8860B",     # Dark goldenrod border
-                "padding": "10px 15px",
-                "border-radius": "8px"
-            }
-        }
-
         # Apply the appropriate style
-        status_value.setStyleSheet(f"""
-            font-weight: bold;
-            font-size: 17pt;
-            color: {status_styles.get(self.consultation.status.value, {}).get("color", "#212529")};
-            background-color: {status_styles.get(self.consultation.status.value, {}).get("background", "#e9ecef")};
-            border: {status_styles.get(self.consultation.status.value, {}).get("border", "2px solid #adb5bd")};
-            padding: {status_styles.get(self.consultation.status.value, {}).get("padding", "10px 15px")};
-            border-radius: {status_styles.get(self.consultation.status.value, {}).get("border-radius", "8px")};
-        """)
+        status_value.setStyleSheet(self._STATUS_STYLESHEETS.get(
+            self.consultation.status.value, self._DEFAULT_STATUS_STYLESHEET))
         details_layout.addRow(status_label, status_value)
 
         # Requested date
@@ -1301,6 +1534,95 @@ class ConsultationDetailsDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+# Primary screen size, cached on first use and dropped when the desktop is resized
+_SCREEN_SIZE = None
+_SCREEN_SIZE_WATCHED = False
+
+
+def _invalidate_screen_size(*args):
+    """Drop the cached screen size so the next panel re-reads it."""
+    global _SCREEN_SIZE
+    _SCREEN_SIZE = None
+
+
+def _get_screen_size():
+    """
+    Get the width and height of the primary screen.
+
+    Returns:
+        tuple: (width, height) in pixels
+    """
+    global _SCREEN_SIZE, _SCREEN_SIZE_WATCHED
+    if _SCREEN_SIZE is None:
+        desktop = QApplication.desktop()
+        if not _SCREEN_SIZE_WATCHED:
+            desktop.resized.connect(_invalidate_screen_size)
+            _SCREEN_SIZE_WATCHED = True
+        geometry = desktop.screenGeometry()
+        _SCREEN_SIZE = (geometry.width(), geometry.height())
+    return _SCREEN_SIZE
+
+
+# Stylesheet for the consultation panel tabs
+_CONSULTATION_PANEL_STYLESHEET = """
+    QTabWidget#consultation_panel {
+        background-color: #f8f9fa;
+        border: none;
+        padding: 0px;
+        margin: 0px;
+    }
+
+    QTabWidget::pane {
+        border: 1px solid #dee2e6;
+        border-radius: 8px;
+        background-color: #f8f9fa;
+        padding: 5px;
+        position: relative;
+        top: 0px;  /* Ensure stable positioning */
+    }
+
+    QTabBar::tab {
+        background-color: #e9ecef;
+        color: #495057;
+        border: 1px solid #dee2e6;
+        border-bottom: none;
+        border-top-left-radius: 8px;
+        border-top-right-radius: 8px;
+        padding: 12px 20px;
+        margin-right: 4px;
+        font-size: 15pt;
+        font-weight: bold;
+        min-width: 200px;
+        min-height: 20px;  /* Ensure consistent tab height */
+        position: relative;  /* Prevent floating */
+    }
+
+    QTabBar::tab:selected {
+        background-color: #228be6;
+        color: white;
+        border: 1px solid #1971c2;
+        border-bottom: none;
+        position: relative;  /* Maintain position when selected */
+    }
+
+    QTabBar::tab:hover:!selected {
+        background-color: #dee2e6;
+        transition: background-color 0.2s ease;  /* Smooth hover transition */
+    }
+
+    QTabWidget::tab-bar {
+        alignment: center;
+        position: fixed;  /* Prevent tab bar from moving */
+    }
+    
+    /* Ensure stable layout during interactions */
+    QTabBar {
+        qproperty-drawBase: false;
+        outline: 0;  /* Remove focus outline that can cause shifting */
+    }
+"""
+
+
 class ConsultationPanel(QTabWidget):
     """
     Main consultation panel with request form and history tabs.
@@ -1314,124 +1636,45 @@ class ConsultationPanel(QTabWidget):
         self.student = student
         self.init_ui()
 
-        # Set up optimized auto-refresh timer for history panel
-        self.refresh_timer = QTimer(self)
-        self.refresh_timer.timeout.connect(self.auto_refresh_history)
-        self.refresh_timer.start(120000)  # Reduced frequency: refresh every 2 minutes instead of 1
-
         # Connect tab change signal
         self.currentChanged.connect(self.on_tab_changed)
 
-        # Set up MQTT monitoring for real-time updates (more important than polling)
-        self.mqtt_check_timer = QTimer(self)
-        self.mqtt_check_timer.timeout.connect(self.check_mqtt_status)
-        self.mqtt_check_timer.start(60000)  # Reduced frequency: check every minute instead of 30 seconds
-        
-        # Track last refresh to avoid unnecessary updates
-        self._last_refresh_time = 0
-        self._min_refresh_interval = 30  # Minimum 30 seconds between refreshes
+        # One coarse housekeeping timer: check MQTT every minute (more important than
+        # polling) and auto-refresh the history panel every second tick (2 minutes)
+        self._housekeeping_tick = 0
+        self._housekeeping_timer = QTimer(self)
+        self._housekeeping_timer.setTimerType(Qt.CoarseTimer)
+        self._housekeeping_timer.timeout.connect(self._on_housekeeping_tick)
+        self._housekeeping_timer.start(60000)
 
     def init_ui(self):
         """
         Initialize the consultation panel UI with improved styling and responsiveness.
         """
-        # Import theme system
-        from ..utils.theme import ConsultEaseTheme
-
         # Set object name for theme-based styling
         self.setObjectName("consultation_panel")
 
-        # Create an enhanced stylesheet for the consultation panel
-        enhanced_stylesheet = """
-            QTabWidget#consultation_panel {
-                background-color: #f8f9fa;
-                border: none;
-                padding: 0px;
-                margin: 0px;
-            }
-
-            QTabWidget::pane {
-                border: 1px solid #dee2e6;
-                border-radius: 8px;
-                background-color: #f8f9fa;
-                padding: 5px;
-                position: relative;
-                top: 0px;  /* Ensure stable positioning */
-            }
-
-            QTabBar::tab {
-                background-color: #e9ecef;
-                color: #495057;
-                border: 1px solid #dee2e6;
-                border-bottom: none;
-                border-top-left-radius: 8px;
-                border-top-right-radius: 8px;
-                padding: 12px 20px;
-                margin-right: 4px;
-                font-size: 15pt;
-                font-weight: bold;
-                min-width: 200px;
-                min-height: 20px;  /* Ensure consistent tab height */
-                position: relative;  /* Prevent floating */
-            }
-
-            QTabBar::tab:selected {
-                background-color: #228be6;
-                color: white;
-                border: 1px solid #1971c2;
-                border-bottom: none;
-                position: relative;  /* Maintain position when selected */
-            }
-
-            QTabBar::tab:hover:!selected {
-                background-color: #dee2e6;
-                transition: background-color 0.2s ease;  /* Smooth hover transition */
-            }
-
-            QTabWidget::tab-bar {
-                alignment: center;
-                position: fixed;  /* Prevent tab bar from moving */
-            }
-            
-            /* Ensure stable layout during interactions */
-            QTabBar {
-                qproperty-drawBase: false;
-                outline: 0;  /* Remove focus outline that can cause shifting */
-            }
-        """
-
         # Apply the enhanced stylesheet
-        self.setStyleSheet(enhanced_stylesheet)
+        self.setStyleSheet(_CONSULTATION_PANEL_STYLESHEET)
 
         # Request form tab with improved icon and text
         self.request_form = ConsultationRequestForm()
         self.request_form.request_submitted.connect(self.handle_consultation_request)
         self.addTab(self.request_form, "Request Consultation")
 
-        # Set tab icon if available
-        try:
-            from PyQt5.QtGui import QIcon
-            self.setTabIcon(0, QIcon("central_system/resources/icons/request.png"))
-        except:
-            # If icon not available, just use text
-            pass
+        # Set tab icon if available (a missing file just leaves the text)
+        self.setTabIcon(0, QIcon("central_system/resources/icons/request.png"))
 
         # History tab with improved icon and text
         self.history_panel = ConsultationHistoryPanel(self.student)
         self.history_panel.consultation_cancelled.connect(self.handle_consultation_cancel_from_history)
         self.addTab(self.history_panel, "Consultation History")
 
-        # Set tab icon if available
-        try:
-            from PyQt5.QtGui import QIcon
-            self.setTabIcon(1, QIcon("central_system/resources/icons/history.png"))
-        except:
-            # If icon not available, just use text
-            pass
+        # Set tab icon if available (a missing file just leaves the text)
+        self.setTabIcon(1, QIcon("central_system/resources/icons/history.png"))
 
         # Calculate responsive minimum size based on screen dimensions
-        screen_width = QApplication.desktop().screenGeometry().width()
-        screen_height = QApplication.desktop().screenGeometry().height()
+        screen_width, screen_height = _get_screen_size()
 
         # Calculate responsive minimum size (smaller on small screens, larger on big screens)
         min_width = min(900, max(500, int(screen_width * 0.5)))
@@ -1548,7 +1791,7 @@ class ConsultationPanel(QTabWidget):
                     progress_callback(80, "Refreshing history...")
 
                 # Refresh history
-                self.history_panel.refresh_consultations()
+                self.history_panel.refresh_consultations(force=True)
 
                 if progress_callback:
                     progress_callback(100, "Complete!")
@@ -1641,7 +1884,7 @@ class ConsultationPanel(QTabWidget):
                     progress_callback(70, "Updating records...")
 
                 # Refresh history
-                self.history_panel.refresh_consultations()
+                self.history_panel.refresh_consultations(force=True)
 
                 if progress_callback:
                     progress_callback(100, "Complete!")
@@ -1767,19 +2010,22 @@ class ConsultationPanel(QTabWidget):
         """
         # Refresh history when switching to history tab
         if index == 1:  # History tab
-            self.history_panel.refresh_consultations()
+            self.history_panel.refresh_consultations(force=True)
+
+    def _on_housekeeping_tick(self):
+        """
+        Run the periodic MQTT status check and, on every other tick, the history auto-refresh.
+        """
+        self._housekeeping_tick += 1
+        self.check_mqtt_status()
+        if self._housekeeping_tick % 2 == 0:
+            self.auto_refresh_history()
 
     def auto_refresh_history(self):
         """
         Automatically refresh the history panel periodically with intelligent timing.
+        The history panel itself skips refreshes that come too soon after the last one.
         """
-        current_time = time.time()
-        
-        # Check if enough time has passed since last refresh
-        if current_time - self._last_refresh_time < self._min_refresh_interval:
-            logger.debug("Skipping auto-refresh - too soon since last refresh")
-            return
-        
         # Only refresh if the history tab is visible and window is active
         if self.currentIndex() == 1:  # History tab
             # Check if parent window is active to avoid refreshing when not in use
@@ -1788,14 +2034,12 @@ class ConsultationPanel(QTabWidget):
                 if parent_window and (parent_window.isActiveWindow() or parent_window.isVisible()):
                     logger.debug("Auto-refreshing consultation history")
                     self.history_panel.refresh_consultations()
-                    self._last_refresh_time = current_time
                 else:
                     logger.debug("Skipping auto-refresh - window not active")
             except Exception as e:
                 logger.debug(f"Error checking window state: {e}")
                 # Fallback to refresh anyway
                 self.history_panel.refresh_consultations()
-                self._last_refresh_time = current_time
         else:
             logger.debug("Skipping auto-refresh - history tab not visible")
 
@@ -1803,7 +2047,7 @@ class ConsultationPanel(QTabWidget):
         """
         Refresh the consultation history.
         """
-        self.history_panel.refresh_consultations()
+        self.history_panel.refresh_consultations(force=True)
 
     def check_mqtt_status(self):
         """
@@ -1935,33 +2179,31 @@ class ConsultationPanel(QTabWidget):
         """
         Show notification when faculty responds via desk unit.
         """
-        try:
-            from ..utils.notification import NotificationManager
-            
-            if response_type.upper() in ['ACKNOWLEDGE', 'ACCEPTED']:
-                title = "Consultation Accepted! ✅"
-                message = f"{faculty_name} has accepted your consultation request."
-                notification_type = NotificationManager.SUCCESS
-            elif response_type.upper() in ['BUSY', 'UNAVAILABLE']:
-                title = "Faculty Busy ⏳"
-                message = f"{faculty_name} is currently busy and cannot take your consultation."
-                notification_type = NotificationManager.WARNING
-            else:
-                title = "Consultation Update 📬"
-                message = f"{faculty_name} has responded to your consultation request."
-                notification_type = NotificationManager.INFO
-                
-            NotificationManager.show_message(
-                self,
-                title,
-                message,
-                notification_type
-            )
-            
-        except ImportError:
+        if NotificationManager is None:
             # Fallback to basic message box
             QMessageBox.information(
                 self,
                 "Faculty Response",
                 f"{faculty_name} has responded to your consultation request. Please refresh to see the update."
             )
+            return
+
+        if response_type.upper() in ['ACKNOWLEDGE', 'ACCEPTED']:
+            title = "Consultation Accepted! ✅"
+            message = f"{faculty_name} has accepted your consultation request."
+            notification_type = NotificationManager.SUCCESS
+        elif response_type.upper() in ['BUSY', 'UNAVAILABLE']:
+            title = "Faculty Busy ⏳"
+            message = f"{faculty_name} is currently busy and cannot take your consultation."
+            notification_type = NotificationManager.WARNING
+        else:
+            title = "Consultation Update 📬"
+            message = f"{faculty_name} has responded to your consultation request."
+            notification_type = NotificationManager.INFO
+
+        NotificationManager.show_message(
+            self,
+            title,
+            message,
+            notification_type
+        )
@@ -1494,9 +1494,7 @@ class DashboardWindow(BaseWindow):
                         self.request_background_faculty_refresh()
                         
         except Exception as e:
-            logger.error(f"🔥🔥🔥 Error handling real-time status update: {e}")
-            import traceback
-            logger.error(f"🔥🔥🔥 Traceback: {traceback.format_exc()}")
+            logger.exception(f"🔥🔥🔥 Error handling real-time status update: {e}")
 
     def _debounced_refresh(self):
         """
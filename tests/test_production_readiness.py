@@ -188,6 +188,273 @@ class TestMQTTPerformance(unittest.TestCase):
         for key in expected_keys:
             self.assertIn(key, stats)
 
+    def test_publish_ack_before_tracking(self):
+        """Test a broker ack that arrives before track_publish does not leave the mid pending."""
+        from central_system.services.async_mqtt_service import AsyncMQTTService
+
+        service = AsyncMQTTService()
+
+        # Ack received on the network thread before the publisher tracks the mid
+        service._on_publish(None, None, 42)
+        service.track_publish(42, "test/early")
+        self.assertNotIn(42, service.pending_publishes)
+
+        # Normal order: tracked first, then confirmed
+        service.track_publish(43, "test/normal")
+        service._on_publish(None, None, 43)
+        self.assertEqual(service.pending_publishes, {})
+
+    def test_consultation_request_batch(self):
+        """Test consultation request messages are built for a single batch."""
+        from central_system.utils.mqtt_utils import build_consultation_request_messages, publish_mqtt_batch
+
+        messages = build_consultation_request_messages({
+            'id': 7,
+            'faculty_id': 3,
+            'student_id': 11,
+            'student_name': 'Test Student',
+            'request_message': 'Hello'
+        })
+
+        topics = [topic for topic, _, _ in messages]
+        self.assertEqual(topics, [
+            'consultease/consultations/7',
+            'consultease/faculty/3/requests',
+            'consultease/faculty/3/messages'
+        ])
+
+        # Missing IDs produce no messages, and an empty batch publishes nothing
+        self.assertEqual(build_consultation_request_messages({'id': 7}), [])
+        self.assertEqual(publish_mqtt_batch([]), [])
+
+
+class TestPublishBuffer(unittest.TestCase):
+    """Test buffered publishing."""
+
+    def test_batches_and_flush_on_stop(self):
+        """Test items are delivered in bounded batches and flushed on stop."""
+        from central_system.services.publish_buffer import PublishBuffer
+
+        batches = []
+        buffer = PublishBuffer(batches.append, max_count=4, flush_idle_ms=50)
+
+        for i in range(10):
+            self.assertTrue(buffer.enqueue(i))
+        buffer.stop()
+
+        self.assertEqual([item for batch in batches for item in batch], list(range(10)))
+        self.assertTrue(all(len(batch) <= 4 for batch in batches))
+        self.assertFalse(buffer.running)
+
+    def test_publish_errors_do_not_stop_worker(self):
+        """Test a failing publish function is counted and the worker keeps running."""
+        from central_system.services.publish_buffer import PublishBuffer
+
+        def failing_publish(batch):
+            raise RuntimeError("broker down")
+
+        buffer = PublishBuffer(failing_publish, max_count=2, flush_idle_ms=10)
+        buffer.enqueue(1)
+        time.sleep(0.2)
+
+        self.assertTrue(buffer.running)
+        self.assertEqual(buffer.get_stats()['publish_errors'], 1)
+        buffer.stop()
+
+
+class TemporaryDatabaseTestCase(unittest.TestCase):
+    """Base class for tests that run the ORM against a throwaway SQLite database."""
+
+    def setUp(self):
+        """Bind the session factory to a fresh SQLite file."""
+        from sqlalchemy import create_engine
+        import central_system.models  # noqa: F401 - registers every model on Base
+        from central_system.models import base
+
+        self._tmpdir = tempfile.TemporaryDirectory()
+        self.engine = create_engine(f"sqlite:///{os.path.join(self._tmpdir.name, 'test.db')}")
+        base.Base.metadata.create_all(self.engine)
+
+        base.SessionLocal.remove()
+        self._previous_bind = base.session_factory.kw['bind']
+        base.SessionLocal.configure(bind=self.engine)
+
+    def tearDown(self):
+        """Restore the original session binding and remove the database."""
+        from central_system.models import base
+
+        base.SessionLocal.remove()
+        base.SessionLocal.configure(bind=self._previous_bind)
+        self.engine.dispose()
+        self._tmpdir.cleanup()
+
+    def add_consultations(self, *statuses):
+        """Create a student, a faculty member and one consultation per status; return their IDs."""
+        from central_system.models import Consultation, Faculty, Student, get_db
+        from central_system.models.base import close_db
+
+        db = get_db()
+        student = Student(name='Test Student', department='Computer Science', rfid_uid='TEST0001')
+        faculty = Faculty(name='Dr. Test Faculty', department='Computer Science',
+                          email='test.faculty@consultease.edu', ble_id='BLE100')
+        db.add_all([student, faculty])
+        db.flush()
+
+        consultations = [
+            Consultation(student_id=student.id, faculty_id=faculty.id,
+                         request_message=f'Consultation request {i}', status=status)
+            for i, status in enumerate(statuses)
+        ]
+        db.add_all(consultations)
+        db.commit()
+        consultation_ids = [consultation.id for consultation in consultations]
+        close_db()
+        return consultation_ids
+
+
+class TestConsultationController(TemporaryDatabaseTestCase):
+    """Test consultation publishing and status updates."""
+
+    def test_publish_buffered_without_legacy_messages(self):
+        """Test each consultation is judged on its own results when no legacy message is sent."""
+        from unittest import mock
+        from central_system.controllers import consultation_controller
+        from central_system.models import ConsultationStatus
+
+        consultation_ids = self.add_consultations(ConsultationStatus.PENDING, ConsultationStatus.PENDING)
+        published = []
+
+        def publish_batch(messages):
+            # Every message of the first consultation fails, every one of the second succeeds
+            published.extend(messages)
+            return [False] * 3 + [True] * 3
+
+        queue_service = mock.Mock()
+        with mock.patch.object(consultation_controller, '_publish_legacy_messages', return_value=False), \
+                mock.patch.object(consultation_controller, 'publish_mqtt_batch', side_effect=publish_batch), \
+                mock.patch.object(consultation_controller, 'get_consultation_queue_service',
+                                  return_value=queue_service):
+            consultation_controller.ConsultationController._publish_buffered(consultation_ids)
+
+        self.assertEqual(len(published), 6)
+        first_id = int(published[0][0].rsplit('/', 1)[1])
+        queued_ids = [call.args[0].id for call in queue_service.queue_consultation_request.call_args_list]
+        self.assertEqual(queued_ids, [first_id])
+
+    def test_cancel_consultation(self):
+        """Test only cancellable consultations are cancelled and the result outlives its session."""
+        from unittest import mock
+        from central_system.controllers import consultation_controller
+        from central_system.models import Consultation, ConsultationStatus, get_db
+        from central_system.models.base import close_db
+        from sqlalchemy import event
+
+        pending_id, completed_id = self.add_consultations(ConsultationStatus.PENDING,
+                                                          ConsultationStatus.COMPLETED)
+
+        with mock.patch.object(consultation_controller, 'get_consultation_queue_service'), \
+                mock.patch.object(consultation_controller, 'get_async_mqtt_service') as mqtt_service, \
+                mock.patch.object(consultation_controller, 'invalidate_consultation_cache_bulk'):
+            controller = consultation_controller.ConsultationController()
+            statements = []
+
+            def record(conn, cursor, statement, *args):
+                statements.append(statement)
+
+            event.listen(self.engine, 'before_cursor_execute', record)
+            try:
+                cancelled = controller.cancel_consultation(pending_id)
+            finally:
+                event.remove(self.engine, 'before_cursor_execute', record)
+            not_cancelled = controller.cancel_consultation(completed_id)
+
+        # RETURNING supplies the row, so the cancelled consultation is never re-selected
+        self.assertFalse([sql for sql in statements if sql.startswith('SELECT') and 'FROM consultations' in sql])
+
+        # with_session has closed the session, so these reads must not need it
+        self.assertIsNotNone(cancelled)
+        self.assertEqual(cancelled.id, pending_id)
+        self.assertEqual(cancelled.status, ConsultationStatus.CANCELLED)
+        self.assertIsNotNone(cancelled.student_id)
+        self.assertIsNotNone(cancelled.faculty_id)
+        mqtt_service.return_value.publish_async.assert_called()
+
+        self.assertIsNone(not_cancelled)
+        db = get_db()
+        try:
+            statuses = dict(db.query(Consultation.id, Consultation.status).all())
+        finally:
+            close_db()
+        self.assertEqual(statuses[pending_id], ConsultationStatus.CANCELLED)
+        self.assertEqual(statuses[completed_id], ConsultationStatus.COMPLETED)
+
+
+class TestFacultyController(TemporaryDatabaseTestCase):
+    """Test faculty management."""
+
+    def test_bulk_upsert_faculty(self):
+        """Test bulk upsert inserts new faculty, updates status only and rejects duplicates."""
+        import datetime
+        from unittest import mock
+        from central_system.controllers import faculty_controller
+        from central_system.models import Faculty, get_db
+
+        with mock.patch.object(faculty_controller, 'get_consultation_queue_service'):
+            controller = faculty_controller.FacultyController()
+
+        with mock.patch.object(controller, '_publish_status_update_with_sequence_safe') as publish:
+            created, updated, errors = controller.bulk_upsert_faculty([
+                {'name': 'Dr. Maria Santos', 'department': 'Computer Science',
+                 'email': 'maria.santos@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:01', 'status': False},
+                {'name': 'Prof. John Rodriguez', 'department': 'Information Technology',
+                 'email': 'john.rodriguez@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:02', 'status': True},
+                # Fails validation and is skipped without affecting the other rows
+                {'name': 'Dr. Invalid Email', 'department': 'Computer Science',
+                 'email': 'not-an-email', 'ble_id': 'AA:BB:CC:DD:EE:03', 'status': True},
+                # Repeat an email and a BLE ID of earlier rows in the same batch
+                {'name': 'Dr. Same Email', 'department': 'Computer Science',
+                 'email': 'john.rodriguez@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:04', 'status': True},
+                {'name': 'Dr. Same BLE', 'department': 'Computer Science',
+                 'email': 'same.ble@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:01', 'status': True},
+            ])
+        self.assertEqual((created, updated), (2, 0))
+        self.assertEqual(len(errors), 3)
+        self.assertIn('Dr. Invalid Email', errors[0])
+        self.assertIn('Dr. Same Email', errors[1])
+        self.assertIn('Dr. Same BLE', errors[2])
+        # Only the faculty created as available reports a status change
+        self.assertEqual([(call.args[0]['name'], call.args[1], call.args[2]) for call in publish.call_args_list],
+                         [('Prof. John Rodriguez', True, False)])
+
+        before_update = datetime.datetime.now()
+        with mock.patch.object(controller, '_publish_status_update_with_sequence_safe') as publish:
+            created, updated, errors = controller.bulk_upsert_faculty([
+                # Existing email: only the status changes, the other fields are kept
+                {'name': 'Dr. Renamed', 'department': 'Mathematics',
+                 'email': 'maria.santos@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:09', 'status': True},
+                # Existing email with an unchanged status
+                {'name': 'Prof. John Rodriguez', 'department': 'Information Technology',
+                 'email': 'john.rodriguez@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:02', 'status': True},
+                # New email with a BLE ID that already belongs to someone else
+                {'name': 'Dr. Sarah Chen', 'department': 'Software Engineering',
+                 'email': 'sarah.chen@consultease.edu', 'ble_id': 'AA:BB:CC:DD:EE:02', 'status': True},
+            ])
+        self.assertEqual((created, updated), (0, 2))
+        self.assertEqual(len(errors), 1)
+        self.assertIn('AA:BB:CC:DD:EE:02', errors[0])
+        self.assertEqual([(call.args[0]['name'], call.args[1], call.args[2]) for call in publish.call_args_list],
+                         [('Dr. Maria Santos', True, False)])
+
+        db = get_db()
+        faculty = {f.email: f for f in db.query(Faculty).all()}
+        self.assertEqual(len(faculty), 2)
+        maria = faculty['maria.santos@consultease.edu']
+        self.assertTrue(maria.status)
+        self.assertGreaterEqual(maria.last_seen, before_update)
+        self.assertEqual((maria.name, maria.department, maria.ble_id),
+                         ('Dr. Maria Santos', 'Computer Science', 'AA:BB:CC:DD:EE:01'))
+        self.assertNotIn('sarah.chen@consultease.edu', faculty)
+
 
 class TestHardwareValidation(unittest.TestCase):
     """Test hardware validation functionality."""
@@ -380,6 +647,9 @@ def run_production_tests():
         TestSecurityFeatures,
         TestDatabaseResilience,
         TestMQTTPerformance,
+        TestPublishBuffer,
+        TestConsultationController,
+        TestFacultyController,
         TestHardwareValidation,
         TestSystemMonitoring,
         TestAuditLogging,